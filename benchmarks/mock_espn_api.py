@@ -0,0 +1,656 @@
+"""
+Offline stand-in for the ESPN core API, built from docs/discovery/sample_responses.
+
+Every URL pattern in `docs/discovery/discovery_state.json` is answered with its sample
+response, for any IDs. IDs and `$ref` URLs in the sample are rewritten to the requested
+ones and to point back at this server, so `espn_source()` can crawl a whole synthetic
+season without touching ESPN:
+
+- every week of a season type has `events_per_week` events, played by two of `teams`
+  synthetic teams;
+- every roster has `athletes_per_roster` athletes;
+- every game has `plays_per_game` plays (and as many win probabilities);
+- season S starts on November 1 of year S-1. Its season types' weeks follow each other
+  in type order, and the i-th event of a week is played on day (i-1) % 7 of that week.
+  So `/events?dates=YYYYMMDD[-YYYYMMDD]` lists the events of those days.
+
+Latency, HTTP 500s and 429s can be injected, either at random or once the server sees
+more than `max_rps` requests per second.
+
+Usage:
+    python -m benchmarks.mock_espn_api --port 8765 --latency-ms 20
+
+    espn_source(league_base_url="http://127.0.0.1:8765/v2/sports/basketball/leagues/mens-college-basketball")
+
+Or in-process, as the benchmarks do:
+
+    with MockEspnApi(MockApiConfig(events_per_week=10)) as api:
+        espn_source(league_base_url=api.league_base_url, ...)
+
+`GET /__mock__/stats` returns the request, byte and status counters.
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_DIR = Path(__file__).resolve().parent.parent / "docs" / "discovery"
+ESPN_HOST = "sports.core.api.espn.com"
+LEAGUE_PATH = "/v2/sports/basketball/leagues/mens-college-basketball"
+STATS_PATH = "/__mock__/stats"
+
+# ESPN's page size when no `limit` is given, and its largest accepted `limit`
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 1000
+
+# Season types in the order their weeks are played; 4 (off season) has no games
+_SEASON_TYPE_ORDER = ("1", "2", "3")
+
+# Numeric fields (besides "id") that identify a document and follow the requested IDs
+_NUMBER_FIELDS = {
+    "/seasons/{season_id}": {"year": "season_id"},
+    "/seasons/{season_id}/types/{type_id}": {"type": "type_id", "year": "season_id"},
+    "/seasons/{season_id}/types/{type_id}/weeks/{week_id}": {"number": "week_id"},
+}
+
+# `/segment/123` inside a URL, as long as the number is a whole path segment
+_ID_SEGMENT_RE = re.compile(r"/([a-z]+)/(\d+)(?=[/?\"])")
+_REF_RE = re.compile(r"\"\$ref\":\s*\"([^\"]+)\"")
+_ID_FIELD_RE = re.compile(r"\"id\":\s*\"(\d+)\"")
+
+
+@dataclass
+class MockApiConfig:
+    """
+    Shape of the synthetic league and the faults to inject.
+
+    Args:
+        events_per_week: Events listed for every week of a season type.
+        weeks_per_season_type: Number of weeks per season type id (1 preseason,
+            2 regular season, 3 postseason, 4 off season).
+        teams: Size of the team pool events draw their two competitors from.
+        athletes_per_roster: Athletes on every team and event roster.
+        plays_per_game: Plays, and win probabilities, per event.
+        latency_ms: Fixed delay added to every response.
+        latency_jitter_ms: Random extra delay, uniform in [0, latency_jitter_ms].
+        error_rate: Fraction of requests answered with HTTP 500.
+        throttle_rate: Fraction of requests answered with HTTP 429.
+        max_rps: Answer with HTTP 429 while more than this many requests arrived in the
+            last second. None disables it.
+        seed: Seed for the fault and jitter randomness.
+    """
+
+    events_per_week: int = 30
+    weeks_per_season_type: dict[str, int] = field(
+        default_factory=lambda: {"1": 1, "2": 18, "3": 3, "4": 0}
+    )
+    teams: int = 64
+    athletes_per_roster: int = 13
+    plays_per_game: int = 450
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    max_rps: float | None = None
+    seed: int = 0
+
+
+def _slugify(text: str) -> str:
+    """Same slug rule as docs/discovery/espn_api_discovery.py uses for sample file names."""
+    text = str(text).lower()
+    text = re.sub(r"[^a-z0-9_/-]+", "-", text)
+    text = re.sub(r"[-_]+", "-", text)
+    text = text.strip("-").replace("/", "_").strip("-_")
+    return text or "endpoint"
+
+
+def _league_path(url: str) -> str:
+    """Path of a URL relative to the league root, without query string."""
+    path = urlsplit(url).path.rstrip("/")
+    return path[len(LEAGUE_PATH) :] if path.startswith(LEAGUE_PATH) else path
+
+
+class _Template:
+    """One sample response and the URL pattern it answers."""
+
+    def __init__(self, pattern: str, text: str, sample_ids: dict[str, str]) -> None:
+        self.pattern = pattern
+        segments = [s for s in pattern.split("/") if s]
+        # (literal segment before the placeholder, placeholder name)
+        self.placeholders: list[tuple[str | None, str]] = []
+        regex_parts = []
+        for i, segment in enumerate(segments):
+            if segment.startswith("{"):
+                name = segment[1:-1]
+                previous = segments[i - 1] if i else None
+                literal = previous if previous and not previous.startswith("{") else None
+                self.placeholders.append((literal, name))
+                regex_parts.append(f"(?P<{_group(name)}>[^/]+)")
+            else:
+                regex_parts.append(re.escape(segment))
+        body = "".join(f"/{part}" for part in regex_parts)
+        self.regex = re.compile(f"^{body}$")
+        self._prefix_regex = re.compile(f"^{body}(?:/|$)")
+        self.text = text
+        self.example_ids = self._find_example_ids(sample_ids)
+
+    def match(self, path: str) -> dict[str, str] | None:
+        m = self.regex.match(path)
+        if m is None:
+            return None
+        return {name: m.group(_group(name)) for _, name in self.placeholders}
+
+    def _find_example_ids(self, sample_ids: dict[str, str]) -> dict[str, str]:
+        # The IDs the sample was fetched with show up in its own $ref, or in the $refs of
+        # its children (list items); the discovery sample IDs are the fallback.
+        for ref in _REF_RE.findall(self.text):
+            m = self._prefix_regex.match(_league_path(ref))
+            if m:
+                return {name: m.group(_group(name)) for _, name in self.placeholders}
+        return {name: sample_ids.get(name, "") for _, name in self.placeholders}
+
+
+def _group(name: str) -> str:
+    # Placeholder names such as "1_id" are not valid regex group names
+    return f"p_{name}"
+
+
+def _paginate(items: list[Any], query: dict[str, str]) -> dict[str, Any]:
+    page_size = min(int(query.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    page = max(int(query.get("page", 1)), 1)
+    page_count = max(1, -(-len(items) // page_size))
+    start = (page - 1) * page_size
+    return {
+        "count": len(items),
+        "pageIndex": page,
+        "pageSize": page_size,
+        "pageCount": page_count,
+        "items": items[start : start + page_size],
+    }
+
+
+class MockEspnApi:
+    """
+    Threaded HTTP server answering ESPN core API requests from the sample responses.
+
+    Args:
+        config: League shape and fault injection settings.
+        host: Interface to bind.
+        port: Port to bind; 0 picks a free one.
+    """
+
+    def __init__(
+        self, config: MockApiConfig | None = None, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self.config = config or MockApiConfig()
+        self._server = _Server((host, port), _Handler)
+        self._server.api = self  # type: ignore[attr-defined]
+        self.base_url = f"http://{host}:{self._server.server_address[1]}"
+        self.league_base_url = f"{self.base_url}{LEAGUE_PATH}"
+        self._thread: threading.Thread | None = None
+
+        self._templates = self._load_templates()
+        self._event_sample = self._find_event_sample()
+        self.team_ids = [str(1001 + i) for i in range(self.config.teams)]
+
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._recent: deque[float] = deque()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.status_counts: Counter[int] = Counter()
+
+    # --- Lifecycle ---
+
+    def start(self) -> "MockEspnApi":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="mock-espn-api", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Mock ESPN API serving {len(self._templates)} patterns at {self.base_url}")
+        return self
+
+    def serve_forever(self) -> None:
+        """Serves on the calling thread until interrupted."""
+        logger.info(f"Mock ESPN API serving {len(self._templates)} patterns at {self.base_url}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockEspnApi":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "bytes_sent": self.bytes_sent,
+                "status_counts": {str(k): v for k, v in sorted(self.status_counts.items())},
+            }
+
+    # --- Templates ---
+
+    def _load_templates(self) -> list[_Template]:
+        state = json.loads((DISCOVERY_DIR / "discovery_state.json").read_text())
+        sample_ids = state.get("sample_ids", {})
+        templates = []
+        for pattern in state["discovered_patterns"]:
+            path = DISCOVERY_DIR / "sample_responses" / f"{_slugify(pattern)}_example.json"
+            if not path.exists():
+                continue
+            text = path.read_text()
+            for scheme in ("https", "http"):
+                text = text.replace(f"{scheme}://{ESPN_HOST}", self.base_url)
+            templates.append(_Template(pattern.rstrip("/") or "", text, sample_ids))
+
+        # Not in the discovery run (it never followed a week's events), but the source
+        # lists events per week; served from the events list sample
+        events_list = next(t for t in templates if t.pattern == "/events")
+        week_events = _Template(
+            "/seasons/{season_id}/types/{type_id}/weeks/{week_id}/events",
+            events_list.text,
+            sample_ids,
+        )
+        templates.append(week_events)
+        # Most specific first: fewer placeholders win (e.g. /seasons/powerindex)
+        templates.sort(key=lambda t: len(t.placeholders))
+        return templates
+
+    def _find_event_sample(self) -> dict[str, Any]:
+        """Season, type, week and competitor IDs the event samples were captured with."""
+        event = json.loads(self._template("/events/{event_id}").text)
+        text = json.dumps(event)
+        week = re.search(r"/seasons/(\d+)/types/(\d+)/weeks/(\d+)", text)
+        season = re.search(r"/seasons/(\d+)/", text)
+        return {
+            "event": event["id"],
+            "season": season.group(1) if season else None,
+            "week": week.groups() if week else None,
+            "competitors": [c.get("id") for c in event["competitions"][0]["competitors"]],
+        }
+
+    def _template(self, pattern: str) -> _Template:
+        return next(t for t in self._templates if t.pattern == pattern)
+
+    # --- Synthetic league ---
+
+    @staticmethod
+    def event_id(season: str, season_type: str, week: str, index: int) -> str:
+        """Synthetic event IDs encode where the event sits: 9 SSSS T WW IIII."""
+        return f"9{int(season):04d}{int(season_type):01d}{int(week):02d}{index:04d}"
+
+    @staticmethod
+    def _decode_event_id(event_id: str) -> tuple[str, str, str] | None:
+        if len(event_id) != 12 or not event_id.startswith("9"):
+            return None
+        return event_id[1:5], event_id[5], str(int(event_id[6:8]))
+
+    def _events_on(self, day: date) -> list[str]:
+        """IDs of the synthetic events played on `day` (see the module docstring)."""
+        season = day.year + 1 if day.month >= 11 else day.year
+        days_in = (day - date(season - 1, 11, 1)).days
+        week_index, weekday = divmod(days_in, 7)
+        for season_type in _SEASON_TYPE_ORDER:
+            weeks = self.config.weeks_per_season_type.get(season_type, 0)
+            if week_index < weeks:
+                return [
+                    self.event_id(str(season), season_type, str(week_index + 1), i)
+                    for i in range(1, self.config.events_per_week + 1)
+                    if (i - 1) % 7 == weekday
+                ]
+            week_index -= weeks
+        return []
+
+    def _events_on_dates(self, dates: str) -> list[Any]:
+        """Items of `/events?dates=YYYYMMDD` or `?dates=YYYYMMDD-YYYYMMDD`."""
+        first, _, last = dates.partition("-")
+        day = date(int(first[:4]), int(first[4:6]), int(first[6:8]))
+        end = date(int(last[:4]), int(last[4:6]), int(last[6:8])) if last else day
+        items = []
+        while day <= end:
+            items.extend(self._ref(f"/events/{event_id}") for event_id in self._events_on(day))
+            day += timedelta(days=1)
+        return items
+
+    def _event_teams(self, event_id: str) -> list[str]:
+        return random.Random(int(event_id)).sample(self.team_ids, 2)
+
+    def _athlete_ids(self, team_id: str) -> list[str]:
+        return [f"{team_id}{i:02d}" for i in range(1, self.config.athletes_per_roster + 1)]
+
+    def _ref(self, path: str) -> dict[str, str]:
+        return {"$ref": f"{self.league_base_url}{path}?lang=en&region=us"}
+
+    def _collection(self, pattern: str, ids: dict[str, str]) -> list[Any] | None:
+        """Items of the collections whose size the synthetic league decides."""
+        config = self.config
+        if pattern == "/seasons/{season_id}/types/{type_id}/weeks":
+            weeks = config.weeks_per_season_type.get(ids["type_id"], 0)
+            base = f"/seasons/{ids['season_id']}/types/{ids['type_id']}/weeks"
+            return [self._ref(f"{base}/{w}") for w in range(1, weeks + 1)]
+        if pattern == "/seasons/{season_id}/types/{type_id}/weeks/{week_id}/events":
+            if int(ids["week_id"]) > config.weeks_per_season_type.get(ids["type_id"], 0):
+                return []
+            return [
+                self._ref(
+                    f"/events/{self.event_id(ids['season_id'], ids['type_id'], ids['week_id'], i)}"
+                )
+                for i in range(1, config.events_per_week + 1)
+            ]
+        if pattern == "/seasons/{season_id}/teams":
+            return [self._ref(f"/seasons/{ids['season_id']}/teams/{t}") for t in self.team_ids]
+        if pattern == "/franchises":
+            return [self._ref(f"/franchises/{t}") for t in self.team_ids]
+        if pattern == "/seasons/{season_id}/athletes":
+            return [
+                self._ref(f"/seasons/{ids['season_id']}/athletes/{a}")
+                for t in self.team_ids
+                for a in self._athlete_ids(t)
+            ]
+        if pattern in (
+            "/events/{event_id}/competitions/{competition_id}/plays",
+            "/events/{event_id}/competitions/{competition_id}/probabilities",
+        ):
+            return self._per_play_items(pattern, ids)
+        return None
+
+    def _per_play_items(self, pattern: str, ids: dict[str, str]) -> list[Any]:
+        template = self._template(pattern)
+        samples = json.loads(self._rewrite(template, ids))["items"]
+        example_event = template.example_ids["event_id"]
+        items = []
+        for i in range(self.config.plays_per_game):
+            sample = samples[i % len(samples)]
+            sample_sequence = str(sample.get("sequenceNumber") or _last_id(sample["$ref"]))
+            sample_sequence = sample_sequence.removeprefix(example_event)
+            sequence = str(100000 + i)
+            # Play and probability IDs are the event ID followed by the sequence number
+            text = (
+                json.dumps(sample)
+                .replace(f"{example_event}{sample_sequence}", f"{ids['event_id']}{sequence}")
+                .replace(sample_sequence, sequence)
+            )
+            item = json.loads(text)
+            if "sequenceNumber" in item:
+                item["sequenceNumber"] = sequence
+            items.append(item)
+        return items
+
+    def _resize_roster(self, roster: dict[str, Any], team_id: str) -> None:
+        samples = roster.get("entries") or []
+        if not samples:
+            return
+        entries = []
+        for i, athlete_id in enumerate(self._athlete_ids(team_id)):
+            sample = samples[i % len(samples)]
+            text = json.dumps(sample).replace(str(sample["playerId"]), athlete_id)
+            entry = json.loads(text)
+            entry["playerId"] = int(athlete_id)
+            entry["displayName"] = f"Player {athlete_id}"
+            entries.append(entry)
+        roster["entries"] = entries
+
+    def _rewrite(self, template: _Template, ids: dict[str, str]) -> str:
+        """Template text with the sample's IDs replaced by the requested ones."""
+        # (path segment, sample ID) -> ID, for $ref URLs
+        mapping: dict[tuple[str, str], str] = {}
+        # sample ID -> ID, for "id" fields of the event, competition and competitors
+        id_mapping: dict[str, str] = {}
+
+        event_id = ids.get("event_id")
+        decoded = self._decode_event_id(event_id) if event_id else None
+        if decoded:
+            # Everything under a synthetic event belongs to its season, week and teams
+            season, season_type, week = decoded
+            sample = self._event_sample
+            mapping[("competitions", sample["event"])] = event_id
+            id_mapping[sample["event"]] = event_id
+            if sample["season"]:
+                mapping[("seasons", sample["season"])] = season
+            if sample["week"]:
+                _, sample_type, sample_week = sample["week"]
+                mapping[("types", sample_type)] = season_type
+                mapping[("weeks", sample_week)] = week
+
+            teams = self._event_teams(event_id)
+            requested = ids.get("competitor_id")
+            example = template.example_ids.get("competitor_id")
+            if requested in teams and example in sample["competitors"]:
+                # The competitor the sample shows becomes the requested one
+                pairs = [
+                    (example, requested),
+                    *zip(
+                        [t for t in sample["competitors"] if t != example],
+                        [t for t in teams if t != requested],
+                        strict=False,
+                    ),
+                ]
+            else:
+                pairs = list(zip(sample["competitors"], teams, strict=False))
+            for sample_team, team in pairs:
+                id_mapping[sample_team] = team
+                for segment in ("competitors", "teams", "powerindex"):
+                    mapping[(segment, sample_team)] = team
+        elif "competitor_id" in ids:
+            # A competitor is a team: its team refs follow the requested competitor
+            mapping[("teams", template.example_ids.get("competitor_id", ""))] = ids["competitor_id"]
+
+        for literal, name in template.placeholders:
+            example = template.example_ids.get(name)
+            if literal and example and ids[name] != example:
+                mapping[(literal, example)] = ids[name]
+
+        if not mapping:
+            return template.text
+
+        def _replace_segment(m: re.Match) -> str:
+            new = mapping.get((m.group(1), m.group(2)))
+            return f"/{m.group(1)}/{new}" if new else m.group(0)
+
+        def _replace_id(m: re.Match) -> str:
+            new = id_mapping.get(m.group(1))
+            return f'"id": "{new}"' if new else m.group(0)
+
+        text = _ID_SEGMENT_RE.sub(_replace_segment, template.text)
+        return _ID_FIELD_RE.sub(_replace_id, text) if id_mapping else text
+
+    def render(self, path: str, query: dict[str, str]) -> bytes | None:
+        """JSON body for a league-relative path, or None if no pattern matches."""
+        for template in self._templates:
+            ids = template.match(path)
+            if ids is not None:
+                break
+        else:
+            return None
+
+        items = self._collection(template.pattern, ids)
+        if template.pattern == "/events" and "dates" in query:
+            items = self._events_on_dates(query["dates"])
+        if items is not None:
+            return json.dumps(_paginate(items, query)).encode()
+
+        document = json.loads(self._rewrite(template, ids))
+        if isinstance(document, dict):
+            own_id = template.placeholders[-1][1] if template.placeholders else None
+            if own_id and document.get("id") == template.example_ids.get(own_id):
+                document["id"] = ids[own_id]
+            for field_name, name in _NUMBER_FIELDS.get(template.pattern, {}).items():
+                if field_name in document:
+                    document[field_name] = int(ids[name])
+            if "competitor_id" in ids and template.pattern.endswith("/roster"):
+                self._resize_roster(document, ids["competitor_id"])
+            if isinstance(document.get("items"), list):
+                # Sample lists hold one page of the real collection; serve it as the whole
+                document.update(_paginate(document["items"], query))
+        return json.dumps(document).encode()
+
+    # --- Faults ---
+
+    def fault(self) -> int | None:
+        """HTTP status to fail the current request with, if any."""
+        config = self.config
+        with self._lock:
+            now = time.monotonic()
+            self._recent.append(now)
+            while self._recent and now - self._recent[0] > 1.0:
+                self._recent.popleft()
+            if config.max_rps is not None and len(self._recent) > config.max_rps:
+                return 429
+            roll = self._random.random()
+        if roll < config.throttle_rate:
+            return 429
+        if roll < config.throttle_rate + config.error_rate:
+            return 500
+        return None
+
+    def delay(self) -> None:
+        config = self.config
+        seconds = config.latency_ms / 1000.0
+        if config.latency_jitter_ms:
+            with self._lock:
+                seconds += self._random.uniform(0, config.latency_jitter_ms) / 1000.0
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def record(self, status: int, size: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+            self.status_counts[status] += 1
+
+
+def _last_id(url: str) -> str:
+    return urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients dropping keep-alive connections are routine, not errors
+        logger.debug(f"Connection from {client_address} ended with an error", exc_info=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockEspnApi"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format % args)
+
+    def do_GET(self) -> None:  # noqa: N802
+        api: MockEspnApi = self.server.api  # type: ignore[attr-defined]
+        parts = urlsplit(self.path)
+        if parts.path == STATS_PATH:
+            self._send(200, json.dumps(api.stats()).encode(), record=False)
+            return
+
+        api.delay()
+        status = api.fault()
+        if status == 429:
+            self._send(429, b'{"error": {"message": "Too Many Requests", "code": 429}}')
+            return
+        if status == 500:
+            self._send(500, b'{"error": {"message": "Internal Server Error", "code": 500}}')
+            return
+
+        path = parts.path.rstrip("/")
+        body = None
+        if path.startswith(LEAGUE_PATH):
+            try:
+                body = api.render(path[len(LEAGUE_PATH) :], dict(parse_qsl(parts.query)))
+            except Exception as e:
+                logger.error(f"Mock failed to render {self.path}: {e}", exc_info=True)
+                self._send(500, b'{"error": {"message": "Mock render error", "code": 500}}')
+                return
+        if body is None:
+            self._send(404, b'{"error": {"message": "Not Found", "code": 404}}')
+            return
+        self._send(200, body)
+
+    def _send(self, status: int, body: bytes, record: bool = True) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(body)
+        if record:
+            self.server.api.record(status, len(body))  # type: ignore[attr-defined]
+
+
+def main() -> None:
+    defaults = MockApiConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--events-per-week", type=int, default=defaults.events_per_week)
+    parser.add_argument(
+        "--weeks-per-season-type",
+        default=",".join(f"{k}={v}" for k, v in defaults.weeks_per_season_type.items()),
+        help="Weeks per season type id, e.g. '1=1,2=18,3=3,4=0'",
+    )
+    parser.add_argument("--teams", type=int, default=defaults.teams)
+    parser.add_argument("--athletes-per-roster", type=int, default=defaults.athletes_per_roster)
+    parser.add_argument("--plays-per-game", type=int, default=defaults.plays_per_game)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--latency-jitter-ms", type=float, default=defaults.latency_jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--throttle-rate", type=float, default=defaults.throttle_rate)
+    parser.add_argument("--max-rps", type=float, default=defaults.max_rps)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    config = MockApiConfig(
+        events_per_week=args.events_per_week,
+        weeks_per_season_type={
+            season_type: int(weeks)
+            for season_type, weeks in (
+                pair.split("=", 1) for pair in args.weeks_per_season_type.split(",") if pair
+            )
+        },
+        teams=args.teams,
+        athletes_per_roster=args.athletes_per_roster,
+        plays_per_game=args.plays_per_game,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        max_rps=args.max_rps,
+        seed=args.seed,
+    )
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+    )
+    api = MockEspnApi(config, host=args.host, port=args.port)
+    print(f"Mock ESPN API at {api.league_base_url}")
+    print(json.dumps(asdict(config)))
+    with contextlib.suppress(KeyboardInterrupt):
+        api.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
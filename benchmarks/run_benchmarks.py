@@ -0,0 +1,286 @@
+"""
+End-to-end extraction benchmarks for `espn_source()` against the local mock ESPN API.
+
+Each scenario crawls one synthetic season whose size is set through the mock:
+
+- week:   1 regular-season week
+- month:  4 regular-season weeks
+- season: 1 preseason, 18 regular-season and 3 postseason weeks
+
+For every scenario the mock runs in its own process and the pipeline in a fresh child
+process, so peak RSS and timings belong to that scenario alone. Extract, normalize and
+load (into DuckDB) are timed separately, and the source's per-endpoint HTTP metrics
+are included.
+
+Results are written as JSON with sorted keys, so committing the output file makes
+regressions (e.g. in the deferred fan-out or the merge loads) show up as diffs:
+
+    python -m benchmarks.run_benchmarks --output benchmarks/results.json
+    python -m benchmarks.run_benchmarks --scenarios week --engine async
+"""
+
+import argparse
+import json
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.mock_espn_api import LEAGUE_PATH, STATS_PATH, MockApiConfig
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Season crawled in every scenario; the discovery samples were captured for it
+BENCHMARK_SEASON = "2021"
+
+# Weeks per season type id for each scenario
+SCENARIOS: dict[str, dict[str, int]] = {
+    "week": {"1": 0, "2": 1, "3": 0, "4": 0},
+    "month": {"1": 0, "2": 4, "3": 0, "4": 0},
+    "season": {"1": 1, "2": 18, "3": 3, "4": 0},
+}
+
+MOCK_STARTUP_TIMEOUT_SECONDS = 30.0
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _get_json(url: str) -> Any:
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return json.load(response)
+
+
+def _wait_until_ready(url: str, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + MOCK_STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Mock ESPN API exited with code {process.returncode}")
+        try:
+            _get_json(url)
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Mock ESPN API did not come up within {MOCK_STARTUP_TIMEOUT_SECONDS}s")
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_pipeline(
+    league_base_url: str, engine: str, rate_limit_rps: float | None, workdir: Path
+) -> dict[str, Any]:
+    """Runs extract, normalize and load once and returns timings and row counts."""
+    import logging
+
+    import dlt
+
+    from dlt_sources.espn_metrics import EspnHttpMetrics
+    from dlt_sources.espn_source import configure_pipeline, espn_source
+
+    logging.getLogger("dlt_sources").setLevel(logging.WARNING)
+
+    pipeline = dlt.pipeline(
+        pipeline_name="espn_benchmark",
+        destination=dlt.destinations.duckdb(str(workdir / "benchmark.duckdb")),
+        dataset_name="espn_benchmark",
+        pipelines_dir=str(workdir / "pipelines"),
+    )
+    configure_pipeline(pipeline, fetch_engine=engine)
+    http_metrics = EspnHttpMetrics()
+    source = espn_source(
+        league_base_url=league_base_url,
+        season_year_filter=BENCHMARK_SEASON,
+        fetch_engine=engine,
+        rate_limit_rps=rate_limit_rps,
+        http_metrics=http_metrics,
+    )
+
+    seconds = {}
+    started = time.perf_counter()
+    pipeline.extract(source)
+    seconds["extract"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    normalize_info = pipeline.normalize()
+    seconds["normalize"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    pipeline.load()
+    seconds["load"] = time.perf_counter() - started
+
+    row_counts = {
+        table: count
+        for table, count in normalize_info.row_counts.items()
+        if not table.startswith("_dlt")
+    }
+    return {
+        "seconds": seconds,
+        "row_counts": row_counts,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "http_endpoints": http_metrics.summary(),
+    }
+
+
+def run_scenario(name: str, args: argparse.Namespace) -> dict[str, Any]:
+    """Starts the mock sized for `name`, runs the pipeline in a child process against it."""
+    weeks = SCENARIOS[name]
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    mock_command = [
+        sys.executable,
+        "-m",
+        "benchmarks.mock_espn_api",
+        "--port",
+        str(port),
+        "--events-per-week",
+        str(args.events_per_week),
+        "--weeks-per-season-type",
+        ",".join(f"{k}={v}" for k, v in weeks.items()),
+        "--latency-ms",
+        str(args.latency_ms),
+    ]
+    mock = subprocess.Popen(
+        mock_command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_until_ready(f"{base_url}{STATS_PATH}", mock)
+        child_command = [
+            sys.executable,
+            "-m",
+            "benchmarks.run_benchmarks",
+            "--child",
+            "--league-base-url",
+            f"{base_url}{LEAGUE_PATH}",
+            "--engine",
+            args.engine,
+        ]
+        if args.rate_limit_rps is not None:
+            child_command += ["--rate-limit-rps", str(args.rate_limit_rps)]
+        child = subprocess.run(
+            child_command, cwd=REPO_ROOT, capture_output=True, text=True, check=False
+        )
+        if child.returncode != 0:
+            raise RuntimeError(
+                f"Benchmark '{name}' failed with code {child.returncode}:\n{child.stderr[-4000:]}"
+            )
+        run = json.loads(child.stdout.strip().splitlines()[-1])
+        mock_stats = _get_json(f"{base_url}{STATS_PATH}")
+    finally:
+        mock.terminate()
+        mock.wait()
+
+    seconds = run["seconds"]
+    seconds["total"] = sum(seconds.values())
+    events = run["row_counts"].get("events", 0)
+    requests = mock_stats["requests"]
+    return {
+        "weeks_per_season_type": weeks,
+        "events": events,
+        "rows_loaded": sum(run["row_counts"].values()),
+        "row_counts": run["row_counts"],
+        "seconds": {k: round(v, 3) for k, v in seconds.items()},
+        "events_per_second": round(events / seconds["total"], 3) if seconds["total"] else None,
+        "http_requests": requests,
+        "http_requests_per_event": round(requests / events, 2) if events else None,
+        "http_status_counts": mock_stats["status_counts"],
+        "bytes_fetched": mock_stats["bytes_sent"],
+        "peak_rss_mb": round(run["peak_rss_bytes"] / 2**20, 1),
+        "http_endpoints": run["http_endpoints"],
+    }
+
+
+def _print_summary(results: dict[str, Any]) -> None:
+    header = (
+        f"{'scenario':<8} {'events':>7} {'ev/s':>8} {'req/ev':>7} {'MB':>8} {'RSS MB':>7} "
+        f"{'extract':>8} {'normal.':>8} {'load':>8}"
+    )
+    print(header, file=sys.stderr)
+    for name, r in results["scenarios"].items():
+        s = r["seconds"]
+        print(
+            f"{name:<8} {r['events']:>7} {r['events_per_second'] or 0:>8.2f} "
+            f"{r['http_requests_per_event'] or 0:>7.1f} {r['bytes_fetched'] / 2**20:>8.1f} "
+            f"{r['peak_rss_mb']:>7.1f} {s['extract']:>7.1f}s {s['normalize']:>7.1f}s "
+            f"{s['load']:>7.1f}s",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    defaults = MockApiConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads")
+    parser.add_argument("--events-per-week", type=int, default=defaults.events_per_week)
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    parser.add_argument(
+        "--rate-limit-rps",
+        type=float,
+        default=None,
+        help="Rate limit ceiling for the source; off by default so the fan-out is measured",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON results here")
+    # Internal: run one pipeline and print its measurements as JSON
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--league-base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        with tempfile.TemporaryDirectory(prefix="espn_benchmark_") as workdir:
+            run = run_pipeline(
+                args.league_base_url, args.engine, args.rate_limit_rps, Path(workdir)
+            )
+        print(json.dumps(run))
+        return
+
+    results: dict[str, Any] = {
+        "git_commit": _git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "engine": args.engine,
+        "mock": {"events_per_week": args.events_per_week, "latency_ms": args.latency_ms},
+        "rate_limit_rps": args.rate_limit_rps,
+        "scenarios": {},
+    }
+    for name in args.scenarios:
+        print(f"Running '{name}' benchmark...", file=sys.stderr)
+        results["scenarios"][name] = run_scenario(name, args)
+
+    _print_summary(results)
+    document = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(document + "\n")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(document)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Raw response archive for the ESPN dlt source, and replay from it.
+
+Every response the source fetches from the network is appended to an archive of
+zstd-compressed JSON Lines files, one line per response:
+
+    {"key": ..., "url": ..., "fetched_at": ..., "body": "<response text>"}
+
+Files are partitioned by endpoint pattern (see `espn_metrics`), season and fetch date:
+
+    {root}/endpoint=events_competitions_plays/season=2024/fetched=2025-03-01/{file}.jsonl.zst
+
+A file is a sequence of independently compressed zstd frames of about `FRAME_BYTES`
+each, so `zstd -dc` reads it as plain JSONL. `index.sqlite` in the root maps each cache
+key (see `espn_cache.cache_key`) and fetch time to the frame holding it. Responses are
+never overwritten: a URL fetched again gets a new line, and replay serves the latest.
+
+In replay mode the source reads every response from the archive instead of the network,
+so tables can be rebuilt with new parsing logic as a local CPU job. Responses served
+from the response cache are not archived again; they were archived when fetched.
+"""
+
+import atexit
+import json
+import logging
+import os
+import re
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pyarrow as pa
+
+from dlt_sources.espn_cache import cache_key
+from dlt_sources.espn_metrics import UNMATCHED_PATTERN, EndpointClassifier, load_endpoint_patterns
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_CODEC = "zstd"
+ARCHIVE_COMPRESSION_LEVEL = 6
+INDEX_FILE_NAME = "index.sqlite"
+
+# Uncompressed size of a frame. Replay decompresses a whole frame to serve one response.
+FRAME_BYTES = 1 << 20
+# A file is closed (and the next frame starts a new one) once it is this large
+FILE_MAX_BYTES = 64 << 20
+# Buffered responses of a partition are written out at least this often
+FLUSH_INTERVAL_SECONDS = 60.0
+# Decompressed frames kept in memory while replaying
+REPLAY_FRAME_CACHE_SIZE = 32
+
+# How often hit/miss counts are logged while replaying
+STATS_LOG_INTERVAL_SECONDS = 60.0
+
+UNKNOWN_SEASON = "unknown"
+
+_SEASON_RE = re.compile(rb"/seasons/(\d{4})(?:/|\?|$|\")")
+# Responses without a season in their URL are partitioned by the first season they reference
+SEASON_SCAN_BYTES = 64 << 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    endpoint TEXT NOT NULL,
+    season TEXT NOT NULL,
+    file TEXT NOT NULL,
+    frame_offset INTEGER NOT NULL,
+    frame_length INTEGER NOT NULL,
+    frame_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_by_key ON responses (key, fetched_at);
+"""
+
+
+class ArchiveMissError(LookupError):
+    """Raised in replay mode for a URL the archive holds no response for."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(f"No archived response for {url}")
+        self.url = url
+
+
+def endpoint_slug(pattern: str) -> str:
+    """Partition name of an endpoint pattern: its literal segments joined by "_"."""
+    if pattern == UNMATCHED_PATTERN:
+        return UNMATCHED_PATTERN
+    segments = [s for s in pattern.split("/") if s and not s.startswith("{")]
+    return "_".join(segments) or "root"
+
+
+def season_of(url: str, body: bytes) -> str:
+    """Season a response belongs to: the one in its URL, else the first its body refers to."""
+    m = _SEASON_RE.search(url.encode()) or _SEASON_RE.search(body[:SEASON_SCAN_BYTES])
+    return m.group(1).decode() if m else UNKNOWN_SEASON
+
+
+class _Partition:
+    """Responses of one partition waiting to be written as a frame."""
+
+    __slots__ = ("directory", "file", "keys", "lines", "size", "started_at")
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.lines: list[bytes] = []
+        self.keys: list[tuple[str, float]] = []
+        self.size = 0
+        # File the next frame is appended to; a new one is started when None
+        self.file: str | None = None
+        # When the oldest buffered line was added
+        self.started_at = 0.0
+
+
+class ResponseArchive:
+    """
+    Append-only archive of raw ESPN responses, shared by all threads of a pipeline.
+    Several processes can write to the same root: each writes its own files, and they
+    share the SQLite index.
+
+    Args:
+        path: Root directory of the archive; created if missing.
+        patterns: Endpoint patterns to partition by. Defaults to the patterns in
+            `docs/discovery/discovery_state.json`.
+    """
+
+    def __init__(self, path: str | Path, patterns: list[str] | None = None) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.classifier = EndpointClassifier(
+            patterns if patterns is not None else load_endpoint_patterns()
+        )
+        self._codec = pa.Codec(ARCHIVE_CODEC, compression_level=ARCHIVE_COMPRESSION_LEVEL)
+        # Files of this instance are named after it, so concurrent writers never share one
+        self._file_prefix = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._file_seq = 0
+
+        self._lock = threading.Lock()
+        # One connection shared across threads; the lock serializes access to it
+        self._conn = sqlite3.connect(
+            self.path / INDEX_FILE_NAME, check_same_thread=False, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._partitions: dict[tuple[str, str, str], _Partition] = {}
+        self._frames: OrderedDict[tuple[str, int], dict[str, bytes]] = OrderedDict()
+        self._last_flushed_at = time.monotonic()
+        self.archived = 0
+        self.hits = 0
+        self.misses = 0
+        self._last_logged_at = time.monotonic()
+        # Buffered responses would be lost with the process otherwise
+        atexit.register(self.close)
+        logger.info("Response archive at %s", self.path)
+
+    def put(self, url: str, body: bytes) -> None:
+        """Archives the body of a successful GET of `url`."""
+        fetched_at = time.time()
+        key = cache_key(url)
+        endpoint = endpoint_slug(self.classifier.classify(url))
+        season = season_of(url, body)
+        fetched = datetime.fromtimestamp(fetched_at, UTC).strftime("%Y-%m-%d")
+        text = body.decode("utf-8", "replace")
+        line = json.dumps(
+            {"key": key, "url": url, "fetched_at": fetched_at, "body": text}, ensure_ascii=False
+        ).encode("utf-8")
+
+        with self._lock:
+            partition_key = (endpoint, season, fetched)
+            partition = self._partitions.get(partition_key)
+            if partition is None:
+                partition = self._partitions[partition_key] = _Partition(
+                    f"endpoint={endpoint}/season={season}/fetched={fetched}"
+                )
+            if not partition.lines:
+                partition.started_at = time.monotonic()
+            partition.lines.append(line)
+            partition.keys.append((key, fetched_at))
+            partition.size += len(line) + 1
+            self.archived += 1
+            if partition.size >= FRAME_BYTES:
+                self._write_frame(partition_key, partition)
+            self._flush_stale()
+
+    def _flush_stale(self) -> None:
+        # Caller holds the lock
+        now = time.monotonic()
+        if now - self._last_flushed_at < FLUSH_INTERVAL_SECONDS / 4:
+            return
+        self._last_flushed_at = now
+        for partition_key, partition in list(self._partitions.items()):
+            if partition.lines and now - partition.started_at >= FLUSH_INTERVAL_SECONDS:
+                self._write_frame(partition_key, partition)
+
+    def _write_frame(self, partition_key: tuple[str, str, str], partition: _Partition) -> None:
+        # Caller holds the lock
+        data = b"\n".join(partition.lines) + b"\n"
+        frame = self._codec.compress(data, asbytes=True)
+        if partition.file is None:
+            self._file_seq += 1
+            partition.file = f"{partition.directory}/{self._file_prefix}-{self._file_seq}.jsonl.zst"
+            (self.path / partition.directory).mkdir(parents=True, exist_ok=True)
+        with open(self.path / partition.file, "ab") as f:
+            offset = f.tell()
+            f.write(frame)
+        endpoint, season, _ = partition_key
+        location = (endpoint, season, partition.file, offset, len(frame), len(data))
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO responses (key, fetched_at, endpoint, season, file, frame_offset, "
+                "frame_length, frame_size) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(key, fetched_at, *location) for key, fetched_at in partition.keys],
+            )
+        if offset + len(frame) >= FILE_MAX_BYTES:
+            partition.file = None
+        partition.lines = []
+        partition.keys = []
+        partition.size = 0
+
+    def flush(self) -> None:
+        """Writes out every buffered response."""
+        with self._lock:
+            for partition_key, partition in self._partitions.items():
+                if partition.lines:
+                    self._write_frame(partition_key, partition)
+
+    def close(self) -> None:
+        self.flush()
+        atexit.unregister(self.close)
+
+    def get(self, url: str) -> bytes | None:
+        """Returns the latest archived body for `url`, or None if it was never archived."""
+        key = cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file, frame_offset, frame_length, frame_size FROM responses "
+                "WHERE key = ? ORDER BY fetched_at DESC LIMIT 1",
+                (key,),
+            ).fetchone()
+            body = self._frame(*row).get(key) if row is not None else None
+        self._count(body is not None)
+        return body
+
+    def _frame(self, file: str, offset: int, length: int, size: int) -> dict[str, bytes]:
+        # Caller holds the lock
+        frame = self._frames.get((file, offset))
+        if frame is not None:
+            self._frames.move_to_end((file, offset))
+            return frame
+        with open(self.path / file, "rb") as f:
+            f.seek(offset)
+            compressed = f.read(length)
+        data = self._codec.decompress(compressed, decompressed_size=size, asbytes=True)
+        # Later lines are later fetches, so a key fetched twice keeps its latest body
+        frame = {}
+        for line in data.splitlines():
+            record = json.loads(line)
+            frame[record["key"]] = record["body"].encode("utf-8")
+        self._frames[(file, offset)] = frame
+        if len(self._frames) > REPLAY_FRAME_CACHE_SIZE:
+            self._frames.popitem(last=False)
+        return frame
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            now = time.monotonic()
+            log_now = now - self._last_logged_at >= STATS_LOG_INTERVAL_SECONDS
+            if log_now:
+                self._last_logged_at = now
+        if log_now:
+            self.log_stats()
+
+    def summary(self) -> str:
+        if self.hits or self.misses:
+            return f"Response archive: {self.hits} replayed, {self.misses} not archived"
+        return f"Response archive: {self.archived} responses archived"
+
+    def log_stats(self) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self.summary())
@@ -0,0 +1,58 @@
+"""
+Columnar output for the tidy stat tables of the ESPN dlt source.
+
+The tidy stat transformers turn every statistic of a response into a row, so a season's
+team, player, pre-game record and power index stats come to millions of four- to
+six-field dicts. Each of them goes through dlt's per-row normalization. With
+`arrow_stats`, a transformer collects the rows of one response in a `TidyRows` and yields
+them as a single Arrow record batch. dlt writes Arrow items straight to Parquet and
+normalizes them a file at a time.
+"""
+
+from functools import cache
+from typing import Any
+
+import pyarrow as pa
+
+
+@cache
+def _string_schema(columns: tuple[str, ...]) -> pa.Schema:
+    return pa.schema([(column, pa.string()) for column in columns])
+
+
+class TidyRows:
+    """
+    Rows of a tidy table, collected column by column. Values are strings or None, as
+    in the dict rows; the columns are those of the first row.
+
+    Args:
+        arrow: Emit the rows as one Arrow record batch rather than a dict per row.
+    """
+
+    def __init__(self, arrow: bool = True) -> None:
+        self.arrow = arrow
+        self.columns: tuple[str, ...] = ()
+        self._values: dict[str, list[str | None]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, row: dict[str, str | None]) -> None:
+        if not self.columns:
+            self.columns = tuple(row)
+            self._values = {column: [] for column in self.columns}
+        for column in self.columns:
+            self._values[column].append(row.get(column))
+        self._count += 1
+
+    def items(self) -> list[Any]:
+        """The rows as one record batch (`arrow`) or as dicts; empty if none were added."""
+        if not self._count:
+            return []
+        if self.arrow:
+            return [pa.RecordBatch.from_pydict(self._values, schema=_string_schema(self.columns))]
+        columns = [self._values[column] for column in self.columns]
+        return [
+            dict(zip(self.columns, values, strict=True)) for values in zip(*columns, strict=True)
+        ]
@@ -0,0 +1,208 @@
+"""
+Persistent on-disk response cache for the ESPN dlt source.
+
+Responses are stored zlib-compressed in a SQLite file, keyed by the request URL (scheme
+dropped, query parameters sorted, so the same `$ref` always hits the same entry). How
+long an entry stays fresh is decided by `TTL_RULES`, the first matching URL pattern wins.
+
+Entries below a *final scope* never expire. A scope is an event (`.../events/{id}`) or
+a season (`.../seasons/{year}`) that the source has seen finish: a completed game status
+or a season whose end date has passed. Only entries fetched after the scope became final
+are treated as immutable, so data cached mid-game is still refreshed once.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# (URL pattern, TTL in seconds, None = never expires). First match wins.
+TTL_RULES: tuple[tuple[str, int | None], ...] = (
+    # Live game state changes every possession
+    (r"/events/\d+/competitions/\d+/(status|situation|probabilities|plays)", 30),
+    (r"/events/\d+/competitions/\d+/(odds|predictor|powerindex)", 15 * MINUTE),
+    # Everything else about a game that is not final yet
+    (r"/events/\d+", HOUR),
+    # League-level master data
+    (r"/(venues|positions|providers|media|franchises|awards|coaches)/", 7 * DAY),
+    # Season-scoped lists and details (teams, athletes, weeks, event lists)
+    (r"/seasons/\d+", DAY),
+    (r"", 6 * HOUR),
+)
+
+# URL prefixes that can become final (immutable) as a whole
+FINAL_SCOPE_PATTERNS = (
+    re.compile(r"^(.*?/events/\d+)(?:/|$)"),
+    re.compile(r"^(.*?/seasons/\d+)(?:/|$)"),
+)
+
+# A finished game's data is treated as settled this long after tip-off
+EVENT_SETTLE_SECONDS = DAY
+
+# How often hit/miss counts are logged while the cache is in use
+STATS_LOG_INTERVAL_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS final_scopes (
+    scope TEXT PRIMARY KEY,
+    final_since REAL NOT NULL
+);
+"""
+
+
+def cache_key(url: str) -> str:
+    """Normalizes a URL into a cache key: no scheme, no trailing slash, sorted query."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = f"{parts.netloc}{parts.path.rstrip('/')}"
+    return f"{key}?{query}" if query else key
+
+
+def parse_api_timestamp(value: str | None) -> float | None:
+    """Parses an ESPN date such as "2025-04-08T00:50Z" into a Unix timestamp."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _scope_of(key: str) -> list[str]:
+    path = key.split("?", 1)[0]
+    return [m.group(1) for pattern in FINAL_SCOPE_PATTERNS if (m := pattern.match(path))]
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache shared by all threads (and processes) of a pipeline.
+
+    Args:
+        path: SQLite file to use; created with its parent directories if missing.
+        ttl_rules: Extra (URL pattern, TTL seconds) rules checked before `TTL_RULES`.
+            A TTL of None never expires.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl_rules: dict[str, int | None] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._rules = [
+            (re.compile(pattern), ttl) for pattern, ttl in [*(ttl_rules or {}).items(), *TTL_RULES]
+        ]
+
+        self._lock = threading.Lock()
+        # One connection shared across threads; the lock serializes access to it
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._final_scopes: dict[str, float] = dict(
+            self._conn.execute("SELECT scope, final_since FROM final_scopes").fetchall()
+        )
+
+        self.hits = 0
+        self.misses = 0
+        self._last_logged_at = time.monotonic()
+        logger.info(
+            "Response cache at %s (%d final scopes known)", self.path, len(self._final_scopes)
+        )
+
+    def ttl_for(self, key: str) -> int | None:
+        for pattern, ttl in self._rules:
+            if pattern.search(key):
+                return ttl
+        return None
+
+    def _is_fresh(self, key: str, fetched_at: float, now: float) -> bool:
+        for scope in _scope_of(key):
+            final_since = self._final_scopes.get(scope)
+            if final_since is not None and fetched_at >= final_since:
+                return True
+        ttl = self.ttl_for(key)
+        return ttl is None or now - fetched_at < ttl
+
+    def get(self, url: str) -> bytes | None:
+        """Returns the cached body for `url` if present and still fresh."""
+        key = cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        fresh = row is not None and self._is_fresh(key, row[0], time.time())
+        self._count(fresh)
+        return zlib.decompress(row[1]) if fresh else None
+
+    def put(self, url: str, body: bytes) -> None:
+        key = cache_key(url)
+        content_hash = hashlib.sha1(body).hexdigest()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, fetched_at, content_hash, body) "
+                "VALUES (?, ?, ?, ?)",
+                (key, time.time(), content_hash, zlib.compress(body, 6)),
+            )
+
+    def mark_final(self, url: str, final_since: float | None = None) -> None:
+        """
+        Marks the event or season scope that `url` belongs to as final. Entries of that
+        scope fetched at or after `final_since` (default: now) never expire.
+        """
+        now = time.time()
+        final_since = min(final_since if final_since is not None else now, now)
+        scopes = _scope_of(cache_key(url))
+        if not scopes:
+            return
+        scope = scopes[0]
+        known = self._final_scopes.get(scope)
+        if known is not None and known <= final_since:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO final_scopes (scope, final_since) VALUES (?, ?)",
+                (scope, final_since),
+            )
+        self._final_scopes[scope] = final_since
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            now = time.monotonic()
+            log_now = now - self._last_logged_at >= STATS_LOG_INTERVAL_SECONDS
+            if log_now:
+                self._last_logged_at = now
+        if log_now:
+            self.log_stats()
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        hit_pct = 100.0 * self.hits / total if total else 0.0
+        return f"Response cache: {self.hits} hits, {self.misses} misses ({hit_pct:.1f}% hit rate)"
+
+    def log_stats(self) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self.summary())
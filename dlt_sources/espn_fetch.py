@@ -0,0 +1,451 @@
+"""
+Fetch engines for the ESPN dlt source.
+
+The detail fetchers in `espn_source.py` are coroutines that call
+`await fetcher.get_json(url)` and are wrapped with `@fetcher.defer` instead of
+`@dlt.defer`. The engine decides where those coroutines run:
+
+- "threads" (default): every fetcher is handed to dlt as a callable, so it runs in
+  dlt's extract worker thread pool and uses the blocking `detail_client`. This is the
+  same execution model as the original `@dlt.defer` fetchers.
+- "async": every fetcher is handed to dlt as an awaitable, so it runs on dlt's extract
+  event loop. HTTP goes through a single `aiohttp` session and thousands of requests can
+  be in flight at once; `max_concurrency` caps how many.
+
+`get_json_shared` adds single-flight coalescing for master-data refs (venues,
+positions, ...): concurrent requests for the same URL share one fetch, and repeats
+within the run are answered from memory.
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from functools import wraps
+from typing import Any
+
+from dlt.sources.helpers.rest_client import RESTClient
+
+from dlt_sources.espn_archive import ArchiveMissError
+from dlt_sources.espn_cache import cache_key
+from dlt_sources.espn_http import EspnHttpTransport, is_failed_status
+from dlt_sources.espn_memory import MemoryGuard
+from dlt_sources.espn_ratelimit import THROTTLE_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+FETCH_ENGINE_THREADS = "threads"
+FETCH_ENGINE_ASYNC = "async"
+FETCH_ENGINES = (FETCH_ENGINE_THREADS, FETCH_ENGINE_ASYNC)
+
+# Retry policy for the async engine. The threads engine relies on the retries built into
+# dlt's requests helper, which retries the same status codes.
+ASYNC_MAX_RETRIES = 5
+ASYNC_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+ASYNC_BACKOFF_BASE_SECONDS = 1.0
+ASYNC_BACKOFF_MAX_SECONDS = 16.0
+
+# How many pages of one paginated collection may be fetched ahead of its consumer
+MAX_PAGES_IN_FLIGHT = 8
+
+_thread_local = threading.local()
+
+
+def _thread_event_loop() -> asyncio.AbstractEventLoop:
+    """Returns a private event loop for the calling thread, creating it on first use."""
+    loop = getattr(_thread_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_local.loop = loop
+    return loop
+
+
+def _collect_rows(f: Callable[..., AsyncIterator[Any]]) -> Callable[..., Any]:
+    """Turns an async generator function into a coroutine returning all its rows."""
+
+    async def _collect(*args: Any, **kwargs: Any) -> list[Any] | None:
+        rows = [row async for row in f(*args, **kwargs)]
+        return rows or None
+
+    return _collect
+
+
+class EspnFetcher:
+    """
+    Runs the source's detail fetchers on the configured engine and performs their
+    HTTP GETs.
+
+    One instance is created per `espn_source()` call, so the engine can be chosen
+    per pipeline run. Timeouts, keep-alive and pool statistics come from the source's
+    `EspnHttpTransport` for both engines.
+    """
+
+    def __init__(
+        self,
+        detail_client: RESTClient,
+        transport: EspnHttpTransport,
+        engine: str = FETCH_ENGINE_THREADS,
+        max_concurrency: int = 500,
+        memory_guard: MemoryGuard | None = None,
+    ) -> None:
+        if engine not in FETCH_ENGINES:
+            raise ValueError(f"Unknown fetch engine '{engine}'. Expected one of {FETCH_ENGINES}.")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+
+        self.engine = engine
+        self.max_concurrency = max_concurrency
+        self._detail_client = detail_client
+        self._transport = transport
+        self._memory_guard = memory_guard
+
+        # Single-flight memo for get_json_shared, keyed by normalized URL. Futures are
+        # thread-safe, so the same map serves both engines.
+        self._shared: dict[str, concurrent.futures.Future] = {}
+        self._shared_lock = threading.Lock()
+        self.shared_hits = 0
+
+        # Threads that fetch pages 2..N of paginated collections (see iter_pages)
+        self._page_executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+        # Async engine state. The session belongs to the event loop dlt runs the
+        # fetchers on, so it is created lazily on that loop.
+        self._session: Any = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._session_guard: AsyncIterator[None] | None = None
+
+        if engine == FETCH_ENGINE_ASYNC:
+            try:
+                import aiohttp  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "The 'async' fetch engine requires aiohttp. "
+                    "Install it with: pip install 'ncaa-basketball-pipeline[async]'"
+                ) from e
+
+    @property
+    def is_async(self) -> bool:
+        return self.engine == FETCH_ENGINE_ASYNC
+
+    def defer(self, f: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Engine-aware replacement for `@dlt.defer`, applied to `async def` fetchers.
+
+        With the async engine the coroutine is returned to dlt as-is and dlt runs it on
+        its extract event loop. With the threads engine a callable is returned, which
+        dlt runs in its worker thread pool on a private per-thread event loop.
+
+        Fetchers written as async generators (one row per `yield`) are drained inside
+        the pool and handed to dlt as a single list of rows, so their HTTP calls and
+        unnesting never run on the extract thread. Downstream transformers receive
+        that list as one batch.
+
+        With a memory guard, each fetcher first waits for memory headroom while holding
+        its slot in dlt's pool, which also stops dlt from pulling more from the listers.
+        """
+        run = _collect_rows(f) if inspect.isasyncgenfunction(f) else f
+        guard = self._memory_guard
+
+        if guard is None:
+            make_coroutine = run
+        else:
+
+            async def make_coroutine(*args: Any, **kwargs: Any) -> Any:
+                await guard.wait_for_headroom()
+                return await run(*args, **kwargs)
+
+        @wraps(f)
+        def _wrap(*args: Any, **kwargs: Any) -> Any:
+            if self.is_async:
+                return make_coroutine(*args, **kwargs)
+
+            def _curry() -> Any:
+                return _thread_event_loop().run_until_complete(make_coroutine(*args, **kwargs))
+
+            return _curry
+
+        return _wrap
+
+    async def get_json(self, url: str) -> Any:
+        """GETs an absolute URL and returns the decoded JSON body. Raises on HTTP errors."""
+        if not self.is_async:
+            response = self._detail_client.get(url)
+            response.raise_for_status()
+            return response.json()
+        return await self._get_json_async(url)
+
+    async def get_json_shared(self, url: str) -> tuple[Any, bool]:
+        """
+        Like `get_json`, but every request for the same URL in this run shares a single
+        fetch: callers that arrive while it is in flight wait for it, later callers get
+        the remembered result.
+
+        Returns (data, first). `first` is True only for the caller that performed the
+        fetch, so fetchers can emit a row once per URL and drop the duplicates. The data
+        object is shared between callers. A failed fetch is forgotten so the next
+        caller retries it.
+        """
+        key = cache_key(url)
+        with self._shared_lock:
+            future = self._shared.get(key)
+            first = future is None
+            if first:
+                future = self._shared[key] = concurrent.futures.Future()
+            else:
+                self.shared_hits += 1
+
+        if not first:
+            logger.debug("Coalesced request for %s", url)
+            if self.is_async:
+                return await asyncio.wrap_future(future), False
+            return future.result(), False
+
+        try:
+            data = await self.get_json(url)
+        except BaseException as e:
+            with self._shared_lock:
+                self._shared.pop(key, None)
+            future.set_exception(e)
+            raise
+        future.set_result(data)
+        return data, True
+
+    def iter_pages(
+        self, url: str, params: dict[str, Any] | None = None, start_page: int = 1
+    ) -> Iterator[list[Any]]:
+        """
+        Yields the "items" list of every page of a paginated ESPN collection, in page
+        order, like `list_client.paginate`. `start_page` skips the pages before it, e.g.
+        to only read the tail of a collection that is known up to some point.
+
+        The start page is fetched first to learn `pageCount`; the following pages are
+        then fetched concurrently (at most `MAX_PAGES_IN_FLIGHT` ahead of the consumer)
+        on a small thread pool. They share the transport's connection pool, so the
+        global connection limit still applies.
+        """
+        first_page = self._get_page(url, params, start_page)
+        items = first_page.get("items") or []
+        if not items:
+            return
+        yield items
+
+        page_count = first_page.get("pageCount") or 1
+        pending: deque[concurrent.futures.Future] = deque()
+        next_page = start_page + 1
+        try:
+            while next_page <= page_count or pending:
+                while next_page <= page_count and len(pending) < MAX_PAGES_IN_FLIGHT:
+                    pending.append(self._page_pool().submit(self._get_page, url, params, next_page))
+                    next_page += 1
+                items = pending.popleft().result().get("items") or []
+                if not items:
+                    return
+                yield items
+        finally:
+            # Consumer stopped early or a page failed: drop the pages not started yet
+            for future in pending:
+                future.cancel()
+
+    async def paginate(
+        self, url: str, params: dict[str, Any] | None = None, start_page: int = 1
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Async variant of `iter_pages` for use inside `@fetcher.defer` fetchers. With the
+        async engine the pages after the start page are fetched as concurrent tasks on
+        the extract event loop.
+        """
+        if not self.is_async:
+            for page in self.iter_pages(url, params, start_page):
+                yield page
+            return
+
+        def page_params(page_number: int) -> dict[str, Any]:
+            return {**(params or {}), "page": page_number}
+
+        first_page = await self._get_json_async(url, page_params(start_page))
+        items = first_page.get("items") or []
+        if not items:
+            return
+        yield items
+
+        page_count = first_page.get("pageCount") or 1
+        pending: deque[asyncio.Task] = deque()
+        next_page = start_page + 1
+        try:
+            while next_page <= page_count or pending:
+                while next_page <= page_count and len(pending) < MAX_PAGES_IN_FLIGHT:
+                    pending.append(
+                        asyncio.ensure_future(self._get_json_async(url, page_params(next_page)))
+                    )
+                    next_page += 1
+                items = (await pending.popleft()).get("items") or []
+                if not items:
+                    return
+                yield items
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _get_page(self, url: str, params: dict[str, Any] | None, page_number: int) -> Any:
+        response = self._detail_client.get(url, params={**(params or {}), "page": page_number})
+        response.raise_for_status()
+        return response.json()
+
+    def _page_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._shared_lock:
+            if self._page_executor is None:
+                self._page_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._transport.pool_size, thread_name_prefix="espn-pages"
+                )
+            return self._page_executor
+
+    async def _ensure_session(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is loop:
+            return
+
+        import aiohttp
+
+        # dlt creates a new extract event loop for each extract step, so the session
+        # is rebuilt whenever the loop changes. The connector's limit is what caps
+        # in-flight requests; requests over the limit queue for a connection.
+        transport = self._transport
+        self._loop = loop
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                force_close=not transport.keep_alive,
+                keepalive_timeout=transport.keep_alive_idle_seconds
+                if transport.keep_alive
+                else None,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=transport.connect_timeout, sock_read=transport.read_timeout
+            ),
+            trace_configs=[self._pool_trace_config()],
+        )
+        # dlt calls loop.shutdown_asyncgens() before stopping its extract loop. Parking an
+        # async generator on the loop gets the session closed at that point.
+        self._session_guard = self._close_session_on_shutdown(self._session)
+        await self._session_guard.__anext__()
+
+    def _pool_trace_config(self) -> Any:
+        """Reports aiohttp connection reuse and connection-queue wait to the pool stats."""
+        import aiohttp
+
+        stats = self._transport.stats
+
+        async def on_queued_start(session, ctx, params) -> None:
+            ctx.queued_at = time.perf_counter()
+
+        async def on_queued_end(session, ctx, params) -> None:
+            ctx.pool_wait = time.perf_counter() - ctx.queued_at
+
+        async def on_reuse(session, ctx, params) -> None:
+            stats.record_checkout(getattr(ctx, "pool_wait", 0.0), reused=True)
+
+        async def on_create_end(session, ctx, params) -> None:
+            stats.record_checkout(getattr(ctx, "pool_wait", 0.0), reused=False)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        trace_config.on_connection_create_end.append(on_create_end)
+        return trace_config
+
+    @staticmethod
+    async def _close_session_on_shutdown(session: Any) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await session.close()
+
+    async def _get_json_async(self, url: str, params: dict[str, Any] | None = None) -> Any:
+        import aiohttp
+        from yarl import URL
+
+        cache = self._transport.cache
+        archive = self._transport.archive
+        if params:
+            url = str(URL(url).update_query(params))
+        metrics = self._transport.metrics
+        if cache is not None:
+            body = cache.get(url)
+            if body is not None:
+                metrics.record_cache_hit(url)
+                return json.loads(body)
+        if self._transport.replay:
+            body = archive.get(url)
+            if body is None:
+                raise ArchiveMissError(url)
+            return json.loads(body)
+
+        await self._ensure_session()
+        limiter = self._transport.rate_limiter
+
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async()
+            started = time.perf_counter()
+            try:
+                async with self._session.get(url) as response:
+                    if limiter is not None:
+                        if response.status in THROTTLE_STATUS_CODES:
+                            limiter.on_throttle(f"HTTP {response.status}")
+                        else:
+                            limiter.on_success()
+                    if response.status in ASYNC_RETRY_STATUS_CODES and attempt < ASYNC_MAX_RETRIES:
+                        retry_reason = f"HTTP {response.status}"
+                        metrics.record(
+                            url,
+                            time.perf_counter() - started,
+                            response.status,
+                            response.content_length or 0,
+                            attempt > 0,
+                        )
+                    else:
+                        # Decoded by hand: ESPN does not always send application/json
+                        body = await response.read()
+                        metrics.record(
+                            url,
+                            time.perf_counter() - started,
+                            response.status,
+                            len(body),
+                            attempt > 0,
+                        )
+                        if is_failed_status(response.status):
+                            self._transport.report_failure(url)
+                        response.raise_for_status()
+                        if cache is not None:
+                            cache.put(url, body)
+                        if archive is not None:
+                            archive.put(url, body)
+                        return json.loads(body)
+            except (TimeoutError, aiohttp.ClientConnectionError) as e:
+                metrics.record(url, time.perf_counter() - started, type(e).__name__, 0, attempt > 0)
+                if limiter is not None and isinstance(e, TimeoutError):
+                    limiter.on_throttle("timeout")
+                if attempt >= ASYNC_MAX_RETRIES:
+                    self._transport.report_failure(url)
+                    raise
+                retry_reason = repr(e)
+
+            # The connection is released before backing off, so waiting retries do not hold one
+            delay = min(ASYNC_BACKOFF_BASE_SECONDS * 2**attempt, ASYNC_BACKOFF_MAX_SECONDS)
+            attempt += 1
+            logger.debug(
+                "Retrying %s in %.1fs (%s, attempt %d/%d)",
+                url,
+                delay,
+                retry_reason,
+                attempt,
+                ASYNC_MAX_RETRIES,
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,374 @@
+"""
+Shared, connection-pooled HTTP transport for the ESPN dlt source.
+
+`espn_source()` creates one `EspnHttpTransport` per source instance. Its `requests`
+session is shared by `list_client` and `detail_client` (and its settings by the async
+fetch engine), so every thread talking to `sports.core.api.espn.com` draws from one
+keep-alive connection pool instead of opening new TCP/TLS connections.
+
+The pool is instrumented: each connection checkout records whether an idle keep-alive
+connection was reused and how long the caller waited for a free slot. Every request
+attempt is also recorded per endpoint pattern in the transport's `EspnHttpMetrics`. A
+summary is logged periodically and by `log_stats()`.
+
+With a `ResponseArchive`, every response fetched from the network is archived. In replay
+mode the session never touches the network: GETs are answered from the archive, and a
+URL it does not hold raises `ArchiveMissError`.
+
+Requests that fail for good (a network error, or a 429/5xx status once the retries are
+exhausted) are reported to the transport's `on_failure` callback, so a run can tell
+whether it extracted everything.
+"""
+
+import logging
+import socket
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from dlt.sources.helpers.requests import Client
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import Timeout
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from dlt_sources.espn_archive import ArchiveMissError, ResponseArchive
+from dlt_sources.espn_cache import ResponseCache
+from dlt_sources.espn_metrics import EspnHttpMetrics
+from dlt_sources.espn_ratelimit import THROTTLE_STATUS_CODES, AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# dlt's default for `extract.workers` (size of the @dlt.defer thread pool)
+DEFAULT_EXTRACT_WORKERS = 5
+
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
+DEFAULT_READ_TIMEOUT_SECONDS = 60.0
+DEFAULT_KEEP_ALIVE_IDLE_SECONDS = 60
+
+# How often the pool summary is logged while requests are flowing
+STATS_LOG_INTERVAL_SECONDS = 60.0
+
+
+def is_failed_status(status: int) -> bool:
+    """True for the statuses dlt retries (429, 5xx); still one after retrying, the GET failed."""
+    return status == 429 or status >= 500
+
+
+class HttpPoolStats:
+    """Thread-safe counters for connection checkouts from the shared pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.reused_connections = 0
+        self.new_connections = 0
+        self.pool_wait_seconds = 0.0
+        self.max_pool_wait_seconds = 0.0
+        self._last_logged_at = time.monotonic()
+
+    def record_checkout(self, wait_seconds: float, reused: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            if reused:
+                self.reused_connections += 1
+            else:
+                self.new_connections += 1
+            self.pool_wait_seconds += wait_seconds
+            self.max_pool_wait_seconds = max(self.max_pool_wait_seconds, wait_seconds)
+
+            now = time.monotonic()
+            log_now = now - self._last_logged_at >= STATS_LOG_INTERVAL_SECONDS
+            if log_now:
+                self._last_logged_at = now
+        if log_now and logger.isEnabledFor(logging.INFO):
+            logger.info(self.summary())
+
+    def summary(self) -> str:
+        with self._lock:
+            if not self.checkouts:
+                return "HTTP pool: no requests made."
+            reuse_pct = 100.0 * self.reused_connections / self.checkouts
+            avg_wait_ms = 1000.0 * self.pool_wait_seconds / self.checkouts
+            return (
+                f"HTTP pool: {self.checkouts} requests, "
+                f"{self.reused_connections} reused connections ({reuse_pct:.1f}%), "
+                f"{self.new_connections} new connections, "
+                f"pool wait avg {avg_wait_ms:.2f} ms / max {1000.0 * self.max_pool_wait_seconds:.1f} ms "
+                f"/ total {self.pool_wait_seconds:.2f} s"
+            )
+
+
+def _timed_pool_class(base: type[HTTPConnectionPool], stats: HttpPoolStats) -> type:
+    """Subclasses a urllib3 pool so every connection checkout is recorded in `stats`."""
+
+    class _TimedConnectionPool(base):  # type: ignore[valid-type,misc]
+        def _get_conn(self, timeout: float | None = None) -> Any:
+            started = time.perf_counter()
+            conn = super()._get_conn(timeout)
+            # A connection handed back with an open socket is a kept-alive one being reused
+            stats.record_checkout(
+                time.perf_counter() - started, getattr(conn, "sock", None) is not None
+            )
+            return conn
+
+    return _TimedConnectionPool
+
+
+class _InstrumentedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools report to an `HttpPoolStats`, which records every
+    request attempt (including each retry) in the endpoint metrics, and which sends each
+    attempt through the rate limiter, if any.
+    """
+
+    def __init__(
+        self,
+        stats: HttpPoolStats,
+        socket_options: list[tuple[int, int, int]],
+        metrics: EspnHttpMetrics,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        **kwargs,
+    ):
+        self._stats = stats
+        self._socket_options = socket_options
+        self._metrics = metrics
+        self._rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        limiter = self._rate_limiter
+        # dlt's retry wrapper resends the same PreparedRequest, so a second visit is a retry
+        attempt = getattr(request, "_espn_attempt", 0)
+        request._espn_attempt = attempt + 1
+        if limiter is not None:
+            limiter.acquire()
+        started = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+            # Read the body here so the latency covers the whole transfer
+            nbytes = (
+                int(response.headers.get("Content-Length") or 0)
+                if kwargs.get("stream")
+                else len(response.content)
+            )
+        except Exception as e:
+            self._metrics.record(
+                request.url, time.perf_counter() - started, type(e).__name__, 0, attempt > 0
+            )
+            if limiter is not None and isinstance(e, Timeout):
+                limiter.on_throttle(f"timeout ({type(e).__name__})")
+            raise
+        self._metrics.record(
+            request.url, time.perf_counter() - started, response.status_code, nbytes, attempt > 0
+        )
+        if limiter is not None:
+            if response.status_code in THROTTLE_STATUS_CODES:
+                limiter.on_throttle(f"HTTP {response.status_code}")
+            else:
+                limiter.on_success()
+        return response
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _timed_pool_class(HTTPConnectionPool, self._stats),
+            "https": _timed_pool_class(HTTPSConnectionPool, self._stats),
+        }
+
+
+def _cached_response(request: PreparedRequest, body: bytes) -> Response:
+    """Builds a 200 response for a body served from the response cache or archive."""
+    response = Response()
+    response.status_code = 200
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def _keep_alive_socket_options(idle_seconds: int) -> list[tuple[int, int, int]]:
+    """TCP keep-alive probes so idle pooled connections are not silently dropped."""
+    options = [*HTTPConnection.default_socket_options, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # TCP_KEEPIDLE/TCP_KEEPINTVL are not available on every platform
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle_seconds))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, idle_seconds // 4)))
+    return options
+
+
+class EspnHttpTransport:
+    """
+    One connection-pooled `requests` session (with dlt's retry handling) shared by all
+    ESPN clients of a source instance.
+
+    Args:
+        pool_size: Max connections per host. Requests beyond this wait for a free
+            connection (the wait is measured) instead of opening throwaway connections.
+        keep_alive: Keep connections open between requests. When False every request
+            sends `Connection: close`.
+        keep_alive_idle_seconds: Idle time before TCP keep-alive probes are sent, and how
+            long the async engine keeps an idle connection.
+        connect_timeout: Per-request connect timeout in seconds.
+        read_timeout: Per-request read timeout in seconds.
+        cache: Optional on-disk response cache. Fresh GETs are served from it without
+            touching the network, and every successful GET is stored in it.
+        rate_limiter: Optional adaptive rate limiter every network request (and retry)
+            waits on. Shared with the async fetch engine.
+        metrics: Per-endpoint request metrics to record into. A new one is created when
+            not given; either way it is available as `metrics`.
+        archive: Optional raw response archive. Every successful GET that goes to the
+            network is appended to it.
+        replay: Answer GETs from `archive` only, never from the network.
+        on_failure: Called with the URL of every GET that failed for good. URLs that are
+            simply missing (404, or from the archive in replay mode) do not count.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        keep_alive: bool = True,
+        keep_alive_idle_seconds: int = DEFAULT_KEEP_ALIVE_IDLE_SECONDS,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = DEFAULT_READ_TIMEOUT_SECONDS,
+        cache: ResponseCache | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        metrics: EspnHttpMetrics | None = None,
+        archive: ResponseArchive | None = None,
+        replay: bool = False,
+        on_failure: Callable[[str], None] | None = None,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}.")
+        if replay and archive is None:
+            raise ValueError("replay requires a response archive.")
+
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.keep_alive_idle_seconds = keep_alive_idle_seconds
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.archive = archive
+        self.replay = replay
+        self.on_failure = on_failure
+        self.stats = HttpPoolStats()
+        self.metrics = metrics if metrics is not None else EspnHttpMetrics()
+
+        # raise_for_status=False: RESTClient runs its own response hooks
+        self.session = Client(
+            request_timeout=(connect_timeout, read_timeout), raise_for_status=False
+        ).session
+        adapter = _InstrumentedHTTPAdapter(
+            self.stats,
+            (
+                _keep_alive_socket_options(keep_alive_idle_seconds)
+                if keep_alive
+                else list(HTTPConnection.default_socket_options)
+            ),
+            self.metrics,
+            rate_limiter,
+            # ESPN $refs all point at one host; spare pools cover http/https mixes
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            pool_block=True,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        # The archive wraps the network send, so responses served from the cache are not
+        # archived again
+        if archive is not None:
+            self.session.send = self._archived_send(self.session.send, archive, replay)  # type: ignore[method-assign]
+        if cache is not None:
+            self.session.send = self._cached_send(self.session.send, cache, self.metrics)  # type: ignore[method-assign]
+        self.session.send = self._reported_send(self.session.send, self.report_failure)  # type: ignore[method-assign]
+
+        logger.info(
+            "HTTP transport: pool_size=%s, keep_alive=%s, timeouts connect=%ss read=%ss",
+            pool_size,
+            keep_alive,
+            connect_timeout,
+            read_timeout,
+        )
+
+    @staticmethod
+    def _cached_send(send: Any, cache: ResponseCache, metrics: EspnHttpMetrics) -> Any:
+        """Wraps `Session.send` (including its retries) with the response cache."""
+
+        def _send(request: PreparedRequest, **kwargs: Any) -> Response:
+            if request.method != "GET":
+                return send(request, **kwargs)
+            body = cache.get(request.url)
+            if body is not None:
+                metrics.record_cache_hit(request.url)
+                return _cached_response(request, body)
+            response = send(request, **kwargs)
+            if response.status_code == 200:
+                cache.put(request.url, response.content)
+            return response
+
+        return _send
+
+    @staticmethod
+    def _archived_send(send: Any, archive: ResponseArchive, replay: bool) -> Any:
+        """Wraps `Session.send` (including its retries) with the response archive."""
+
+        def _send(request: PreparedRequest, **kwargs: Any) -> Response:
+            if request.method != "GET":
+                return send(request, **kwargs)
+            if replay:
+                body = archive.get(request.url)
+                if body is None:
+                    raise ArchiveMissError(request.url)
+                return _cached_response(request, body)
+            response = send(request, **kwargs)
+            if response.status_code == 200:
+                archive.put(request.url, response.content)
+            return response
+
+        return _send
+
+    @staticmethod
+    def _reported_send(send: Any, report_failure: Callable[[str], None]) -> Any:
+        """Wraps `Session.send` (including its retries) to report GETs that failed for good."""
+
+        def _send(request: PreparedRequest, **kwargs: Any) -> Response:
+            if request.method != "GET":
+                return send(request, **kwargs)
+            try:
+                response = send(request, **kwargs)
+            except ArchiveMissError:
+                raise
+            except Exception:
+                report_failure(request.url)
+                raise
+            if is_failed_status(response.status_code):
+                report_failure(request.url)
+            return response
+
+        return _send
+
+    def report_failure(self, url: str) -> None:
+        """Reports a GET of `url` that failed for good to `on_failure`."""
+        if self.on_failure is not None:
+            self.on_failure(url)
+
+    def log_stats(self) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self.stats.summary())
+        self.metrics.log_stats()
+        if self.rate_limiter is not None:
+            self.rate_limiter.log_stats()
+        if self.cache is not None:
+            self.cache.log_stats()
+        if self.archive is not None:
+            self.archive.log_stats()
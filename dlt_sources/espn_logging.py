@@ -0,0 +1,115 @@
+"""
+Logging helpers for the ESPN dlt source.
+
+The source logs with %-style arguments (`logger.debug("... %s", value)`), so nothing is
+formatted unless a handler will emit the record. Two helpers go on top of that:
+
+- `payload(obj)` wraps a response object or item for a log message. It is only rendered
+  when the record is emitted, and then as a truncated repr.
+- `SampledLogFilter` rate-limits records per category. The category is the call site
+  (file and line) unless the record carries `extra={"log_category": ...}`. Each category
+  passes `burst` records per `window_seconds`, then one in `sample_every`. The next record
+  that passes notes how many were dropped. Errors are never dropped. A bad endpoint that returns malformed items
+  for every event then logs a few warnings a minute instead of one per item.
+
+Neither helper configures handlers or levels; that is left to the application.
+"""
+
+import logging
+import reprlib
+import threading
+import time
+from typing import Any
+
+DEFAULT_BURST = 20
+DEFAULT_WINDOW_SECONDS = 60.0
+DEFAULT_SAMPLE_EVERY = 100
+PAYLOAD_MAX_CHARS = 500
+
+_payload_repr = reprlib.Repr()
+_payload_repr.maxlevel = 3
+_payload_repr.maxdict = 8
+_payload_repr.maxlist = 8
+_payload_repr.maxstring = 120
+_payload_repr.maxother = 120
+
+
+class _Payload:
+    __slots__ = ("max_chars", "obj")
+
+    def __init__(self, obj: Any, max_chars: int) -> None:
+        self.obj = obj
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        text = _payload_repr.repr(self.obj)
+        if len(text) > self.max_chars:
+            text = f"{text[: self.max_chars]}... ({type(self.obj).__name__})"
+        return text
+
+    __repr__ = __str__
+
+
+def payload(obj: Any, max_chars: int = PAYLOAD_MAX_CHARS) -> _Payload:
+    """Log argument for a response object or item: a truncated repr, built only when emitted."""
+    return _Payload(obj, max_chars)
+
+
+class SampledLogFilter(logging.Filter):
+    """
+    Passes `burst` records per category per `window_seconds`, then one in `sample_every`.
+
+    Records at ERROR and above always pass.
+
+    Args:
+        burst: Records of a category passed in full in each window.
+        window_seconds: Length of the window the burst applies to.
+        sample_every: After the burst, one record in this many is passed.
+    """
+
+    def __init__(
+        self,
+        burst: int = DEFAULT_BURST,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+    ) -> None:
+        super().__init__()
+        self.burst = burst
+        self.window_seconds = window_seconds
+        self.sample_every = max(1, sample_every)
+        self._lock = threading.Lock()
+        # category -> [window start, records seen in the window, records dropped since last pass]
+        self._categories: dict[Any, list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+        category = getattr(record, "log_category", None) or (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            state = self._categories.get(category)
+            if state is None or now - state[0] >= self.window_seconds:
+                dropped = state[2] if state else 0
+                state = self._categories[category] = [now, 0, dropped]
+            state[1] += 1
+            seen = state[1]
+            if seen > self.burst and (seen - self.burst) % self.sample_every:
+                state[2] += 1
+                return False
+            dropped, state[2] = state[2], 0
+        if dropped and isinstance(record.args or (), tuple):
+            # Appended as an argument so the message is still only formatted on emit
+            msg = str(record.msg) if record.args else str(record.msg).replace("%", "%%")
+            record.msg = f"{msg} [%d similar messages suppressed]"
+            record.args = (*(record.args or ()), dropped)
+        return True
+
+
+def install_sampled_logging(logger: logging.Logger, **kwargs: Any) -> SampledLogFilter:
+    """Adds a `SampledLogFilter` to `logger` unless it already has one; returns the filter."""
+    for existing in logger.filters:
+        if isinstance(existing, SampledLogFilter):
+            return existing
+    sampled = SampledLogFilter(**kwargs)
+    logger.addFilter(sampled)
+    return sampled
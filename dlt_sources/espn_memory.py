@@ -0,0 +1,127 @@
+"""
+Memory backpressure for the ESPN dlt source.
+
+dlt pulls items from the listers on its extract thread and hands every deferred fetcher
+to a bounded pool of `extract.max_parallel_items` slots. When the pool is full, dlt
+stops pulling from the listers until a slot frees up. So the number of refs, event
+documents and child batches in flight is bounded by that setting, and it is the queue
+between the lister and fetcher stages.
+
+`MemoryGuard` ties that queue to a memory budget. Before a deferred fetcher starts, it
+waits while the process RSS is above `soft_limit_fraction` of the budget. The waiting
+fetchers keep their pool slots, so the listers stop too, and dlt's writers get to flush
+what is already buffered. The wait is capped at `max_wait_seconds`: if memory does not
+come down (e.g. everything in flight is already fetched), the fetcher goes ahead rather
+than deadlock the pool.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOFT_LIMIT_FRACTION = 0.8
+DEFAULT_MAX_WAIT_SECONDS = 30.0
+POLL_INTERVAL_SECONDS = 0.25
+
+# dlt buffers this many rows per table before writing them out (dlt's default).
+# With a memory budget the buffers of ~40 tables are kept smaller.
+DEFAULT_BUFFER_MAX_ITEMS = 5000
+MEMORY_BOUNDED_BUFFER_MAX_ITEMS = 1000
+
+# How often a "waiting for memory" warning may be logged
+WARNING_LOG_INTERVAL_SECONDS = 30.0
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MiB (peak RSS where unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in KiB elsewhere
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+class MemoryGuard:
+    """
+    Holds back deferred fetchers while the process is close to its memory budget.
+
+    Args:
+        limit_mb: Memory budget of the extraction process in MiB.
+        soft_limit_fraction: Fetchers wait while RSS is above this share of `limit_mb`.
+        max_wait_seconds: Longest a single fetcher waits before going ahead anyway.
+    """
+
+    def __init__(
+        self,
+        limit_mb: float,
+        soft_limit_fraction: float = DEFAULT_SOFT_LIMIT_FRACTION,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+    ) -> None:
+        if limit_mb <= 0:
+            raise ValueError(f"limit_mb must be positive, got {limit_mb}.")
+        if not 0 < soft_limit_fraction <= 1:
+            raise ValueError(f"soft_limit_fraction must be in (0, 1], got {soft_limit_fraction}.")
+        self.limit_mb = limit_mb
+        self.soft_limit_mb = limit_mb * soft_limit_fraction
+        self.max_wait_seconds = max_wait_seconds
+
+        self._lock = threading.Lock()
+        self._last_warned_at = float("-inf")
+        self._last_collected_at = float("-inf")
+        self.peak_rss_mb = 0.0
+        self.waits = 0
+        self.timeouts = 0
+
+    def _over_soft_limit(self) -> bool:
+        rss = rss_mb()
+        with self._lock:
+            self.peak_rss_mb = max(self.peak_rss_mb, rss)
+        return rss > self.soft_limit_mb
+
+    def _collect(self) -> None:
+        # One full collection per poll interval at most, shared by all waiting fetchers
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_collected_at < POLL_INTERVAL_SECONDS:
+                return
+            self._last_collected_at = now
+        gc.collect()
+
+    async def wait_for_headroom(self) -> None:
+        """Returns once RSS is below the soft limit, or after `max_wait_seconds`."""
+        if not self._over_soft_limit():
+            return
+
+        self._collect()
+        started = time.monotonic()
+        with self._lock:
+            self.waits += 1
+            warn = started - self._last_warned_at >= WARNING_LOG_INTERVAL_SECONDS
+            if warn:
+                self._last_warned_at = started
+        if warn:
+            logger.warning(
+                "Memory: RSS %.0f MiB above the soft limit of %.0f MiB (budget %.0f MiB); "
+                "holding back fetchers.",
+                rss_mb(),
+                self.soft_limit_mb,
+                self.limit_mb,
+            )
+
+        while self._over_soft_limit():
+            if time.monotonic() - started >= self.max_wait_seconds:
+                with self._lock:
+                    self.timeouts += 1
+                return
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            self._collect()
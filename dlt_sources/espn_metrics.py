@@ -0,0 +1,218 @@
+"""
+Per-endpoint HTTP metrics for the ESPN dlt source.
+
+Every request the source makes (list and detail clients, both fetch engines) is
+classified by its URL path into one of the endpoint patterns discovered in
+`docs/discovery/discovery_state.json` (e.g.
+`/events/{event_id}/competitions/{competition_id}/plays`). For each pattern
+`EspnHttpMetrics` records the number of requests, their latency, response bytes,
+status codes, retries and responses served from the response cache.
+
+`summary()` returns a JSON-serializable dict keyed by pattern. The Dagster asset
+attaches it to each partition's materializations, so it shows which endpoints
+dominate a season's wall time.
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_STATE_PATH = (
+    Path(__file__).resolve().parent.parent / "docs" / "discovery" / "discovery_state.json"
+)
+
+# Requested by the source but never reached by the discovery crawl
+EXTRA_ENDPOINT_PATTERNS = ("/seasons/{season_id}/types/{type_id}/weeks/{week_id}/events",)
+
+# Pattern for URLs that match none of the known patterns
+UNMATCHED_PATTERN = "other"
+
+# Everything after the league segment, e.g. ".../leagues/mens-college-basketball/events/1"
+_LEAGUE_PATH_RE = re.compile(r"/leagues/[^/]+(?P<path>/.*)?$")
+
+# How often the top endpoints are logged while requests are flowing
+STATS_LOG_INTERVAL_SECONDS = 300.0
+# How many endpoints (by total request time) the periodic log line lists
+STATS_LOG_TOP_N = 5
+
+PERCENTILES = (50, 95, 99)
+
+
+def load_endpoint_patterns(path: Path = DISCOVERY_STATE_PATH) -> list[str]:
+    """Reads the discovered endpoint patterns, plus the ones the discovery crawl missed."""
+    try:
+        patterns = json.loads(path.read_text())["discovered_patterns"]
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Could not read endpoint patterns from %s (%r).", path, e)
+        patterns = []
+    return [*patterns, *(p for p in EXTRA_ENDPOINT_PATTERNS if p not in patterns)]
+
+
+class EndpointClassifier:
+    """
+    Maps request URLs to endpoint patterns such as `/seasons/{season_id}/types/{type_id}`.
+
+    Patterns with fewer placeholders win, so `/seasons/powerindex` is not mistaken for
+    `/seasons/{season_id}`. Query strings are ignored.
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        # Patterns grouped by segment count, most literal first within each group
+        self._by_length: dict[int, list[tuple[re.Pattern[str], str]]] = {}
+        for pattern in sorted(set(patterns), key=lambda p: p.count("{")):
+            segments = [s for s in pattern.split("/") if s]
+            body = "".join("/[^/]+" if s.startswith("{") else f"/{re.escape(s)}" for s in segments)
+            self._by_length.setdefault(len(segments), []).append((re.compile(f"^{body}$"), pattern))
+
+    def classify(self, url: str) -> str:
+        m = _LEAGUE_PATH_RE.search(urlsplit(url).path.rstrip("/"))
+        if m is None:
+            return UNMATCHED_PATTERN
+        # The league root itself is the "/" pattern, whose regex matches the empty path
+        path = m.group("path") or ""
+        for regex, pattern in self._by_length.get(path.count("/"), ()):
+            if regex.match(path):
+                return pattern
+        return UNMATCHED_PATTERN
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class _EndpointStats:
+    """Counters for one endpoint pattern. Callers hold `EspnHttpMetrics._lock`."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.status_codes: Counter[str] = Counter()
+        # Seconds per request, kept in full so percentiles are exact
+        self.latencies = array("d")
+
+    def summary(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        latency_ms = {}
+        if latencies:
+            latency_ms = {
+                f"p{p}": round(1000.0 * _percentile(latencies, p), 1) for p in PERCENTILES
+            }
+            latency_ms["max"] = round(1000.0 * latencies[-1], 1)
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "bytes": self.bytes,
+            "status_codes": dict(sorted(self.status_codes.items())),
+            "latency_ms": latency_ms,
+            "total_seconds": round(math.fsum(latencies), 3),
+        }
+
+
+class EspnHttpMetrics:
+    """
+    Thread-safe per-endpoint request metrics, shared by both HTTP paths of a source.
+
+    Args:
+        patterns: Endpoint patterns to classify URLs by. Defaults to the patterns in
+            `docs/discovery/discovery_state.json`.
+    """
+
+    def __init__(self, patterns: list[str] | None = None) -> None:
+        self.classifier = EndpointClassifier(
+            patterns if patterns is not None else load_endpoint_patterns()
+        )
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, _EndpointStats] = {}
+        self._last_logged_at = time.monotonic()
+
+    def _stats_for(self, pattern: str) -> _EndpointStats:
+        # Caller holds the lock
+        stats = self._endpoints.get(pattern)
+        if stats is None:
+            stats = self._endpoints[pattern] = _EndpointStats()
+        return stats
+
+    def record(
+        self, url: str, seconds: float, status: int | str, nbytes: int, retry: bool = False
+    ) -> None:
+        """
+        Records one request attempt that went to the network.
+
+        Args:
+            url: Requested URL.
+            seconds: Time from sending the request to having read the response.
+            status: HTTP status code, or the exception name if no response arrived.
+            nbytes: Response body size.
+            retry: Whether this attempt repeats an earlier, failed one.
+        """
+        pattern = self.classifier.classify(url)
+        with self._lock:
+            stats = self._stats_for(pattern)
+            stats.requests += 1
+            stats.retries += retry
+            stats.bytes += nbytes
+            stats.status_codes[str(status)] += 1
+            stats.latencies.append(seconds)
+
+            now = time.monotonic()
+            log_now = now - self._last_logged_at >= STATS_LOG_INTERVAL_SECONDS
+            if log_now:
+                self._last_logged_at = now
+        if log_now:
+            self.log_stats()
+
+    def record_cache_hit(self, url: str) -> None:
+        """Records a request answered from the response cache without touching the network."""
+        pattern = self.classifier.classify(url)
+        with self._lock:
+            self._stats_for(pattern).cache_hits += 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Per-pattern metrics, slowest endpoints (by total request time) first."""
+        with self._lock:
+            summaries = {pattern: stats.summary() for pattern, stats in self._endpoints.items()}
+        return dict(sorted(summaries.items(), key=lambda kv: -kv[1]["total_seconds"]))
+
+    def totals(self) -> dict[str, Any]:
+        """Metrics over all endpoints together."""
+        combined = _EndpointStats()
+        with self._lock:
+            for stats in self._endpoints.values():
+                combined.requests += stats.requests
+                combined.retries += stats.retries
+                combined.cache_hits += stats.cache_hits
+                combined.bytes += stats.bytes
+                combined.status_codes.update(stats.status_codes)
+                combined.latencies.extend(stats.latencies)
+        return combined.summary()
+
+    def log_stats(self) -> None:
+        # Sorting the latencies for the percentiles is only worth it if the line is logged
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        top = list(self.summary().items())[:STATS_LOG_TOP_N]
+        if not top:
+            return
+        logger.info(
+            "HTTP endpoints by request time: %s",
+            "; ".join(
+                f"{pattern} {s['requests']} req {s['total_seconds']:.1f} s "
+                f"p95 {s['latency_ms'].get('p95', 0.0):.0f} ms"
+                for pattern, s in top
+            ),
+        )
@@ -0,0 +1,254 @@
+"""
+Adaptive request rate limiter for the ESPN dlt source.
+
+Every HTTP request of a source instance (list and detail clients, both fetch engines)
+takes a token from one `AdaptiveRateLimiter` before it goes out. Tokens refill at the
+current rate, which follows AIMD (additive increase, multiplicative decrease):
+
+- HTTP 429, HTTP 503 or a timeout cuts the rate by `decrease_factor`, at most once per
+  `cooldown_seconds` so one burst of throttled responses counts as one signal.
+- While requests succeed the rate grows by `increase_rps` every second, up to `max_rps`.
+
+A long backfill therefore settles just below the rate ESPN tolerates instead of relying
+on a hand-tuned worker count. Responses served from the response cache do not take a
+token.
+
+`SharedRateLimiter` keeps the bucket in a SQLite file instead of in memory, so several
+pipeline processes on one machine (e.g. parallel season-partition runs) draw from, and
+back off on, one common budget.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMIT_RPS = 100.0
+DEFAULT_MIN_RPS = 1.0
+DEFAULT_INCREASE_RPS = 1.0
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_COOLDOWN_SECONDS = 1.0
+
+# HTTP statuses that mean "slow down"
+THROTTLE_STATUS_CODES = (429, 503)
+
+# How often the limiter summary is logged while requests are flowing
+STATS_LOG_INTERVAL_SECONDS = 60.0
+
+
+class AdaptiveRateLimiter:
+    """
+    Thread-safe token bucket whose refill rate adapts with AIMD.
+
+    Args:
+        max_rps: Ceiling for the request rate; also the starting rate.
+        min_rps: Floor the rate is never cut below.
+        increase_rps: Requests per second added for every second without throttling.
+        decrease_factor: Multiplier applied to the rate on a throttle signal.
+        cooldown_seconds: Throttle signals within this window of the last cut are
+            ignored, and the rate is not raised again until it has passed.
+        burst: Bucket capacity, i.e. how many requests may go out back to back after
+            an idle period. Defaults to one second's worth at `max_rps`.
+    """
+
+    def __init__(
+        self,
+        max_rps: float = DEFAULT_RATE_LIMIT_RPS,
+        min_rps: float = DEFAULT_MIN_RPS,
+        increase_rps: float = DEFAULT_INCREASE_RPS,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+        burst: float | None = None,
+    ) -> None:
+        if max_rps <= 0:
+            raise ValueError(f"max_rps must be positive, got {max_rps}.")
+        if not 0 < min_rps <= max_rps:
+            raise ValueError(f"min_rps must be in (0, {max_rps}], got {min_rps}.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be in (0, 1), got {decrease_factor}.")
+
+        self.max_rps = max_rps
+        self.min_rps = min_rps
+        self.increase_rps = increase_rps
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self.burst = burst if burst is not None else max(1.0, max_rps)
+
+        self._lock = threading.Lock()
+        # Wall-clock time, so the state stays meaningful when shared between processes
+        now = time.time()
+        self.rate = max_rps
+        # May go negative: a negative balance is the queue of callers already waiting
+        self._tokens = self.burst
+        self._refilled_at = now
+        self._increased_at = now
+        self._decreased_at = float("-inf")
+
+        self.requests = 0
+        self.throttles = 0
+        self.wait_seconds = 0.0
+        self._last_logged_at = now
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive access to the bucket state (rate, tokens and timestamps)."""
+        with self._lock:
+            yield
+
+    def _reserve(self) -> float:
+        """Takes one token and returns how long the caller has to wait before using it."""
+        with self._locked():
+            now = time.time()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self.requests += 1
+            self.wait_seconds += wait
+            log_now = now - self._last_logged_at >= STATS_LOG_INTERVAL_SECONDS
+            if log_now:
+                self._last_logged_at = now
+        if log_now:
+            self.log_stats()
+        return wait
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Waits on the running event loop until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """Additive increase: raises the rate for every second spent without throttling."""
+        # Cheap check against the last seen state before taking the lock
+        if self.rate >= self.max_rps or time.time() - self._increased_at < 1.0:
+            return
+        with self._locked():
+            now = time.time()
+            if self.rate >= self.max_rps or now - self._decreased_at < self.cooldown_seconds:
+                return
+            elapsed = now - self._increased_at
+            if elapsed >= 1.0:
+                self._set_rate(min(self.max_rps, self.rate + self.increase_rps * int(elapsed)))
+                self._increased_at = now
+
+    def on_throttle(self, reason: str) -> None:
+        """Multiplicative decrease on a 429/503/timeout."""
+        with self._locked():
+            now = time.time()
+            self.throttles += 1
+            if now - self._decreased_at < self.cooldown_seconds:
+                return
+            previous = self.rate
+            self._set_rate(max(self.min_rps, self.rate * self.decrease_factor))
+            self._decreased_at = now
+            self._increased_at = now
+        logger.warning(
+            "Rate limit: %s, cutting rate %.1f -> %.1f req/s", reason, previous, self.rate
+        )
+
+    def _set_rate(self, rate: float) -> None:
+        # Caller holds the lock. Tokens accrued so far are settled at the old rate.
+        now = time.time()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        self.rate = rate
+
+    def summary(self) -> str:
+        with self._lock:
+            avg_wait_ms = 1000.0 * self.wait_seconds / self.requests if self.requests else 0.0
+            return (
+                f"Rate limit: {self.rate:.1f} req/s (max {self.max_rps:.1f}), "
+                f"{self.requests} requests, {self.throttles} throttled, "
+                f"wait avg {avg_wait_ms:.2f} ms / total {self.wait_seconds:.2f} s"
+            )
+
+    def log_stats(self) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self.summary())
+
+
+class SharedRateLimiter(AdaptiveRateLimiter):
+    """
+    `AdaptiveRateLimiter` whose bucket lives in a SQLite file shared by every process
+    that opens the same path. Each token reservation and rate change is one short
+    `BEGIN IMMEDIATE` transaction, so the combined request rate of all processes stays
+    at the shared rate, and a 429 seen by one process slows all of them down.
+
+    The ceiling, floor and AIMD settings come from each instance's arguments and
+    should be the same in every process.
+
+    Args:
+        path: SQLite file holding the shared bucket; created if missing.
+        **kwargs: Passed on to `AdaptiveRateLimiter`.
+    """
+
+    def __init__(self, path: str | Path, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; transactions are opened explicitly in _locked()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, timeout=30, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS bucket (id INTEGER PRIMARY KEY CHECK (id = 1), "
+            "rate REAL, tokens REAL, refilled_at REAL, increased_at REAL, decreased_at REAL)"
+        )
+        # The first process to open the file seeds the bucket; later ones join it
+        self._conn.execute(
+            "INSERT OR IGNORE INTO bucket VALUES (1, ?, ?, ?, ?, ?)",
+            (self.rate, self._tokens, self._refilled_at, self._increased_at, -1.0),
+        )
+        with self._locked():
+            pass
+        logger.info("Shared rate limit at %s (currently %.1f req/s)", self.path, self.rate)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (
+                    self.rate,
+                    self._tokens,
+                    self._refilled_at,
+                    self._increased_at,
+                    self._decreased_at,
+                ) = self._conn.execute(
+                    "SELECT rate, tokens, refilled_at, increased_at, decreased_at "
+                    "FROM bucket WHERE id = 1"
+                ).fetchone()
+                # A ceiling lowered since the bucket was seeded applies right away
+                self.rate = min(self.rate, self.max_rps)
+                yield
+                self._conn.execute(
+                    "UPDATE bucket SET rate = ?, tokens = ?, refilled_at = ?, "
+                    "increased_at = ?, decreased_at = ? WHERE id = 1",
+                    (
+                        self.rate,
+                        self._tokens,
+                        self._refilled_at,
+                        self._increased_at,
+                        self._decreased_at,
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
@@ -0,0 +1,486 @@
+"""
+Cross-run registries of fetched master-data refs and finalized events.
+
+Master dimensions (venues, positions, providers, media, coaches, franchises, master
+awards) barely change, yet every season partition would otherwise refetch all of
+them. For each master `$ref` the registry stores when it was last fetched and a hash of
+the response. With a `MasterRefStore` the entries live in a SQLite file shared by the
+runs of all partitions; the store stages a run's entries and writes them once the caller
+commits it after the run's load package is loaded. Without one they are kept in
+`dlt.current.source_state()["master_refs"]` of the run's pipeline.
+
+The other registries live in dlt source state, committed together with the load package
+that carried the rows. dlt writes a pipeline's state back as a whole at the end of a
+run, so runs that share a pipeline keep only the last writer's entries. Runs that execute
+in parallel (partitions) therefore each need a pipeline of their own, see
+`ncaa_basketball_pipeline/assets.py`.
+
+- Refs fetched within `max_age_seconds` are skipped without an HTTP call.
+- Refs that are refetched but come back unchanged are not emitted again.
+
+Events work the same way at a coarser grain. For every event the event registry stores
+its `modified` marker and when a run last saw it final after the game had settled. Such
+an event is skipped together with its whole sub-resource tree until its marker changes.
+Entries of events that have been final for `FINAL_EVENT_RETENTION_DAYS` are pruned, so
+the registry does not grow without bound; such an event is re-extracted once (served by
+the response cache, if enabled, where its responses no longer expire) and registered again.
+
+Checkpoints split a season into chunks (its season-level data, then one chunk per week)
+that are extracted by separate runs. A chunk is marked done in the state its own run
+commits, so after a crash a rerun with the same checkpoint key skips the chunks whose
+data already reached a load package and resumes from the first one that did not. A run
+whose requests fail for good leaves its chunk undone, to be extracted again. The run
+completing the last chunk clears the season's checkpoints.
+
+Live polling keeps a cursor per event and play-ordered collection (plays, win
+probabilities): how many items were seen and the highest `sequenceNumber`. Each poll
+reads only the pages from the cursor on and emits only the items past it, moving the
+cursor after every page. Events already completed when first polled get no cursor.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import dlt
+from dlt.common.exceptions import PipelineStateNotAvailable, SourceSectionNotAvailable
+
+from dlt_sources.espn_cache import DAY, cache_key
+
+logger = logging.getLogger(__name__)
+
+STATE_KEY = "master_refs"
+EVENTS_STATE_KEY = "event_status"
+LIVE_STATE_KEY = "live_events"
+CHECKPOINTS_STATE_KEY = "checkpoints"
+SEASON_WEEKS_STATE_KEY = "season_weeks"
+
+# Finalized events are forgotten this long after a run first saw them final
+FINAL_EVENT_RETENTION_DAYS = 365
+# Live cursors are forgotten this long after an event's last status poll
+LIVE_EVENT_RETENTION_DAYS = 3
+
+# Chunk holding the season-level data (teams, athletes, ...) of a season
+SEASON_CHUNK = "season"
+
+_MASTER_REFS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS master_refs (
+    key TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    content_hash TEXT NOT NULL
+);
+"""
+
+
+def content_hash(data: Any) -> str:
+    """Stable hash of a decoded JSON document."""
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _source_state_entries(key: str, what: str, consequence: str) -> dict[str, Any]:
+    """
+    Entries of one registry in dlt source state. The state is only available while the
+    pipeline extracts, so it is looked up on first use; dlt maps its worker threads to
+    the pipeline's state. Without it the registry only lasts for this run, and
+    `consequence` says what that costs the next one.
+    """
+    try:
+        state = dlt.current.source_state()
+    except (SourceSectionNotAvailable, PipelineStateNotAvailable):
+        state = None
+    if state is None:
+        logger.warning(
+            "dlt source state unavailable, the %s registry is kept for this run only: %s.",
+            what,
+            consequence,
+        )
+        return {}
+    entries = state.setdefault(key, {})
+    logger.info("%s registry: %d known", what.capitalize(), len(entries))
+    return entries
+
+
+class MasterRefStore:
+    """
+    SQLite table of {normalized $ref URL: (fetched_at, content_hash)} shared by the runs of
+    all partitions (and processes), e.g. next to the response cache.
+
+    Entries recorded by a run are staged in memory, where the run itself sees them, and
+    only written by `commit()`. Call it after the run's load package is loaded: a run that
+    fails leaves the table as it was, so the refs it fetched are not skipped next time.
+
+    Args:
+        path: SQLite file to use; created with its parent directories if missing.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending: dict[str, tuple[float, str]] = {}
+        # One connection shared across threads; the lock serializes access to it
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_MASTER_REFS_SCHEMA)
+        logger.info("Master ref store at %s", self.path)
+
+    def get(self, key: str) -> tuple[float, str] | None:
+        """(fetched_at, content_hash) of `key`, staged or committed; None if never fetched."""
+        with self._lock:
+            staged = self._pending.get(key)
+            if staged is not None:
+                return staged
+            row = self._conn.execute(
+                "SELECT fetched_at, content_hash FROM master_refs WHERE key = ?", (key,)
+            ).fetchone()
+        return (row[0], row[1]) if row is not None else None
+
+    def stage(self, key: str, fetched_at: float, digest: str) -> None:
+        with self._lock:
+            self._pending[key] = (fetched_at, digest)
+
+    def commit(self) -> int:
+        """Writes the staged entries to the table; returns how many there were."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO master_refs (key, fetched_at, content_hash) "
+                "VALUES (?, ?, ?)",
+                [(key, fetched_at, digest) for key, (fetched_at, digest) in self._pending.items()],
+            )
+            committed = len(self._pending)
+            self._pending.clear()
+        logger.info("Master ref store: committed %d refs", committed)
+        return committed
+
+
+class MasterRefRegistry:
+    """
+    Tracks {normalized $ref URL: [fetched_at, content_hash]} in `store`, or in dlt source
+    state without one.
+
+    Args:
+        max_age_seconds: Refs fetched more recently than this are considered fresh and
+            skipped. 0 disables skipping (unchanged responses are still not re-emitted).
+        store: Shared store to keep the entries in instead of the pipeline's state.
+    """
+
+    def __init__(self, max_age_seconds: float, store: MasterRefStore | None = None) -> None:
+        self.max_age_seconds = max_age_seconds
+        self.store = store
+        self._entries: dict[str, list[Any]] | None = None
+        self._lock = threading.Lock()
+        self.skipped = 0
+
+    def _state(self) -> dict[str, list[Any]]:
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = _source_state_entries(
+                        STATE_KEY,
+                        "master refs",
+                        "the next run fetches and emits every master ref again",
+                    )
+        return self._entries
+
+    def _entry(self, key: str) -> tuple[float, str] | None:
+        if self.store is not None:
+            return self.store.get(key)
+        entry = self._state().get(key)
+        return (entry[0], entry[1]) if entry is not None else None
+
+    def is_fresh(self, url: str) -> bool:
+        """True if `url` was fetched within the freshness window by this or an earlier run."""
+        if self.max_age_seconds <= 0:
+            return False
+        entry = self._entry(cache_key(url))
+        fresh = entry is not None and time.time() - entry[0] < self.max_age_seconds
+        if fresh:
+            self.skipped += 1
+        return fresh
+
+    def record(self, url: str, data: Any) -> bool:
+        """
+        Records a fetch of `url`. Returns False if the content is identical to what
+        was recorded before, i.e. the row does not need to be emitted again.
+        """
+        key = cache_key(url)
+        digest = content_hash(data)
+        previous = self._entry(key)
+        if self.store is not None:
+            self.store.stage(key, time.time(), digest)
+        else:
+            self._state()[key] = [time.time(), digest]
+        return previous is None or previous[1] != digest
+
+
+def event_modified_marker(event_detail: dict[str, Any]) -> str:
+    """
+    The event's `modified` timestamp, or a hash of the document where ESPN omits it.
+    Must be taken before any FKs are added to the document.
+    """
+    return str(event_detail.get("modified") or content_hash(event_detail))
+
+
+class EventStatusRegistry:
+    """
+    Tracks {event id: [modified marker, final_at]} in dlt source state.
+
+    final_at is None until a run fetches the event with a completed status after the game
+    has settled (stat corrections have landed), then the time of that run.
+
+    Args:
+        full_refresh: Never skip events; they are still recorded for later runs.
+    """
+
+    def __init__(self, full_refresh: bool = False) -> None:
+        self.full_refresh = full_refresh
+        self._entries: dict[str, list[Any]] | None = None
+        self._lock = threading.Lock()
+        self.skipped = 0
+
+    def _state(self) -> dict[str, list[Any]]:
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    entries = _source_state_entries(
+                        EVENTS_STATE_KEY, "events", "later runs do not skip final events"
+                    )
+                    self._prune(entries)
+                    self._entries = entries
+        return self._entries
+
+    def _prune(self, entries: dict[str, list[Any]]) -> None:
+        cutoff = time.time() - FINAL_EVENT_RETENTION_DAYS * DAY
+        expired = [k for k, (_, final_at) in entries.items() if final_at and final_at < cutoff]
+        for event_id in expired:
+            del entries[event_id]
+        if expired:
+            logger.info(
+                "Events registry: pruned %d events final since before the cutoff", len(expired)
+            )
+
+    def observe(self, event_id: str, modified: str) -> bool:
+        """
+        Records that `event_id` was fetched with `modified`. Returns True if an earlier run
+        saw the event final and settled and it has not changed since, i.e. it and its
+        sub-resources can be skipped.
+        """
+        entries = self._state()
+        previous = entries.get(event_id)
+        if previous is not None and previous[0] == modified:
+            if previous[1] is not None and not self.full_refresh:
+                self.skipped += 1
+                return True
+            return False
+        # New or changed: whatever status it had has to be confirmed again
+        entries[event_id] = [modified, None]
+        return False
+
+    def mark_final(self, event_id: str, settled_at: float | None = None) -> None:
+        """
+        Records that `event_id` was fetched with a completed status. Ignored before
+        `settled_at`, as the fetched sub-resources may still miss stat corrections.
+        """
+        now = time.time()
+        entry = self._state().get(event_id)
+        if entry is not None and (settled_at is None or settled_at <= now):
+            entry[1] = now
+
+
+class LiveEventCursors:
+    """
+    Tracks {event id: {collection: [items seen, last sequenceNumber], "polled_at": time,
+    "final": bool, "tail": bool}} in dlt source state for the live polling mode.
+
+    Entries of events not polled for `LIVE_EVENT_RETENTION_DAYS` (final ones are not
+    polled anymore) are pruned; by then the events have left the polled dates.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def _state(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    entries = _source_state_entries(
+                        LIVE_STATE_KEY,
+                        "live events",
+                        "the next poll re-reads every play and probability of each game",
+                    )
+                    self._prune(entries)
+                    self._entries = entries
+        return self._entries
+
+    def _prune(self, entries: dict[str, dict[str, Any]]) -> None:
+        cutoff = time.time() - LIVE_EVENT_RETENTION_DAYS * DAY
+        expired = [k for k, entry in entries.items() if entry.get("polled_at", 0) < cutoff]
+        for event_id in expired:
+            del entries[event_id]
+        if expired:
+            logger.info(
+                "Live events registry: pruned %d events not polled since before the cutoff",
+                len(expired),
+            )
+
+    def is_final(self, event_id: str) -> bool:
+        """True once a poll saw the event completed; it does not need polling anymore."""
+        return bool(self._state().get(event_id, {}).get("final"))
+
+    def observe(self, event_id: str, completed: bool) -> None:
+        """
+        Records a status poll of `event_id`. An event the first poll already sees completed
+        is not tailed: its plays and probabilities would be appended from the first page,
+        duplicating the rows the daily run merges.
+        """
+        entries = self._state()
+        with self._lock:
+            entry = entries.setdefault(event_id, {"tail": not completed})
+            entry["polled_at"] = time.time()
+            if completed:
+                entry["final"] = True
+
+    def tails(self, event_id: str) -> bool:
+        """True if the plays and probabilities of `event_id` are polled past its cursors."""
+        return bool(self._state().get(event_id, {}).get("tail", True))
+
+    def cursor(self, event_id: str, collection: str) -> tuple[int, int]:
+        """(items seen, last sequenceNumber) of `collection`; (0, -1) before the first poll."""
+        seen, last_sequence = self._state().get(event_id, {}).get(collection, (0, -1))
+        return seen, last_sequence
+
+    def advance(self, event_id: str, collection: str, seen: int, last_sequence: int) -> None:
+        entries = self._state()
+        with self._lock:
+            entries.setdefault(event_id, {})[collection] = [seen, last_sequence]
+
+
+def cursor_start_page(seen: int, page_size: int) -> int:
+    """Page (1-based) holding the last of `seen` items: where the next poll resumes reading."""
+    return max(seen - 1, 0) // page_size + 1
+
+
+def week_chunk(season_type: str, week: str) -> str:
+    """Checkpoint chunk of one week of a season type, e.g. "2-5"."""
+    return f"{season_type}-{week}"
+
+
+def season_weeks(source_state: dict[str, Any], season: str) -> list[tuple[str, str]]:
+    """(season type, week) pairs that runs of the season have listed, in walk order."""
+    chunks = source_state.get(SEASON_WEEKS_STATE_KEY, {}).get(season, [])
+    return [(season_type, week) for season_type, week in (c.split("-", 1) for c in chunks)]
+
+
+class ExtractionCheckpoints:
+    """
+    Tracks {season: {"key": checkpoint key, "done": [chunks]}} and {season: [listed week
+    chunks]} in dlt source state. Completed chunks only count for runs with the same
+    checkpoint key. Once the season-level chunk and every listed week are done, the
+    season's entry is cleared, so the next extraction of the season starts from scratch.
+
+    Args:
+        checkpoint_key: Identifies the extractions of a season that resume each other
+            (e.g. the partition key). None disables resuming.
+    """
+
+    def __init__(self, checkpoint_key: str | None) -> None:
+        self.checkpoint_key = checkpoint_key
+        self._completed: dict[str, dict[str, Any]] | None = None
+        self._weeks: dict[str, list[str]] | None = None
+        # Chunks this run saw failed requests in, and the done chunks of seasons it cleared
+        self._failed: set[tuple[str, str]] = set()
+        self._cleared: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def _state(self) -> tuple[dict[str, dict[str, Any]], dict[str, list[str]]]:
+        if self._completed is None:
+            with self._lock:
+                if self._completed is None:
+                    self._weeks = _source_state_entries(
+                        SEASON_WEEKS_STATE_KEY,
+                        "season weeks",
+                        "week-by-week runs of the season find no weeks to extract",
+                    )
+                    self._completed = _source_state_entries(
+                        CHECKPOINTS_STATE_KEY,
+                        "checkpoints",
+                        "a rerun does not resume after the chunks this run completes",
+                    )
+        return self._completed, self._weeks
+
+    def _is_complete(self, season: str, done: list[str]) -> bool:
+        _, weeks = self._state()
+        return SEASON_CHUNK in done and all(c in done for c in weeks.get(season, []))
+
+    def is_done(self, season: str, chunk: str) -> bool:
+        """True if a run with the same checkpoint key completed `chunk` of `season`."""
+        if self.checkpoint_key is None:
+            return False
+        entry = self._state()[0].get(season)
+        if entry is None or entry["key"] != self.checkpoint_key:
+            return False
+        # A complete entry is left over from a finished extraction; this one starts over
+        return chunk in entry["done"] and not self._is_complete(season, entry["done"])
+
+    def mark_done(self, season: str, chunk: str) -> None:
+        """
+        Marks `chunk` done, and clears the season's entry when it was the last one. Takes
+        effect only if this run's load package is committed, and not after `mark_failed`.
+        """
+        if self.checkpoint_key is None:
+            return
+        completed, _ = self._state()
+        with self._lock:
+            if (season, chunk) in self._failed:
+                return
+            entry = completed.get(season)
+            if entry is None or entry["key"] != self.checkpoint_key:
+                entry = completed[season] = {"key": self.checkpoint_key, "done": []}
+            if chunk not in entry["done"]:
+                entry["done"].append(chunk)
+            # The season-level chunk runs first, before it has listed the weeks
+            if chunk != SEASON_CHUNK and self._is_complete(season, entry["done"]):
+                self._cleared[season] = entry["done"]
+                del completed[season]
+                logger.info("Checkpoints: season '%s' complete, cleared", season)
+
+    def mark_failed(self, season: str, chunk: str) -> None:
+        """
+        Takes back (and prevents) marking `chunk` done, as some of its requests failed: a
+        rerun extracts it again. Restores the season's entry if marking it cleared it.
+        """
+        if self.checkpoint_key is None:
+            return
+        completed, _ = self._state()
+        with self._lock:
+            if (season, chunk) in self._failed:
+                return
+            self._failed.add((season, chunk))
+            if season in self._cleared:
+                completed[season] = {
+                    "key": self.checkpoint_key,
+                    "done": self._cleared.pop(season),
+                }
+            entry = completed.get(season)
+            if entry is not None and entry["key"] == self.checkpoint_key and chunk in entry["done"]:
+                entry["done"].remove(chunk)
+            logger.warning(
+                "Checkpoints: requests of chunk '%s' of season '%s' failed, not marked done",
+                chunk,
+                season,
+            )
+
+    def record_week(self, season: str, season_type: str, week: str) -> None:
+        chunk = week_chunk(season_type, week)
+        _, weeks = self._state()
+        with self._lock:
+            listed = weeks.setdefault(season, [])
+            if chunk not in listed:
+                listed.append(chunk)
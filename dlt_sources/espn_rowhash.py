@@ -0,0 +1,205 @@
+"""
+Row-hash change detection for the merge tables of the ESPN dlt source.
+
+Re-running a partition re-extracts rows that are mostly already loaded, unchanged.
+Merging them still stages every row and runs delete/insert merges over them. So each
+row gets a 64-bit content hash in `_row_hash`, and a filter step on the resource drops
+the rows whose hash is already stored in the destination table. Only new or changed
+rows reach the merge. The hash covers the primary key columns, so a stored hash means
+that key is loaded with exactly this content.
+
+Arrow record batches are hashed column-wise: each column is cast to text and the columns
+are joined into one value per row, which is hashed without building a dict per row. That
+encoding differs from the JSON of dict rows, so a table whose rows switch between dicts
+and Arrow (arrow_stats toggled) misses its stored hashes once and is merged in full.
+
+The stored hashes of a table are read from the destination on its first row. The read is
+limited to the run's scope: event tables to the events of the run's season, week or
+dates, season tables to its season. They are held as a sorted array of 64-bit ints (8
+bytes per row) and probed by binary search. If the destination cannot be read (first
+run, table or column missing, database locked by another process), nothing is filtered
+for that table.
+
+The filter runs before dlt hands a resource's items to its transformers. Resources whose
+rows feed transformers (seasons, events, competitors, teams, athletes, odds, ...) are
+therefore not filtered, or an unchanged event would cut off its changed plays.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Collection, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+import dlt
+import pyarrow as pa
+import pyarrow.compute as pc
+from dlt.extract.source import DltResource
+
+logger = logging.getLogger(__name__)
+
+ROW_HASH_COLUMN = "_row_hash"
+
+# Rows fetched per round trip when reading stored hashes
+FETCH_BATCH_ROWS = 100_000
+
+# Separators of an Arrow row's encoding: between a column's name and value, and between
+# columns
+_NAME_SEPARATOR = "\x1f"
+_COLUMN_SEPARATOR = "\x1e"
+
+
+def _digest(encoded: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "big", signed=True)
+
+
+def _hashed(name: str) -> bool:
+    return name != ROW_HASH_COLUMN and not name.startswith("_dlt")
+
+
+def row_hash(row: dict[str, Any]) -> int:
+    """64-bit content hash of a row, as a signed int (DuckDB BIGINT). None values are skipped."""
+    content = {k: v for k, v in row.items() if v is not None and _hashed(k)}
+    return _digest(json.dumps(content, sort_keys=True, default=str).encode("utf-8"))
+
+
+def batch_row_hashes(batch: pa.RecordBatch) -> list[int]:
+    """
+    64-bit content hash of each row of a record batch, computed over its columns: every
+    column is cast to text and joined with its name, nulls skipped, into one value per row.
+    Batches with columns that do not cast to text (nested types) are hashed row by row.
+    """
+    names = sorted(name for name in batch.schema.names if _hashed(name))
+    try:
+        columns = [
+            pc.binary_join_element_wise(
+                name, pc.cast(batch.column(name), pa.string()), _NAME_SEPARATOR
+            )
+            for name in names
+        ]
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+        return [row_hash(row) for row in batch.to_pylist()]
+    if not columns:
+        return [_digest(b"")] * batch.num_rows
+    joined = pc.binary_join_element_wise(*columns, _COLUMN_SEPARATOR, null_handling="skip")
+    return [_digest(value) for value in joined.cast(pa.binary()).to_pylist()]
+
+
+class _StoredHashes:
+    """Hashes of the rows stored in one table (within the run's scope), in sorted order."""
+
+    def __init__(self, hashes: array) -> None:
+        self._hashes = hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_left(self._hashes, value)
+        return i < len(self._hashes) and self._hashes[i] == value
+
+
+class RowHashFilter:
+    """
+    Adds `_row_hash` to the rows of merge resources and drops the rows already stored.
+
+    Args:
+        season_id: Season of the run. Tables with a `season_id_fk` column only read the
+            stored hashes of this season.
+        event_filter: SQL condition on the `events` table, with its parameters, selecting
+            the events of the run. Tables with an `event_id_fk` column only read the
+            stored hashes of these events.
+    """
+
+    def __init__(
+        self,
+        season_id: str | None = None,
+        event_filter: tuple[str, tuple[Any, ...]] | None = None,
+    ) -> None:
+        self.season_id = season_id
+        self.event_filter = event_filter
+        self._lock = threading.Lock()
+        self._stored: dict[str, _StoredHashes] = {}
+
+    def apply(self, resource: DltResource) -> DltResource:
+        """Adds the hash-and-filter step to a merge resource; other resources are left as is."""
+        if resource.write_disposition == "merge":
+            resource.add_yield_map(self._step(resource.table_name))
+        return resource
+
+    def _step(self, table: str) -> Any:
+        def _filter_unchanged(item: Any) -> Iterator[Any]:
+            if isinstance(item, pa.RecordBatch):
+                if not item.num_rows:
+                    return
+                hashes = batch_row_hashes(item)
+                stored = self._stored_hashes(table, item.schema.names)
+                keep = [h not in stored for h in hashes]
+                if any(keep):
+                    kept_hashes = [h for h, k in zip(hashes, keep, strict=True) if k]
+                    batch = item.filter(pa.array(keep)) if not all(keep) else item
+                    yield batch.append_column(ROW_HASH_COLUMN, pa.array(kept_hashes, pa.int64()))
+            elif isinstance(item, dict):
+                h = row_hash(item)
+                if h not in self._stored_hashes(table, item):
+                    item[ROW_HASH_COLUMN] = h
+                    yield item
+            else:
+                yield item
+
+        return _filter_unchanged
+
+    def _stored_hashes(self, table: str, columns: Collection[str]) -> _StoredHashes:
+        with self._lock:
+            stored = self._stored.get(table)
+            if stored is None:
+                stored = self._stored[table] = _StoredHashes(self._read_hashes(table, columns))
+                logger.info("Row hashes: %d stored rows of %s in scope", len(stored), table)
+            return stored
+
+    def _scope(self, columns: Collection[str]) -> tuple[str, tuple[Any, ...]]:
+        if "event_id_fk" in columns and self.event_filter:
+            condition, params = self.event_filter
+            return f"event_id_fk IN (SELECT id FROM {{events}} WHERE {condition})", params
+        if "season_id_fk" in columns and self.season_id:
+            return "season_id_fk = %s", (self.season_id,)
+        return "", ()
+
+    def _read_hashes(self, table: str, columns: Collection[str]) -> array:
+        # Caller holds the lock. The destination is only known while the pipeline extracts.
+        hashes = array("q")
+        condition, params = self._scope(columns)
+        try:
+            with dlt.current.pipeline().sql_client() as client:
+                conditions = [f"{ROW_HASH_COLUMN} IS NOT NULL"]
+                if condition:
+                    events = client.make_qualified_table_name("events")
+                    conditions.append(condition.format(events=events))
+                # Sorted by the database, so no second copy is needed to sort them here
+                query = (
+                    f"SELECT {ROW_HASH_COLUMN} FROM {client.make_qualified_table_name(table)} "
+                    f"WHERE {' AND '.join(conditions)} ORDER BY {ROW_HASH_COLUMN}"
+                )
+                with client.execute_query(query, *params) as cursor:
+                    while rows := cursor.fetchmany(FETCH_BATCH_ROWS):
+                        hashes.extend(r[0] for r in rows)
+        except Exception as e:
+            logger.info("Row hashes: none stored for %s (%s); loading all its rows", table, e)
+            return array("q")
+        return hashes
+
+
+def event_dates_condition(event_dates_filter: str) -> tuple[str, tuple[Any, ...]]:
+    """
+    `events` condition for an event_dates_filter ("YYYYMMDD" or "YYYYMMDD-YYYYMMDD").
+    Event dates are UTC and the filter's days are US Eastern, so the range is widened by
+    a day at the end.
+    """
+    first, _, last = event_dates_filter.partition("-")
+    start = datetime.strptime(first, "%Y%m%d").date()
+    end = datetime.strptime(last or first, "%Y%m%d").date() + timedelta(days=1)
+    return "substr(date, 1, 10) BETWEEN %s AND %s", (start.isoformat(), end.isoformat())
@@ -6,8 +6,12 @@ Seasons and Season Types.
 """
 
 import logging
-from collections.abc import Iterable
+import re
+import time
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime, timedelta
 from typing import Any
+from zoneinfo import ZoneInfo
 
 import dlt
 from dlt.common.typing import TDataItem
@@ -15,21 +19,244 @@ from dlt.extract.source import DltResource
 from dlt.sources.helpers.rest_client import RESTClient
 from dlt.sources.helpers.rest_client.paginators import PageNumberPaginator
 
+from dlt_sources.espn_archive import ResponseArchive
+from dlt_sources.espn_arrow import TidyRows
+from dlt_sources.espn_cache import EVENT_SETTLE_SECONDS, ResponseCache, parse_api_timestamp
+from dlt_sources.espn_fetch import FETCH_ENGINE_ASYNC, FETCH_ENGINE_THREADS, EspnFetcher
+from dlt_sources.espn_http import (
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_EXTRACT_WORKERS,
+    DEFAULT_KEEP_ALIVE_IDLE_SECONDS,
+    DEFAULT_READ_TIMEOUT_SECONDS,
+    EspnHttpTransport,
+)
+from dlt_sources.espn_logging import install_sampled_logging, payload
+from dlt_sources.espn_memory import (
+    DEFAULT_BUFFER_MAX_ITEMS,
+    MEMORY_BOUNDED_BUFFER_MAX_ITEMS,
+    MemoryGuard,
+)
+from dlt_sources.espn_metrics import EspnHttpMetrics
+from dlt_sources.espn_ratelimit import (
+    DEFAULT_MIN_RPS,
+    DEFAULT_RATE_LIMIT_RPS,
+    AdaptiveRateLimiter,
+    SharedRateLimiter,
+)
+from dlt_sources.espn_registry import (
+    SEASON_CHUNK,
+    EventStatusRegistry,
+    ExtractionCheckpoints,
+    LiveEventCursors,
+    MasterRefRegistry,
+    MasterRefStore,
+    cursor_start_page,
+    event_modified_marker,
+    week_chunk,
+)
+from dlt_sources.espn_rowhash import RowHashFilter, event_dates_condition
+from dlt_sources.espn_stats import (
+    PLAYER_BOX_SCORE_COLUMNS,
+    PREGAME_RECORD_COLUMNS,
+    TEAM_BOX_SCORE_COLUMNS,
+    box_score_values,
+    double_columns,
+    pregame_record_values,
+    stat_categories,
+)
+
 # --- Configuration & Constants ---
 API_LIMIT = 1000  # Max items per page for list endpoints
 
-# Configure basic logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+# What a season walk returns (see espn_source's `scope`)
+SCOPE_ALL = "all"
+SCOPE_SEASON = "season"
+SCOPE_LEAGUE = "league"
+SCOPES = (SCOPE_ALL, SCOPE_SEASON, SCOPE_LEAGUE)
+
+# ESPN group id covering all of Division I. Without it the league /events listing only
+# returns a featured subset of the day's games.
+DIVISION_I_GROUP_ID = "50"
+
+# "YYYYMMDD" or an inclusive "YYYYMMDD-YYYYMMDD" range, as the /events?dates= filter takes
+EVENT_DATES_FILTER_RE = re.compile(r"^\d{8}(-\d{8})?$")
+_SEASON_REF_RE = re.compile(r"/seasons/(\d+)")
+_TYPE_REF_RE = re.compile(r"/seasons/\d+/types/(\d+)")
+_WEEK_REF_RE = re.compile(r"/seasons/\d+/types/\d+/weeks/(\d+)")
+_EVENT_REF_RE = re.compile(r"/events/(\d+)")
+_PLAY_REF_RE = re.compile(r"/plays/(\d+)")
+
+# What an event handle keeps of an event document (see _event_handle)
+EVENT_HANDLE_FIELDS = ("id", "$ref", "date", "season_id_fk", "type_id_fk", "week_id_fk")
+EVENT_HANDLE_COMPETITION_REFS = (
+    "status",
+    "situation",
+    "predictor",
+    "odds",
+    "broadcasts",
+    "probabilities",
+    "powerindex",
+    "officials",
+    "details",
+    "plays",
+    "venue",
 )
+
+# Merge tables whose rows feed transformers: these need every row, so unchanged ones are
+# not dropped by skip_unchanged_rows (see espn_rowhash)
+ROW_HASH_EXEMPT_TABLES = (
+    "seasons",
+    "season_types",
+    "weeks",
+    "events",
+    "event_competitors",
+    "event_odds",
+    "event_broadcasts",
+    "teams",
+    "athletes",
+    "coach_team_assignments",
+)
+
+# dlt's default for `extract.max_parallel_items` (deferred items in flight)
+DEFAULT_MAX_PARALLEL_ITEMS = 20
+
+# Live mode: page size of the plays/probabilities tails, and the time zone whose
+# yesterday and today are polled (late games run past midnight Eastern)
+LIVE_PAGE_SIZE = 100
+LIVE_TIMEZONE = ZoneInfo("America/New_York")
+
+# Handlers and levels are left to the application (see __main__ below); this module only
+# rate-limits its own records, and formats them lazily (see espn_logging)
 logger = logging.getLogger(__name__)
+install_sampled_logging(logger)
+
+
+def _event_context_from_refs(event_detail: dict[str, Any]) -> dict[str, str]:
+    """Season, season type and week ids of an event, parsed from its own $refs."""
+    context = {}
+    for fk, field, ref_re in (
+        ("season_id_fk", "season", _SEASON_REF_RE),
+        ("type_id_fk", "seasonType", _TYPE_REF_RE),
+        ("week_id_fk", "week", _WEEK_REF_RE),
+    ):
+        ref = (event_detail.get(field) or {}).get("$ref") or ""
+        m = ref_re.search(ref)
+        if m:
+            context[fk] = m.group(1)
+    return context
+
+
+def _event_handle(event_detail: dict[str, Any]) -> dict[str, Any]:
+    """
+    The parts of an event document its sub-resource transformers read: ids, FKs, the
+    competitors and the $refs of the first competition, in the document's own shape.
+    """
+    handle = {key: event_detail[key] for key in EVENT_HANDLE_FIELDS if key in event_detail}
+    competitions = event_detail.get("competitions")
+    if competitions and isinstance(competitions, list) and isinstance(competitions[0], dict):
+        competition = competitions[0]
+        handle["competitions"] = [
+            {
+                key: {"$ref": competition[key]["$ref"]}
+                for key in EVENT_HANDLE_COMPETITION_REFS
+                if isinstance(competition.get(key), dict) and competition[key].get("$ref")
+            }
+        ]
+        if "competitors" in competition:
+            handle["competitions"][0]["competitors"] = competition["competitors"]
+    return handle
+
+
+def _probability_play_id(prob_item: dict[str, Any]) -> str | None:
+    """Play id of a win probability entry: `playId`, or the id in its `play.$ref`."""
+    if prob_item.get("playId") is not None:
+        return str(prob_item["playId"])
+    m = _PLAY_REF_RE.search((prob_item.get("play") or {}).get("$ref") or "")
+    return m.group(1) if m else None
+
+
+def _live_event_dates() -> str:
+    """Yesterday and today in LIVE_TIMEZONE, as an /events?dates= range."""
+    today = datetime.now(LIVE_TIMEZONE).date()
+    return f"{today - timedelta(days=1):%Y%m%d}-{today:%Y%m%d}"
 
 
 # --- Main Source Definition ---
+def configure_pipeline(
+    pipeline: dlt.Pipeline,
+    fetch_engine: str = FETCH_ENGINE_THREADS,
+    max_concurrency: int = 500,
+    max_parallel_items: int | None = None,
+    memory_limit_mb: float | None = None,
+    arrow_stats: bool = False,
+) -> None:
+    """
+    Sets the dlt settings that runs of `espn_source` with these arguments need, scoped to
+    `pipeline`, so they do not leak into other pipelines of the process. Every setting is
+    written on each call, so a run does not inherit an earlier run's values either. They
+    can also be set in config.toml or env vars under the pipeline's name instead, e.g.
+    NCAA_BASKETBALL_PROD_PIPELINE__EXTRACT__MAX_PARALLEL_ITEMS.
+
+    Args:
+        pipeline: The pipeline the source will run on.
+        fetch_engine, max_concurrency: As passed to `espn_source`. dlt only keeps
+            `extract.max_parallel_items` deferred items in flight, so for the "async"
+            engine it defaults to max_concurrency for the extra concurrency to be used.
+        max_parallel_items: Bound on deferred fetcher items in flight (dlt's
+            `extract.max_parallel_items`). Once reached, dlt stops pulling refs from the
+            listers, so this is the queue size between listers and fetchers.
+        memory_limit_mb: As passed to `espn_source`. With a budget, dlt's per-table write
+            buffers are kept small.
+        arrow_stats: As passed to `espn_source`. dlt only adds _dlt_id and _dlt_load_id to
+            Arrow items when asked to, and tables first loaded from dict rows have both
+            as not-null columns.
+    """
+    if not max_parallel_items:
+        is_async = fetch_engine == FETCH_ENGINE_ASYNC
+        max_parallel_items = max_concurrency if is_async else DEFAULT_MAX_PARALLEL_ITEMS
+    buffer_max_items = (
+        MEMORY_BOUNDED_BUFFER_MAX_ITEMS if memory_limit_mb else DEFAULT_BUFFER_MAX_ITEMS
+    )
+    section = pipeline.pipeline_name
+    dlt.config[f"{section}.extract.max_parallel_items"] = max_parallel_items
+    dlt.config[f"{section}.data_writer.buffer_max_items"] = buffer_max_items
+    dlt.config[f"{section}.normalize.parquet_normalizer.add_dlt_id"] = arrow_stats
+    dlt.config[f"{section}.normalize.parquet_normalizer.add_dlt_load_id"] = arrow_stats
+
+
 @dlt.source(name="espn_source", max_table_nesting=0)
 def espn_source(
     league_base_url: str = dlt.config.value,
     season_year_filter: str | None = None,
+    season_type_filter: str | None = None,
+    week_filter: str | None = None,
+    scope: str = SCOPE_ALL,
+    include_events: bool = True,
+    event_dates_filter: str | None = None,
+    fetch_engine: str = FETCH_ENGINE_THREADS,
+    max_concurrency: int = 500,
+    memory_limit_mb: float | None = None,
+    http_pool_size: int | None = None,
+    http_keep_alive: bool = True,
+    http_keep_alive_idle_seconds: int = DEFAULT_KEEP_ALIVE_IDLE_SECONDS,
+    http_connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    http_read_timeout: float = DEFAULT_READ_TIMEOUT_SECONDS,
+    http_metrics: EspnHttpMetrics | None = None,
+    rate_limit_rps: float | None = DEFAULT_RATE_LIMIT_RPS,
+    rate_limit_min_rps: float = DEFAULT_MIN_RPS,
+    rate_limit_shared_path: str | None = None,
+    response_cache_path: str | None = None,
+    response_cache_ttl_rules: dict[str, int] | None = None,
+    response_archive_path: str | None = None,
+    replay: bool = False,
+    master_data_max_age_hours: float = 7 * 24,
+    master_ref_store: MasterRefStore | None = None,
+    events_full_refresh: bool = False,
+    arrow_stats: bool = False,
+    wide_stats: bool = False,
+    skip_unchanged_rows: bool = False,
+    live_mode: bool = False,
+    checkpoint_key: str | None = None,
 ) -> Iterable[DltResource]:
     """
     Defines dlt resources for fetching NCAA Men's Basketball data from the ESPN API,
@@ -41,6 +268,125 @@ def espn_source(
                                 This will be read from dlt.config.value
                                 (e.g., env var SOURCES__ESPN_SOURCE__BASE_URL).
         season_year_filter (str | None): If provided, only this season will be processed.
+        season_type_filter (str | None): If provided, only this season type (e.g. "2" for the
+                                         regular season) of the season is walked.
+        week_filter (str | None): If provided, only this week of the season type is walked,
+                                  and only its season type, week and event resources (plus
+                                  the venues, providers and media they reference) are
+                                  returned. Requires season_year_filter and
+                                  season_type_filter.
+        scope (str): "all" (default) returns everything. "season" leaves out the league-level
+                     master data (league_info, franchises, master awards), which does not
+                     depend on the season; the league document is still read for its id
+                     but not written. "league" returns only that master data. Master refs
+                     discovered inside a season (venues, positions, providers, media,
+                     coaches) stay with the season, deduplicated across runs by
+                     master_data_max_age_hours.
+        include_events (bool): With False, a season walk stops at the weeks: the season-level
+                               data (teams, athletes, coaches, season awards, ...) is
+                               returned without any events. Together with week_filter
+                               runs this splits a season into resumable chunks.
+        event_dates_filter (str | None): "YYYYMMDD" or "YYYYMMDD-YYYYMMDD". If provided, only
+                                         the events on these dates are processed. They are
+                                         listed from the league's /events collection instead
+                                         of walking seasons, types and weeks, and only the
+                                         event resources (plus the venues, providers and
+                                         media they reference) are returned.
+                                         season_year_filter is ignored.
+        fetch_engine (str): How the deferred detail fetchers run. "threads" (default) uses
+                            dlt's extract thread pool; "async" runs them on dlt's extract
+                            event loop with aiohttp (requires the `async` extra).
+        max_concurrency (int): Max in-flight detail requests for the "async" engine. dlt's
+                               `extract.max_parallel_items` has to be raised to match,
+                               see `configure_pipeline`.
+        memory_limit_mb (float | None): Memory budget of the extraction in MiB. Fetchers
+                                        wait while RSS is above 80% of it, which backs up
+                                        into the listers. `configure_pipeline` also keeps
+                                        dlt's per-table write buffers small. Best effort: a
+                                        single oversized item can still exceed it.
+        http_pool_size (int | None): Connections in the shared HTTP pool. Defaults to dlt's
+                                     `extract.workers` plus one for the listers running on
+                                     the main thread.
+        http_keep_alive (bool): Reuse pooled connections between requests.
+        http_keep_alive_idle_seconds (int): Idle seconds before TCP keep-alive probes.
+        http_connect_timeout (float): Per-request connect timeout in seconds.
+        http_read_timeout (float): Per-request read timeout in seconds.
+        http_metrics (EspnHttpMetrics | None): Collects count, latency percentiles, bytes,
+                                               status codes and retries per endpoint
+                                               pattern for every request of this source.
+                                               Pass one in to read it after the run.
+        rate_limit_rps (float | None): Ceiling for requests per second across both clients
+                                       and both engines. The actual rate adapts below it,
+                                       halving on HTTP 429/503 or timeouts and creeping
+                                       back up while requests succeed. None disables it.
+        rate_limit_min_rps (float): Floor the adaptive rate is never cut below.
+        rate_limit_shared_path (str | None): SQLite file holding the rate limit budget. All
+                                             processes using the same file (e.g. parallel
+                                             season-partition runs) share one budget.
+                                             Per-process when not set.
+        response_cache_path (str | None): SQLite file for the on-disk response cache. The
+                                          cache is disabled when not set.
+        response_cache_ttl_rules (dict[str, int] | None): Extra {URL regex: TTL seconds}
+                                          rules, checked before the defaults in
+                                          `espn_cache.TTL_RULES`.
+        response_archive_path (str | None): Directory of the raw response archive (see
+                                            espn_archive). Every response fetched from
+                                            the network is appended to it. Disabled when
+                                            not set.
+        replay (bool): Read every response from the archive at response_archive_path
+                       instead of the network, e.g. to rebuild the tables after a parsing
+                       change. The response cache and rate limiter are not used, and a
+                       URL the archive does not hold fails like a request error. Combine
+                       with events_full_refresh and master_data_max_age_hours=0 to
+                       rebuild everything the archive holds.
+        master_data_max_age_hours (float): Master refs (venues, positions, providers, media,
+                                           coaches, franchises, master awards) fetched by a
+                                           run within this window are skipped. 0 disables.
+        master_ref_store (MasterRefStore | None): Shared SQLite store of the fetched master
+                                                  refs, so runs of different partitions
+                                                  skip each other's. Commit it after the
+                                                  run is loaded. None (default) keeps them
+                                                  in the pipeline's dlt state.
+        events_full_refresh (bool): Re-extract every event. By default an event that an
+                                    earlier run saw final (after the game settled) is
+                                    skipped with all its sub-resources until its
+                                    `modified` marker changes.
+        arrow_stats (bool): Yield the tidy stat tables (event_team_stats,
+                            event_player_stats, event_pregame_records,
+                            event_powerindex_stats) as one Arrow record batch per response
+                            instead of a dict per stat, which dlt writes and normalizes
+                            column-wise. False (default) yields dicts. Needs the
+                            pipeline settings of `configure_pipeline(arrow_stats=True)`.
+        wide_stats (bool): Also return event_team_stats_wide, event_player_stats_wide and
+                           event_pregame_records_wide: one row per team (or athlete) and
+                           event, with a double column per statistic (see espn_stats),
+                           filled from the same responses as the tidy tables.
+        skip_unchanged_rows (bool): Add a `_row_hash` content hash to the rows of the merge
+                                    tables and drop the rows whose hash the destination
+                                    already holds, so only new or changed rows are
+                                    merged (see espn_rowhash). Rows of the tables that
+                                    feed transformers (ROW_HASH_EXEMPT_TABLES: seasons,
+                                    events, competitors, teams, athletes, odds, ...)
+                                    always pass, as they drive the fetches below them.
+        live_mode (bool): Poll the events on event_dates_filter (default: yesterday and
+                          today, US Eastern) for live updates. Only event status,
+                          situation, plays and win probabilities are returned; plays and
+                          probabilities of in-progress games are read from a per-event
+                          sequenceNumber cursor on and appended. Meant to be run every
+                          minute or less during game nights.
+        checkpoint_key (str | None): Checkpointing for runs of one chunk of a season: its
+                                     season-level data (include_events=False) or one week
+                                     (week_filter). A chunk is marked done under this key
+                                     in the dlt state committed with its load package, and
+                                     a later run with the same key (e.g. the partition
+                                     key) skips it, so a crashed season resumes from the
+                                     first unfinished chunk. A chunk with requests that
+                                     failed for good is not marked done. The run of the
+                                     last chunk clears the season's checkpoints. None
+                                     (default) disables.
+
+        All of these can be set under [sources.espn_source] in config.toml or through env
+        vars such as SOURCES__ESPN_SOURCE__HTTP_POOL_SIZE.
 
     Returns:
         Iterable[DltResource]: An iterable containing the dlt resources.
@@ -49,7 +395,66 @@ def espn_source(
         league_base_url = (
             "http://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball"
         )
-        logger.warning(f"league_base_url not configured, using default: {league_base_url}")
+        logger.warning("league_base_url not configured, using default: %s", league_base_url)
+    if week_filter and not (season_year_filter and season_type_filter):
+        raise ValueError("week_filter requires season_year_filter and season_type_filter.")
+    if scope not in SCOPES:
+        raise ValueError(f"scope must be one of {SCOPES}, got '{scope}'.")
+    if live_mode and not event_dates_filter:
+        event_dates_filter = _live_event_dates()
+    if event_dates_filter and not EVENT_DATES_FILTER_RE.match(event_dates_filter):
+        raise ValueError(
+            f"event_dates_filter must be 'YYYYMMDD' or 'YYYYMMDD-YYYYMMDD', got '{event_dates_filter}'."
+        )
+
+    # One pooled transport shared by both clients so all threads reuse the same
+    # keep-alive connections to the ESPN host
+    if http_pool_size is None:
+        http_pool_size = (dlt.config.get("extract.workers", int) or DEFAULT_EXTRACT_WORKERS) + 1
+    if replay and not response_archive_path:
+        raise ValueError("replay requires response_archive_path.")
+    response_archive = ResponseArchive(response_archive_path) if response_archive_path else None
+    # A replay never touches the network, so it needs neither the cache nor the rate limit
+    response_cache = (
+        ResponseCache(response_cache_path, ttl_rules=response_cache_ttl_rules)
+        if response_cache_path and not replay
+        else None
+    )
+    rate_limiter: AdaptiveRateLimiter | None = None
+    if replay:
+        logger.info("Replaying responses from the archive at %s", response_archive_path)
+    elif rate_limit_rps and rate_limit_shared_path:
+        rate_limiter = SharedRateLimiter(
+            rate_limit_shared_path, max_rps=rate_limit_rps, min_rps=rate_limit_min_rps
+        )
+    elif rate_limit_rps:
+        rate_limiter = AdaptiveRateLimiter(max_rps=rate_limit_rps, min_rps=rate_limit_min_rps)
+    # Season chunks completed by earlier runs (in dlt source state), to resume after crashes
+    checkpoints = ExtractionCheckpoints(checkpoint_key)
+    checkpoint_chunk = None
+    if season_year_filter and week_filter:
+        checkpoint_chunk = week_chunk(season_type_filter, week_filter)
+    elif season_year_filter and not include_events and not event_dates_filter:
+        checkpoint_chunk = SEASON_CHUNK
+
+    def _on_failed_request(url: str) -> None:
+        # The chunk misses data, so it must not count as done
+        if checkpoint_chunk:
+            checkpoints.mark_failed(season_year_filter, checkpoint_chunk)
+
+    transport = EspnHttpTransport(
+        pool_size=http_pool_size,
+        keep_alive=http_keep_alive,
+        keep_alive_idle_seconds=http_keep_alive_idle_seconds,
+        connect_timeout=http_connect_timeout,
+        read_timeout=http_read_timeout,
+        cache=response_cache,
+        rate_limiter=rate_limiter,
+        metrics=http_metrics,
+        archive=response_archive,
+        replay=replay,
+        on_failure=_on_failed_request,
+    )
 
     # Client for LISTING items from collection endpoints (e.g., a list of season $refs)
     # This client's base_url will effectively be ignored if full URLs are passed to paginate/get.
@@ -57,16 +462,51 @@ def espn_source(
     list_paginator = PageNumberPaginator(
         page_param="page", total_path="pageCount", base_page=1, stop_after_empty_page=True
     )
-    list_client = RESTClient(base_url=None, paginator=list_paginator, data_selector="items")
+    list_client = RESTClient(
+        base_url=None,
+        paginator=list_paginator,
+        data_selector="items",
+        session=transport.session,
+    )
 
     # Client for fetching single DETAIL objects from absolute $ref URLs.
     # base_url=None because $ref URLs are absolute.
-    detail_client = RESTClient(base_url=None)  # No paginator needed for single detail fetches
+    # No paginator needed for single detail fetches
+    detail_client = RESTClient(base_url=None, session=transport.session)
+
+    # Remembers master-data refs across runs (in the store or dlt source state) to skip
+    # refetching them
+    master_refs = MasterRefRegistry(
+        max_age_seconds=master_data_max_age_hours * 3600, store=master_ref_store
+    )
+    # Remembers finalized events across runs (in dlt source state) to skip their whole tree
+    event_statuses = EventStatusRegistry(full_refresh=events_full_refresh)
+    # Per-event plays/probabilities cursors of the live polling mode (in dlt source state)
+    live_cursors = LiveEventCursors()
+
+    memory_guard = None
+    if memory_limit_mb:
+        memory_guard = MemoryGuard(memory_limit_mb)
+
+    # Runs the @fetcher.defer fetchers on the selected engine (threads or asyncio)
+    fetcher = EspnFetcher(
+        detail_client,
+        transport,
+        engine=fetch_engine,
+        max_concurrency=max_concurrency,
+        memory_guard=memory_guard,
+    )
+    logger.info(
+        "Using '%s' fetch engine (max_concurrency=%s, memory_limit_mb=%s).",
+        fetch_engine,
+        max_concurrency,
+        memory_limit_mb,
+    )
 
     # --- League Root Information Resource ---
     @dlt.resource(name="league_info", write_disposition="replace", primary_key="id")
     def league_info_resource() -> Iterable[dict[str, Any]]:
-        logger.info(f"Fetching league root information from: {league_base_url}")
+        logger.info("Fetching league root information from: %s", league_base_url)
         try:
             response = detail_client.get(league_base_url)
             response.raise_for_status()
@@ -86,10 +526,12 @@ def espn_source(
 
             yield league_data
             logger.info(
-                f"Successfully fetched league root for {league_data.get('name', league_base_url)}."
+                "Successfully fetched league root for %s.", league_data.get("name", league_base_url)
             )
         except Exception as e:
-            logger.error(f"Error fetching league root from {league_base_url}: {e}", exc_info=True)
+            logger.error(
+                "Error fetching league root from %s: %s", league_base_url, e, exc_info=True
+            )
             raise  # Stop pipeline if league root fails
 
     # --- Seasons Processing Chain ---
@@ -106,6 +548,18 @@ def espn_source(
         league_id = league_doc.get("id")
 
         if current_season_filter:
+            if checkpoint_chunk:
+                if checkpoints.is_done(current_season_filter, checkpoint_chunk):
+                    logger.info(
+                        "Chunk '%s' of season '%s' was completed by an earlier run; skipping it.",
+                        checkpoint_chunk,
+                        current_season_filter,
+                    )
+                    return
+                # Only committed if this run's load package is, and taken back if a request
+                # of the chunk fails for good
+                checkpoints.mark_done(current_season_filter, checkpoint_chunk)
+
             # Construct the direct URL for the specific season
             # Ensure league_base_url does not end with a slash if season_year_filter
             # starts with one, or vice-versa
@@ -113,18 +567,20 @@ def espn_source(
             # but for this API, direct construction from league_base_url is likely fine.
             season_detail_url = f"{league_base_url}/seasons/{current_season_filter}"
             logger.info(
-                f"Season filter '{current_season_filter}'. Yielding direct ref: {season_detail_url}"
+                "Season filter '%s'. Yielding direct ref: %s",
+                current_season_filter,
+                season_detail_url,
             )
             yield {"$ref": season_detail_url, "league_id_fk": str(league_id)}
         else:
             seasons_collection_url = league_doc.get("seasons", {}).get("$ref")
             if not seasons_collection_url:
                 logger.error(
-                    f"League doc for '{league_id}' missing 'seasons.$ref'. Cannot list seasons."
+                    "League doc for '%s' missing 'seasons.$ref'. Cannot list seasons.", league_id
                 )
                 return
 
-            logger.debug(f"Listing all season refs from collection: {seasons_collection_url}")
+            logger.debug("Listing all season refs from collection: %s", seasons_collection_url)
             try:
                 # The seasons_collection_url is absolute, so list_client will use it directly.
                 for season_ref_page in list_client.paginate(
@@ -139,12 +595,16 @@ def espn_source(
                             yield season_ref_item_augmented
                         else:
                             logger.warning(
-                                f"Season ref item missing '$ref' key in page from "
-                                f"{seasons_collection_url}. Item: {season_ref_item}"
+                                "Season ref item missing '$ref' key in page from %s. Item: %s",
+                                seasons_collection_url,
+                                payload(season_ref_item),
                             )
             except Exception as e:
                 logger.error(
-                    f"Error listing season refs from {seasons_collection_url}: {e}", exc_info=True
+                    "Error listing season refs from %s: %s",
+                    seasons_collection_url,
+                    e,
+                    exc_info=True,
                 )
 
     @dlt.transformer(
@@ -153,8 +613,10 @@ def espn_source(
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def season_detail_fetcher_transformer(season_ref_item: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def season_detail_fetcher_transformer(
+        season_ref_item: dict[str, Any],
+    ) -> TDataItem | None:
         """
         Fetches full season details for an individual season $ref object.
         """
@@ -162,14 +624,17 @@ def espn_source(
         league_id_fk = season_ref_item.get("league_id_fk")  # Get FK from lister
 
         if not detail_url:
-            logger.warning(f"Season ref item missing '$ref'. Item: {season_ref_item}")
+            logger.warning("Season ref item missing '$ref'. Item: %s", payload(season_ref_item))
             return None
 
-        logger.debug(f"Fetching season detail from: {detail_url}")
+        logger.debug("Fetching season detail from: %s", detail_url)
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            season_detail = response.json()
+            season_detail = await fetcher.get_json(detail_url)
+
+            # A season that has ended will not change anymore; let the cache keep it
+            season_end = parse_api_timestamp(season_detail.get("endDate"))
+            if response_cache and season_end and season_end < time.time():
+                response_cache.mark_final(detail_url, final_since=season_end)
 
             api_season_year = season_detail.get("year")
             if api_season_year is not None:
@@ -179,12 +644,13 @@ def espn_source(
                 return season_detail
             else:
                 logger.warning(
-                    f"Fetched season detail from {detail_url} missing 'year'. "
-                    f"Detail: {season_detail}"
+                    "Fetched season detail from %s missing 'year'. Detail: %s",
+                    detail_url,
+                    payload(season_detail),
                 )
                 return None
         except Exception as e:
-            logger.error(f"Error during API operation for {detail_url}: {e}", exc_info=True)
+            logger.error("Error during API operation for %s: %s", detail_url, e, exc_info=True)
             return None
 
     # --- Season Types Processing Chain (dependent on season_details) ---
@@ -196,6 +662,7 @@ def espn_source(
         """
         Extracts the 'types.$ref' (collection URL for season types) from a season_detail object,
         paginates through it, and yields individual season type $ref objects.
+        If a season_type_filter is present, yields a direct $ref to that type instead.
         Each yielded $ref object is augmented with season_id_fk.
         """
         season_id = season_detail.get("id")  # This is the year, e.g., "2024"
@@ -203,19 +670,27 @@ def espn_source(
 
         if not season_id:
             logger.warning(
-                f"Season detail missing 'id'. Skipping season types. Detail: {season_detail}"
+                "Season detail missing 'id'. Skipping season types. Detail: %s",
+                payload(season_detail),
             )
             return
+        if season_type_filter:
+            yield {
+                "$ref": f"{league_base_url}/seasons/{season_id}/types/{season_type_filter}",
+                "season_id_fk": str(season_id),
+            }
+            return
         if not season_types_collection_url:
             logger.info(
-                f"Season detail for season '{season_id}' missing 'types.$ref'. "
-                f"No season types to list."
+                "Season detail for season '%s' missing 'types.$ref'. No season types to list.",
+                season_id,
             )
             return
 
         logger.debug(
-            f"Listing season type refs for season '{season_id}' "
-            f"from collection: {season_types_collection_url}"
+            "Listing season type refs for season '%s' from collection: %s",
+            season_id,
+            season_types_collection_url,
         )
         try:
             for type_ref_page in list_client.paginate(
@@ -228,13 +703,16 @@ def espn_source(
                         yield type_ref_item_augmented
                     else:
                         logger.warning(
-                            f"Season type ref item missing '$ref' key in page "
-                            f"from {season_types_collection_url}. Item: {type_ref_item}"
+                            "Season type ref item missing '$ref' key in page from %s. Item: %s",
+                            season_types_collection_url,
+                            payload(type_ref_item),
                         )
         except Exception as e:
             logger.error(
-                f"Error listing season type refs for season '{season_id}' "
-                f"from {season_types_collection_url}: {e}",
+                "Error listing season type refs for season '%s' from %s: %s",
+                season_id,
+                season_types_collection_url,
+                e,
                 exc_info=True,
             )
 
@@ -244,8 +722,10 @@ def espn_source(
         write_disposition="merge",
         primary_key=["id", "season_id_fk"],
     )
-    @dlt.defer
-    def season_type_detail_fetcher_transformer(type_ref_item: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def season_type_detail_fetcher_transformer(
+        type_ref_item: dict[str, Any],
+    ) -> TDataItem | None:
         """
         Fetches full season type details for an individual season type $ref object.
         """
@@ -253,18 +733,20 @@ def espn_source(
         season_id_fk = type_ref_item.get("season_id_fk")
 
         if not detail_url:
-            logger.warning(f"Season type ref item missing '$ref'. Item: {type_ref_item}")
+            logger.warning("Season type ref item missing '$ref'. Item: %s", payload(type_ref_item))
             return None
         if not season_id_fk:  # Should always be present from lister
-            logger.warning(f"Season type ref item missing 'season_id_fk'. Item: {type_ref_item}")
+            logger.warning(
+                "Season type ref item missing 'season_id_fk'. Item: %s", payload(type_ref_item)
+            )
             # Potentially skip or try to parse from URL if robustly possible
             return None
 
-        logger.debug(f"Fetching season type detail for season '{season_id_fk}' from: {detail_url}")
+        logger.debug(
+            "Fetching season type detail for season '%s' from: %s", season_id_fk, detail_url
+        )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            type_detail = response.json()
+            type_detail = await fetcher.get_json(detail_url)
 
             # API 'id' for type is the type's own ID (e.g., "1", "2")
             api_type_id = type_detail.get("id")
@@ -274,13 +756,17 @@ def espn_source(
                 return type_detail
             else:
                 logger.warning(
-                    f"Fetched season type detail from {detail_url} missing 'id'. "
-                    f"Detail: {type_detail}"
+                    "Fetched season type detail from %s missing 'id'. Detail: %s",
+                    detail_url,
+                    payload(type_detail),
                 )
                 return None
         except Exception as e:
             logger.error(
-                f"Error during API operation for {detail_url} (season_id_fk: {season_id_fk}): {e}",
+                "Error during API operation for %s (season_id_fk: %s): %s",
+                detail_url,
+                season_id_fk,
+                e,
                 exc_info=True,
             )
             return None
@@ -294,6 +780,7 @@ def espn_source(
         """
         Extracts the 'weeks.$ref' (collection URL for weeks) from a season_type_detail object,
         paginates through it, and yields individual week $ref objects.
+        If a week_filter is present, yields a direct $ref to that week instead.
         Each yielded $ref object is augmented with season_id_fk and type_id_fk.
         """
         season_id_fk = season_type_detail.get("season_id_fk")
@@ -302,24 +789,40 @@ def espn_source(
 
         if not season_id_fk:
             logger.warning(
-                f"Season type detail missing 'season_id_fk'. Skipping weeks. Detail: {season_type_detail}"
+                "Season type detail missing 'season_id_fk'. Skipping weeks. Detail: %s",
+                payload(season_type_detail),
             )
             return
         if not type_id_fk:
             logger.warning(
-                f"Season type detail missing 'id' (type_id_fk). Skipping weeks. Detail: {season_type_detail}"
+                "Season type detail missing 'id' (type_id_fk). Skipping weeks. Detail: %s",
+                payload(season_type_detail),
             )
             return
+        if week_filter:
+            yield {
+                "$ref": (
+                    f"{league_base_url}/seasons/{season_id_fk}/types/{type_id_fk}"
+                    f"/weeks/{week_filter}"
+                ),
+                "season_id_fk": str(season_id_fk),
+                "type_id_fk": str(type_id_fk),
+            }
+            return
         if not weeks_collection_url:
             logger.info(
-                f"Season type detail for type '{type_id_fk}' in season '{season_id_fk}' "
-                f"missing 'weeks.$ref'. No weeks to list."
+                "Season type detail for type '%s' in season '%s' "
+                "missing 'weeks.$ref'. No weeks to list.",
+                type_id_fk,
+                season_id_fk,
             )
             return
 
         logger.debug(
-            f"Listing week refs for type '{type_id_fk}', season '{season_id_fk}' "
-            f"from collection: {weeks_collection_url}"
+            "Listing week refs for type '%s', season '%s' from collection: %s",
+            type_id_fk,
+            season_id_fk,
+            weeks_collection_url,
         )
         try:
             for week_ref_page in list_client.paginate(
@@ -333,13 +836,17 @@ def espn_source(
                         yield week_ref_item_augmented
                     else:
                         logger.warning(
-                            f"Week ref item missing '$ref' key in page "
-                            f"from {weeks_collection_url}. Item: {week_ref_item}"
+                            "Week ref item missing '$ref' key in page from %s. Item: %s",
+                            weeks_collection_url,
+                            payload(week_ref_item),
                         )
         except Exception as e:
             logger.error(
-                f"Error listing week refs for type '{type_id_fk}', season '{season_id_fk}' "
-                f"from {weeks_collection_url}: {e}",
+                "Error listing week refs for type '%s', season '%s' from %s: %s",
+                type_id_fk,
+                season_id_fk,
+                weeks_collection_url,
+                e,
                 exc_info=True,
             )
 
@@ -349,8 +856,8 @@ def espn_source(
         write_disposition="merge",
         primary_key=["id", "type_id_fk", "season_id_fk"],
     )
-    @dlt.defer
-    def week_detail_fetcher_transformer(week_ref_item: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def week_detail_fetcher_transformer(week_ref_item: dict[str, Any]) -> TDataItem | None:
         """
         Fetches full week details for an individual week $ref object.
         The API 'number' field is used as the primary key 'id'.
@@ -360,36 +867,45 @@ def espn_source(
         type_id_fk = week_ref_item.get("type_id_fk")
 
         if not detail_url:
-            logger.warning(f"Week ref item missing '$ref'. Item: {week_ref_item}")
+            logger.warning("Week ref item missing '$ref'. Item: %s", payload(week_ref_item))
             return None
         if not season_id_fk or not type_id_fk:
             logger.warning(
-                f"Week ref item missing 'season_id_fk' or 'type_id_fk'. Item: {week_ref_item}"
+                "Week ref item missing 'season_id_fk' or 'type_id_fk'. Item: %s",
+                payload(week_ref_item),
             )
             return None
 
         logger.debug(
-            f"Fetching week detail for type '{type_id_fk}', season '{season_id_fk}' from: {detail_url}"
+            "Fetching week detail for type '%s', season '%s' from: %s",
+            type_id_fk,
+            season_id_fk,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            week_detail = response.json()
+            week_detail = await fetcher.get_json(detail_url)
 
             api_week_number = week_detail.get("number")
             if api_week_number is not None:
+                checkpoints.record_week(str(season_id_fk), str(type_id_fk), str(api_week_number))
                 week_detail["id"] = str(api_week_number)  # Use API 'number' as 'id'
                 week_detail["season_id_fk"] = str(season_id_fk)
                 week_detail["type_id_fk"] = str(type_id_fk)
                 return week_detail
             else:
                 logger.warning(
-                    f"Fetched week detail from {detail_url} missing 'number'. Detail: {week_detail}"
+                    "Fetched week detail from %s missing 'number'. Detail: %s",
+                    detail_url,
+                    payload(week_detail),
                 )
                 return None
         except Exception as e:
             logger.error(
-                f"Error during API operation for {detail_url} (type_id_fk: {type_id_fk}, season_id_fk: {season_id_fk}): {e}",
+                "Error during API operation for %s (type_id_fk: %s, season_id_fk: %s): %s",
+                detail_url,
+                type_id_fk,
+                season_id_fk,
+                e,
                 exc_info=True,
             )
             return None
@@ -411,8 +927,9 @@ def espn_source(
 
         if not all([season_id_fk, type_id_fk, week_id_fk]):
             logger.warning(
-                f"Week detail missing one or more FKs (season_id_fk, type_id_fk, week_id_fk). "
-                f"Skipping events. Detail: {week_detail}"
+                "Week detail missing one or more FKs (season_id_fk, type_id_fk, week_id_fk). "
+                "Skipping events. Detail: %s",
+                payload(week_detail),
             )
             return
 
@@ -423,11 +940,16 @@ def espn_source(
         )
 
         logger.debug(
-            f"Listing event refs for week '{week_id_fk}' (type '{type_id_fk}', season '{season_id_fk}') "
-            f"from constructed collection URL: {events_collection_url}"
+            "Listing event refs for week '%s' (type '%s', season '%s') "
+            "from constructed collection URL: %s",
+            week_id_fk,
+            type_id_fk,
+            season_id_fk,
+            events_collection_url,
         )
         try:
-            for event_ref_page in list_client.paginate(
+            # Pages 2..N are fetched concurrently and yielded in page order
+            for event_ref_page in fetcher.iter_pages(
                 events_collection_url, params={"limit": API_LIMIT}
             ):
                 for event_ref_item in event_ref_page:
@@ -439,28 +961,79 @@ def espn_source(
                         yield event_ref_item_augmented
                     else:
                         logger.warning(
-                            f"Event ref item missing '$ref' key in page "
-                            f"from {events_collection_url}. Item: {event_ref_item}"
+                            "Event ref item missing '$ref' key in page from %s. Item: %s",
+                            events_collection_url,
+                            payload(event_ref_item),
                         )
         except Exception as e:
             logger.error(
-                f"Error listing event refs for week '{week_id_fk}' (type '{type_id_fk}', season '{season_id_fk}') "
-                f"from {events_collection_url}: {e}",
+                "Error listing event refs for week '%s' (type '%s', season '%s') from %s: %s",
+                week_id_fk,
+                type_id_fk,
+                season_id_fk,
+                events_collection_url,
+                e,
+                exc_info=True,
+            )
+
+    # --- Date-Window Event Listing (used instead of the season walk with event_dates_filter) ---
+    @dlt.resource(name="dated_event_refs_lister")
+    def dated_event_refs_lister_resource() -> Iterable[dict[str, Any]]:
+        """
+        Lists the events on the dates in event_dates_filter straight from the league's
+        /events collection and yields their $ref objects. Season, type and week FKs are not
+        known here; the event detail fetcher takes them from the event's own refs.
+        """
+        events_collection_url = f"{league_base_url}/events"
+        logger.info(
+            "Listing event refs for dates '%s' from %s", event_dates_filter, events_collection_url
+        )
+        try:
+            for event_ref_page in fetcher.iter_pages(
+                events_collection_url,
+                params={
+                    "dates": event_dates_filter,
+                    "groups": DIVISION_I_GROUP_ID,
+                    "limit": API_LIMIT,
+                },
+            ):
+                for event_ref_item in event_ref_page:
+                    if "$ref" in event_ref_item:
+                        yield event_ref_item.copy()
+                    else:
+                        logger.warning(
+                            "Event ref item missing '$ref' key in page from %s. Item: %s",
+                            events_collection_url,
+                            payload(event_ref_item),
+                        )
+        except Exception as e:
+            logger.error(
+                "Error listing event refs for dates '%s' from %s: %s",
+                event_dates_filter,
+                events_collection_url,
+                e,
                 exc_info=True,
             )
 
     @dlt.transformer(
         name="events",  # This will be the table name for event details
-        data_from=event_refs_lister_transformer,
+        data_from=(
+            dated_event_refs_lister_resource
+            if event_dates_filter
+            else event_refs_lister_transformer
+        ),
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def event_detail_fetcher_transformer(event_ref_item: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def event_detail_fetcher_transformer(event_ref_item: dict[str, Any]) -> TDataItem | None:
         """
         Fetches full event (game) details for an individual event $ref object.
         The API 'id' for the event is used as the primary key.
-        Propagates season_id_fk, type_id_fk, and week_id_fk.
+        Propagates season_id_fk, type_id_fk, and week_id_fk, taking them from the event's
+        own season/seasonType/week refs when the ref item does not carry them (date listing).
+        Events an earlier run saw final and that have not changed since are dropped here, so
+        none of their sub-resources are fetched either.
         """
         detail_url = event_ref_item.get("$ref")
         season_id_fk = event_ref_item.get("season_id_fk")
@@ -468,51 +1041,82 @@ def espn_source(
         week_id_fk = event_ref_item.get("week_id_fk")
 
         if not detail_url:
-            logger.warning(f"Event ref item missing '$ref'. Item: {event_ref_item}")
-            return None
-        if not all([season_id_fk, type_id_fk, week_id_fk]):
-            logger.warning(
-                f"Event ref item missing one or more FKs (season_id_fk, type_id_fk, week_id_fk). "
-                f"Item: {event_ref_item}"
-            )
+            logger.warning("Event ref item missing '$ref'. Item: %s", payload(event_ref_item))
             return None
 
         logger.debug(
-            f"Fetching event detail for week '{week_id_fk}' (type '{type_id_fk}', season '{season_id_fk}') "
-            f"from: {detail_url}"
+            "Fetching event detail for week '%s' (type '%s', season '%s') from: %s",
+            week_id_fk,
+            type_id_fk,
+            season_id_fk,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            event_detail = response.json()
+            event_detail = await fetcher.get_json(detail_url)
+
+            if not all([season_id_fk, type_id_fk, week_id_fk]):
+                context = _event_context_from_refs(event_detail)
+                season_id_fk = season_id_fk or context.get("season_id_fk")
+                type_id_fk = type_id_fk or context.get("type_id_fk")
+                week_id_fk = week_id_fk or context.get("week_id_fk")
+                if not all([season_id_fk, type_id_fk, week_id_fk]):
+                    logger.warning(
+                        "Event from %s missing one or more FKs "
+                        "(season_id_fk, type_id_fk, week_id_fk). Item: %s",
+                        detail_url,
+                        payload(event_ref_item),
+                    )
+                    return None
 
             api_event_id = event_detail.get("id")
             if api_event_id is not None:
+                if event_statuses.observe(str(api_event_id), event_modified_marker(event_detail)):
+                    return None  # Final and unchanged since an earlier run; skip its tree
                 event_detail["id"] = str(api_event_id)  # Ensure ID is string
                 event_detail["season_id_fk"] = str(season_id_fk)
                 event_detail["type_id_fk"] = str(type_id_fk)
                 event_detail["week_id_fk"] = str(week_id_fk)
-                # The event_detail object itself will be yielded and can be used
-                # by downstream transformers to extract sub-resources (competitors, odds, etc.)
+                # The full document only goes to the events table; the sub-resource
+                # transformers get its event_handles item
                 return event_detail
             else:
                 logger.warning(
-                    f"Fetched event detail from {detail_url} missing 'id'. Detail: {event_detail}"
+                    "Fetched event detail from %s missing 'id'. Detail: %s",
+                    detail_url,
+                    payload(event_detail),
                 )
                 return None
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching event detail from {detail_url} "
-                f"(week_id_fk: {week_id_fk}, type_id_fk: {type_id_fk}, season_id_fk: {season_id_fk}): {e}",
+                "Unexpected error fetching event detail from %s "
+                "(week_id_fk: %s, type_id_fk: %s, season_id_fk: %s): %s",
+                detail_url,
+                week_id_fk,
+                type_id_fk,
+                season_id_fk,
+                e,
                 exc_info=True,
             )
             return None
 
-    # --- Event Sub-Resources Processing Chain (dependent on event_detail_fetcher_transformer) ---
+    @dlt.transformer(  # Intermediate: what the sub-resource transformers need of an event
+        name="event_handles",
+        data_from=event_detail_fetcher_transformer,
+    )
+    def event_handles_transformer(event_detail: dict[str, Any]) -> TDataItem:
+        """
+        Trims an event document down to its ids, FKs, competitors and competition $refs
+        (see `_event_handle`). A dozen transformers hang off every event, and their queued
+        items would otherwise keep the full document (links, notes, nested objects) alive
+        until the last of them finishes.
+        """
+        return _event_handle(event_detail)
+
+    # --- Event Sub-Resources Processing Chain (dependent on event_handles_transformer) ---
 
     @dlt.transformer(
         name="event_competitors",
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key=["id", "event_id_fk"],  # 'id' here is the competitor's team id
     )
@@ -525,7 +1129,8 @@ def espn_source(
         event_id_fk = event_detail.get("id")
         if not event_id_fk:
             logger.warning(
-                f"Event detail missing 'id' (event_id_fk). Cannot extract competitors. Detail: {event_detail}"
+                "Event detail missing 'id' (event_id_fk). Cannot extract competitors. Detail: %s",
+                payload(event_detail),
             )
             return None
 
@@ -537,28 +1142,32 @@ def espn_source(
             or not competitions_list[0]
         ):
             logger.info(
-                f"Event detail for event '{event_id_fk}' has no 'competitions' array or it's empty. "
-                f"No competitors to extract."
+                "Event detail for event '%s' has no 'competitions' array or it's empty. "
+                "No competitors to extract.",
+                event_id_fk,
             )
             return None
 
         competitors_list = competitions_list[0].get("competitors")
         if not competitors_list or not isinstance(competitors_list, list):
             logger.info(
-                f"Event detail for event '{event_id_fk}' competition has no 'competitors' array. "
-                f"No competitors to extract."
+                "Event detail for event '%s' competition has no 'competitors' array. "
+                "No competitors to extract.",
+                event_id_fk,
             )
             return None
 
         logger.debug(
-            f"Extracting competitors for event_id: {event_id_fk}. "
-            f"Found {len(competitors_list)} competitors."
+            "Extracting competitors for event_id: %s. Found %s competitors.",
+            event_id_fk,
+            len(competitors_list),
         )
         for competitor_item in competitors_list:
             if not isinstance(competitor_item, dict) or "id" not in competitor_item:
                 logger.warning(
-                    f"Competitor item for event '{event_id_fk}' is malformed or missing 'id'. "
-                    f"Item: {competitor_item}"
+                    "Competitor item for event '%s' is malformed or missing 'id'. Item: %s",
+                    event_id_fk,
+                    payload(competitor_item),
                 )
                 continue
 
@@ -587,8 +1196,8 @@ def espn_source(
         write_disposition="merge",
         primary_key=["event_id_fk", "team_id_fk"],
     )
-    @dlt.defer
-    def event_scores_detail_fetcher_transformer(
+    @fetcher.defer
+    async def event_scores_detail_fetcher_transformer(
         competitor_record: dict[str, Any],
     ) -> TDataItem | None:
         """
@@ -601,25 +1210,29 @@ def espn_source(
 
         if not all([event_id_fk, team_id_fk]):
             logger.warning(
-                f"Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
-                f"Cannot fetch score. Record: {competitor_record}"
+                "Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
+                "Cannot fetch score. Record: %s",
+                payload(competitor_record),
             )
             return None
 
         if not score_ref_url:
             logger.info(
-                f"Competitor record for event '{event_id_fk}', team '{team_id_fk}' missing 'score.$ref'. "
-                f"No score to fetch."
+                "Competitor record for event '%s', team '%s' missing 'score.$ref'. "
+                "No score to fetch.",
+                event_id_fk,
+                team_id_fk,
             )
             return None
 
         logger.debug(
-            f"Fetching event score for event '{event_id_fk}', team '{team_id_fk}' from: {score_ref_url}"
+            "Fetching event score for event '%s', team '%s' from: %s",
+            event_id_fk,
+            team_id_fk,
+            score_ref_url,
         )
         try:
-            response = detail_client.get(score_ref_url)
-            response.raise_for_status()
-            score_detail = response.json()
+            score_detail = await fetcher.get_json(score_ref_url)
 
             # Augment the score detail with necessary FKs
             score_detail_augmented = score_detail.copy()
@@ -632,8 +1245,12 @@ def espn_source(
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching event score from {score_ref_url} "
-                f"(event_id_fk: {event_id_fk}, team_id_fk: {team_id_fk}): {e}",
+                "Unexpected error fetching event score from %s "
+                "(event_id_fk: %s, team_id_fk: %s): %s",
+                score_ref_url,
+                event_id_fk,
+                team_id_fk,
+                e,
                 exc_info=True,
             )
             return None
@@ -644,10 +1261,10 @@ def espn_source(
         write_disposition="merge",
         primary_key=["event_id_fk", "team_id_fk", "period"],
     )
-    @dlt.defer
-    def event_linescores_transformer(
+    @fetcher.defer
+    async def event_linescores_transformer(
         competitor_record: dict[str, Any],
-    ) -> Iterable[TDataItem] | None:
+    ) -> AsyncIterator[TDataItem]:
         """
         Fetches the list of linescore items (score per period) for a team in an event
         using the competitor_record.linescores.$ref.
@@ -659,25 +1276,29 @@ def espn_source(
 
         if not all([event_id_fk, team_id_fk]):
             logger.warning(
-                f"Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
-                f"Cannot fetch linescores. Record: {competitor_record}"
+                "Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
+                "Cannot fetch linescores. Record: %s",
+                payload(competitor_record),
             )
-            return None  # Or yield nothing: yield from []
+            return  # Or yield nothing: yield from []
 
         if not linescores_ref_url:
             logger.info(
-                f"Competitor record for event '{event_id_fk}', team '{team_id_fk}' missing 'linescores.$ref'. "
-                f"No linescores to fetch."
+                "Competitor record for event '%s', team '%s' missing 'linescores.$ref'. "
+                "No linescores to fetch.",
+                event_id_fk,
+                team_id_fk,
             )
-            return None  # Or yield from []
+            return  # Or yield from []
 
         logger.debug(
-            f"Fetching event linescores for event '{event_id_fk}', team '{team_id_fk}' from: {linescores_ref_url}"
+            "Fetching event linescores for event '%s', team '%s' from: %s",
+            event_id_fk,
+            team_id_fk,
+            linescores_ref_url,
         )
         try:
-            response = detail_client.get(linescores_ref_url)
-            response.raise_for_status()
-            linescore_data = response.json()
+            linescore_data = await fetcher.get_json(linescores_ref_url)
 
             # The response might be a list directly, or a dict with an 'items' key
             linescore_items_list = []
@@ -691,17 +1312,25 @@ def espn_source(
                 linescore_items_list = linescore_data["items"]
             else:
                 logger.warning(
-                    f"Unexpected linescore_data format from {linescores_ref_url} for event '{event_id_fk}', "
-                    f"team '{team_id_fk}'. Expected list or dict with 'items' list. Data: {linescore_data}"
+                    "Unexpected linescore_data format from %s for event '%s', "
+                    "team '%s'. Expected list or dict with 'items' list. Data: %s",
+                    linescores_ref_url,
+                    event_id_fk,
+                    team_id_fk,
+                    payload(linescore_data),
                 )
-                # yield from [] # or return None
+                # yield from [] # or return
 
             processed_any = False
             for item in linescore_items_list:
                 if not isinstance(item, dict) or "period" not in item:
                     logger.warning(
-                        f"Linescore item from {linescores_ref_url} for event '{event_id_fk}', "
-                        f"team '{team_id_fk}' is malformed or missing 'period'. Item: {item}"
+                        "Linescore item from %s for event '%s', "
+                        "team '%s' is malformed or missing 'period'. Item: %s",
+                        linescores_ref_url,
+                        event_id_fk,
+                        team_id_fk,
+                        payload(item),
                     )
                     continue
 
@@ -719,100 +1348,33 @@ def espn_source(
                 not processed_any and not linescore_items_list
             ):  # Explicitly check if list was empty from API vs parse failure
                 logger.debug(
-                    f"No linescore items found in the response from {linescores_ref_url} "
-                    f"for event '{event_id_fk}', team '{team_id_fk}'. API returned empty list."
+                    "No linescore items found in the response from %s "
+                    "for event '%s', team '%s'. API returned empty list.",
+                    linescores_ref_url,
+                    event_id_fk,
+                    team_id_fk,
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event linescores from {linescores_ref_url} "
-                f"(event_id_fk: {event_id_fk}, team_id_fk: {team_id_fk}): {e}",
+                "Unexpected error fetching/processing event linescores from %s "
+                "(event_id_fk: %s, team_id_fk: %s): %s",
+                linescores_ref_url,
+                event_id_fk,
+                team_id_fk,
+                e,
                 exc_info=True,
             )
-            # yield from [] # or return None
+            # yield from [] # or return
         # If nothing is yielded implicitly, dlt handles it as no data for this input item.
 
-    @dlt.transformer(  # This intermediate resource fetches raw data for team stats and player stat refs
-        name="event_team_stats_raw_data",  # Not a final table, but a source for downstream processors
-        data_from=event_competitors_transformer,
-        # No primary_key or write_disposition needed if its output is purely intermediate
-    )
-    @dlt.defer
-    def event_team_stats_raw_fetcher_transformer(
-        competitor_record: dict[str, Any],
-    ) -> TDataItem | None:
-        """
-        Fetches the raw JSON data for a team's statistics in an event,
-        which includes both aggregated team stats and refs to player stats.
-        Yields the raw JSON augmented with event_id_fk and team_id_fk.
-        """
-        event_id_fk = competitor_record.get("event_id_fk")
-        team_id_fk = competitor_record.get("id")  # competitor's 'id' is team_id
-        stats_ref_url = competitor_record.get("statistics", {}).get("$ref")
-
-        if not all([event_id_fk, team_id_fk]):
-            logger.warning(
-                f"Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
-                f"Cannot fetch team stats raw data. Record: {competitor_record}"
-            )
-            return None
-
-        if not stats_ref_url:
-            logger.info(
-                f"Competitor record for event '{event_id_fk}', team '{team_id_fk}' missing 'statistics.$ref'. "
-                f"No team stats raw data to fetch."
-            )
-            return None
-
-        logger.debug(
-            f"Fetching event team stats raw data for event '{event_id_fk}', team '{team_id_fk}' from: {stats_ref_url}"
-        )
-        try:
-            response = detail_client.get(stats_ref_url)
-            response.raise_for_status()
-            raw_stats_data = response.json()
-
-            # Augment the raw data with necessary FKs for downstream processors
-            raw_stats_data_augmented = {
-                "event_id_fk": str(event_id_fk),
-                "team_id_fk": str(team_id_fk),
-                "data": raw_stats_data,  # Keep the original fetched data nested
-            }
-            return raw_stats_data_augmented
-
-        except Exception as e:
-            logger.error(
-                f"Unexpected error fetching event team stats raw data from {stats_ref_url} "
-                f"(event_id_fk: {event_id_fk}, team_id_fk: {team_id_fk}): {e}",
-                exc_info=True,
-            )
-            return None
-
-    @dlt.transformer(
-        name="event_team_stats",
-        data_from=event_team_stats_raw_fetcher_transformer,  # Takes from the raw data fetcher
-        write_disposition="merge",
-        primary_key=["event_id_fk", "team_id_fk", "stat_name"],
-    )
-    def event_team_stats_processor_transformer(
-        augmented_raw_stats_data: dict[str, Any],
-    ) -> Iterable[TDataItem] | None:
+    def _team_stat_rows(
+        event_id_fk: str, team_id_fk: str, raw_data: dict[str, Any]
+    ) -> list[TDataItem]:
         """
-        Processes the 'stats' portion of the raw team statistics data
-        and yields tidy records for the event_team_stats table.
+        Unnests the 'stats' portion of a team statistics response into tidy records for the
+        event_team_stats table (one Arrow record batch with arrow_stats).
         """
-        event_id_fk = augmented_raw_stats_data.get("event_id_fk")
-        team_id_fk = augmented_raw_stats_data.get("team_id_fk")
-        raw_data = augmented_raw_stats_data.get("data", {})
-
-        if not all([event_id_fk, team_id_fk]):
-            logger.warning(
-                f"Augmented raw stats data missing 'event_id_fk' or 'team_id_fk'. "
-                f"Cannot process team stats. Data: {augmented_raw_stats_data}"
-            )
-            yield from []
-            return
-
         # Team stats are usually in response.splits[0].stats
         # Need to handle cases where 'splits' or 'stats' may be missing or not in expected structure
         splits = raw_data.get("splits")
@@ -823,30 +1385,37 @@ def espn_source(
             or not isinstance(splits[0], dict)
         ):
             logger.debug(
-                f"No 'splits' array or invalid format in raw team stats data for event '{event_id_fk}', "
-                f"team '{team_id_fk}'. No team stats to process. Raw data: {raw_data}"
+                "No 'splits' array or invalid format in raw team stats data for event '%s', "
+                "team '%s'. No team stats to process. Raw data: %s",
+                event_id_fk,
+                team_id_fk,
+                payload(raw_data),
             )
-            yield from []
-            return
+            return []
 
         team_stats_list = splits[0].get("stats")
         if not team_stats_list or not isinstance(team_stats_list, list):
             logger.debug(
-                f"No 'stats' list in splits[0] for event '{event_id_fk}', team '{team_id_fk}'. "
-                f"No team stats to process. Split data: {splits[0]}"
+                "No 'stats' list in splits[0] for event '%s', team '%s'. "
+                "No team stats to process. Split data: %s",
+                event_id_fk,
+                team_id_fk,
+                payload(splits[0]),
             )
-            yield from []
-            return
+            return []
 
         # Optionally, get category name if available
         # category_name = splits[0].get("category", {}).get("name", "general") # Or derive from raw_data.name
 
-        processed_any = False
+        stat_rows = TidyRows(arrow=arrow_stats)
         for stat_item in team_stats_list:
             if not isinstance(stat_item, dict) or "name" not in stat_item:
                 logger.warning(
-                    f"Team stat item for event '{event_id_fk}', team '{team_id_fk}' is malformed or "
-                    f"missing 'name'. Item: {stat_item}"
+                    "Team stat item for event '%s', team '%s' is malformed or "
+                    "missing 'name'. Item: %s",
+                    event_id_fk,
+                    team_id_fk,
+                    payload(stat_item),
                 )
                 continue
 
@@ -857,46 +1426,31 @@ def espn_source(
             )  # Prefer displayValue if exists
 
             tidy_stat_record = {
-                "event_id_fk": str(event_id_fk),
-                "team_id_fk": str(team_id_fk),
+                "event_id_fk": event_id_fk,
+                "team_id_fk": team_id_fk,
                 "stat_name": str(stat_name),
                 "stat_value": str(stat_value_str) if stat_value_str is not None else None,
                 # "category": str(category_name), # If you decide to add category
                 # "raw_label": stat_item.get("label") # Optional: for more detail
             }
-            yield tidy_stat_record
-            processed_any = True
+            stat_rows.append(tidy_stat_record)
 
-        if not processed_any:
+        if not stat_rows:
             logger.debug(
-                f"Processed zero team stat items for event '{event_id_fk}', team '{team_id_fk}' "
-                f"from raw data (list might have been empty or all items malformed)."
+                "Processed zero team stat items for event '%s', team '%s' "
+                "from raw data (list might have been empty or all items malformed).",
+                event_id_fk,
+                team_id_fk,
             )
+        return stat_rows.items()
 
-    @dlt.transformer(  # This lister also takes from the raw team stats data
-        name="event_player_stats_refs_lister",
-        data_from=event_team_stats_raw_fetcher_transformer,
-        # No primary_key or write_disposition as it yields refs, not a final table
-    )
-    def event_player_stats_refs_lister_transformer(
-        augmented_raw_stats_data: dict[str, Any],
-    ) -> Iterable[TDataItem] | None:
+    def _player_stats_refs(
+        event_id_fk: str, team_id_fk: str, raw_data: dict[str, Any]
+    ) -> list[dict[str, str]]:
         """
-        Processes the 'athletes' portion of the raw team statistics data (which contains
-        player stat $refs) and yields augmented reference objects for fetching detailed player stats.
+        Lists the player stat $refs in the 'athletes' portion of a team statistics response,
+        augmented for fetching the detailed player stats.
         """
-        event_id_fk = augmented_raw_stats_data.get("event_id_fk")
-        team_id_fk = augmented_raw_stats_data.get("team_id_fk")
-        raw_data = augmented_raw_stats_data.get("data", {})
-
-        if not all([event_id_fk, team_id_fk]):
-            logger.warning(
-                f"Augmented raw stats data missing 'event_id_fk' or 'team_id_fk'. "
-                f"Cannot list player stat refs. Data: {augmented_raw_stats_data}"
-            )
-            yield from []
-            return
-
         # Player stat refs are usually in response.splits[0].athletes
         splits = raw_data.get("splits")
         if (
@@ -906,26 +1460,33 @@ def espn_source(
             or not isinstance(splits[0], dict)
         ):
             logger.debug(
-                f"No 'splits' array or invalid format in raw team stats data for event '{event_id_fk}', "
-                f"team '{team_id_fk}'. No player stat refs to list. Raw data: {raw_data}"
+                "No 'splits' array or invalid format in raw team stats data for event '%s', "
+                "team '%s'. No player stat refs to list. Raw data: %s",
+                event_id_fk,
+                team_id_fk,
+                payload(raw_data),
             )
-            yield from []
-            return
+            return []
 
         athletes_list_with_refs = splits[0].get("athletes")
         if not athletes_list_with_refs or not isinstance(athletes_list_with_refs, list):
             logger.debug(
-                f"No 'athletes' list in splits[0] for event '{event_id_fk}', team '{team_id_fk}'. "
-                f"No player stat refs to list. Split data: {splits[0]}"
+                "No 'athletes' list in splits[0] for event '%s', team '%s'. "
+                "No player stat refs to list. Split data: %s",
+                event_id_fk,
+                team_id_fk,
+                payload(splits[0]),
             )
-            yield from []
-            return
+            return []
 
-        processed_any = False
+        player_stats_refs = []
         for athlete_item in athletes_list_with_refs:
             if not isinstance(athlete_item, dict):
                 logger.warning(
-                    f"Athlete item for event '{event_id_fk}', team '{team_id_fk}' is malformed. Item: {athlete_item}"
+                    "Athlete item for event '%s', team '%s' is malformed. Item: %s",
+                    event_id_fk,
+                    team_id_fk,
+                    payload(athlete_item),
                 )
                 continue
 
@@ -941,141 +1502,367 @@ def espn_source(
 
             if not player_athlete_id or not player_stats_ref_url:
                 logger.warning(
-                    f"Athlete item for event '{event_id_fk}', team '{team_id_fk}' missing 'athlete.id' or "
-                    f"'statistics.$ref'. Item: {athlete_item}"
+                    "Athlete item for event '%s', team '%s' missing 'athlete.id' or "
+                    "'statistics.$ref'. Item: %s",
+                    event_id_fk,
+                    team_id_fk,
+                    payload(athlete_item),
                 )
                 continue
 
-            player_stat_ref_augmented = {
-                "player_stats_ref_url": str(player_stats_ref_url),
-                "event_id_fk": str(event_id_fk),
-                "team_id_fk": str(team_id_fk),
-                "athlete_id_fk": str(player_athlete_id),
-            }
-            yield player_stat_ref_augmented
-            processed_any = True
+            player_stats_refs.append(
+                {
+                    "player_stats_ref_url": str(player_stats_ref_url),
+                    "event_id_fk": event_id_fk,
+                    "team_id_fk": team_id_fk,
+                    "athlete_id_fk": str(player_athlete_id),
+                }
+            )
 
-        if not processed_any:
+        if not player_stats_refs:
             logger.debug(
-                f"Processed zero player stat refs for event '{event_id_fk}', team '{team_id_fk}' from "
-                f"raw data (athletes list might have been empty or all items malformed)."
+                "Processed zero player stat refs for event '%s', team '%s' from "
+                "raw data (athletes list might have been empty or all items malformed).",
+                event_id_fk,
+                team_id_fk,
             )
+        return player_stats_refs
 
-    @dlt.transformer(
-        name="event_player_stats",
-        data_from=event_player_stats_refs_lister_transformer,
-        write_disposition="merge",
-        primary_key=["event_id_fk", "team_id_fk", "athlete_id_fk", "stat_name"],
+    @dlt.transformer(  # Intermediate: team stat rows and player stat refs, unnested in the pool
+        name="event_team_stats_rows",  # Not a final table, but a source for the resources below
+        data_from=event_competitors_transformer,
+        # No primary_key or write_disposition needed if its output is purely intermediate
     )
-    @dlt.defer
-    def event_player_stats_detail_fetcher_transformer(
-        player_stat_ref_item: dict[str, Any],
-    ) -> Iterable[TDataItem] | None:
+    @fetcher.defer
+    async def event_team_stats_fetcher_transformer(
+        competitor_record: dict[str, Any],
+    ) -> TDataItem | None:
         """
-        Fetches detailed player statistics for an event using the provided $ref,
-        and unnests them into a tidy format (one row per stat).
+        Fetches a team's statistics in an event, which include both aggregated team stats
+        and refs to player stats, and unnests them where the fetch ran. Yields the tidy
+        event_team_stats rows, the event_team_stats_wide row (with wide_stats) and the
+        player stat refs, so the resources below only pass them on.
         """
-        detail_url = player_stat_ref_item.get("player_stats_ref_url")
-        event_id_fk = player_stat_ref_item.get("event_id_fk")
-        team_id_fk = player_stat_ref_item.get("team_id_fk")
-        athlete_id_fk = player_stat_ref_item.get("athlete_id_fk")
+        event_id_fk = competitor_record.get("event_id_fk")
+        team_id_fk = competitor_record.get("id")  # competitor's 'id' is team_id
+        stats_ref_url = competitor_record.get("statistics", {}).get("$ref")
 
-        if not all([detail_url, event_id_fk, team_id_fk, athlete_id_fk]):
+        if not all([event_id_fk, team_id_fk]):
             logger.warning(
-                f"Player stat ref item missing one or more required fields "
-                f"('player_stats_ref_url', 'event_id_fk', 'team_id_fk', 'athlete_id_fk'). "
-                f"Item: {player_stat_ref_item}"
+                "Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
+                "Cannot fetch team stats raw data. Record: %s",
+                payload(competitor_record),
             )
-            yield from []  # Return an empty iterable
-            return
+            return None
+
+        if not stats_ref_url:
+            logger.info(
+                "Competitor record for event '%s', team '%s' missing 'statistics.$ref'. "
+                "No team stats raw data to fetch.",
+                event_id_fk,
+                team_id_fk,
+            )
+            return None
 
         logger.debug(
-            f"Fetching player stats for event '{event_id_fk}', team '{team_id_fk}', athlete '{athlete_id_fk}' "
-            f"from: {detail_url}"
+            "Fetching event team stats raw data for event '%s', team '%s' from: %s",
+            event_id_fk,
+            team_id_fk,
+            stats_ref_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            player_stats_data = response.json()
+            raw_stats_data = await fetcher.get_json(stats_ref_url)
+            event_id_fk, team_id_fk = str(event_id_fk), str(team_id_fk)
+
+            wide_row = None
+            if wide_stats:
+                categories = stat_categories(raw_stats_data)
+                if categories:
+                    wide_row = {
+                        "event_id_fk": event_id_fk,
+                        "team_id_fk": team_id_fk,
+                        **box_score_values(categories, TEAM_BOX_SCORE_COLUMNS),
+                    }
+                else:
+                    logger.debug(
+                        "No stat categories in team stats for event '%s', team '%s'.",
+                        event_id_fk,
+                        team_id_fk,
+                    )
 
-            # Player stats often come in a structure like:
-            # player_stats_data -> "splits" (list) -> "categories" (list) -> "stats" (list)
-            # We need to unnest this.
+            return {
+                "stat_rows": _team_stat_rows(event_id_fk, team_id_fk, raw_stats_data),
+                "wide_row": wide_row,
+                "player_stats_refs": _player_stats_refs(event_id_fk, team_id_fk, raw_stats_data),
+            }
 
-            splits = player_stats_data.get("splits")
-            if (
-                not splits
-                or not isinstance(splits, list)
-                or not splits[0]
-                or not isinstance(splits[0], dict)
-            ):
-                logger.debug(
-                    f"No 'splits' array or invalid format in player stats data for event '{event_id_fk}', "
-                    f"team '{team_id_fk}', athlete '{athlete_id_fk}'. URL: {detail_url}. Data: {player_stats_data}"
-                )
-                yield from []
-                return
+        except Exception as e:
+            logger.error(
+                "Unexpected error fetching/processing event team stats from %s "
+                "(event_id_fk: %s, team_id_fk: %s): %s",
+                stats_ref_url,
+                event_id_fk,
+                team_id_fk,
+                e,
+                exc_info=True,
+            )
+            return None
+
+    @dlt.transformer(
+        name="event_team_stats",
+        data_from=event_team_stats_fetcher_transformer,
+        write_disposition="merge",
+        primary_key=["event_id_fk", "team_id_fk", "stat_name"],
+    )
+    def event_team_stats_processor_transformer(
+        team_stats_rows: dict[str, Any],
+    ) -> Iterable[TDataItem]:
+        """
+        Passes on the tidy team stat records of event_team_stats_rows (one per stat, as one
+        Arrow record batch with arrow_stats).
+        """
+        yield from team_stats_rows["stat_rows"]
+
+    @dlt.transformer(
+        name="event_team_stats_wide",
+        data_from=event_team_stats_fetcher_transformer,
+        write_disposition="merge",
+        primary_key=["event_id_fk", "team_id_fk"],
+        columns=double_columns(TEAM_BOX_SCORE_COLUMNS),
+    )
+    def event_team_stats_wide_transformer(
+        team_stats_rows: dict[str, Any],
+    ) -> TDataItem | None:
+        """
+        One row per team and event, with a double column per box score statistic
+        (see `espn_stats.TEAM_BOX_SCORE_STATS`) instead of a text row per stat.
+        """
+        return team_stats_rows["wide_row"]
+
+    @dlt.transformer(  # This lister also takes from the team stats fetch
+        name="event_player_stats_refs_lister",
+        data_from=event_team_stats_fetcher_transformer,
+        # No primary_key or write_disposition as it yields refs, not a final table
+    )
+    def event_player_stats_refs_lister_transformer(
+        team_stats_rows: dict[str, Any],
+    ) -> Iterable[TDataItem]:
+        """
+        Yields the player stat $refs of event_team_stats_rows, augmented for fetching
+        detailed player stats.
+        """
+        yield from team_stats_rows["player_stats_refs"]
+
+    def _player_stat_rows(
+        event_id_fk: str,
+        team_id_fk: str,
+        athlete_id_fk: str,
+        detail_url: str,
+        player_stats_data: dict[str, Any],
+    ) -> list[TDataItem]:
+        """
+        Unnests an athlete's statistics in an event into a tidy format (one row per stat,
+        as one Arrow record batch with arrow_stats).
+        """
+        # Player stats often come in a structure like:
+        # player_stats_data -> "splits" (list) -> "categories" (list) -> "stats" (list)
+        # We need to unnest this.
+
+        splits = player_stats_data.get("splits")
+        if (
+            not splits
+            or not isinstance(splits, list)
+            or not splits[0]
+            or not isinstance(splits[0], dict)
+        ):
+            logger.debug(
+                "No 'splits' array or invalid format in player stats data for event '%s', "
+                "team '%s', athlete '%s'. URL: %s. Data: %s",
+                event_id_fk,
+                team_id_fk,
+                athlete_id_fk,
+                detail_url,
+                payload(player_stats_data),
+            )
+            return []
+
+        # Assuming stats are in the first split, which is typical
+        categories = splits[0].get("categories")
+        if not categories or not isinstance(categories, list):
+            logger.debug(
+                "No 'categories' list in player stats splits[0] for event '%s', "
+                "team '%s', athlete '%s'. URL: %s. Split data: %s",
+                event_id_fk,
+                team_id_fk,
+                athlete_id_fk,
+                detail_url,
+                payload(splits[0]),
+            )
+            return []
 
-            # Assuming stats are in the first split, which is typical
-            categories = splits[0].get("categories")
-            if not categories or not isinstance(categories, list):
+        stat_rows = TidyRows(arrow=arrow_stats)
+        for category in categories:
+            if not isinstance(category, dict):
+                logger.warning("Malformed category item: %s. Skipping.", payload(category))
+                continue
+
+            # category_name = category.get("name", "unknown_category") # Optional: if needed for PK or context
+            stats_list = category.get("stats")
+            if not stats_list or not isinstance(stats_list, list):
                 logger.debug(
-                    f"No 'categories' list in player stats splits[0] for event '{event_id_fk}', "
-                    f"team '{team_id_fk}', athlete '{athlete_id_fk}'. URL: {detail_url}. Split data: {splits[0]}"
+                    "No 'stats' list in category '%s' for player stats. "
+                    "Event '%s', team '%s', athlete '%s'. Category: %s",
+                    category.get("name"),
+                    event_id_fk,
+                    team_id_fk,
+                    athlete_id_fk,
+                    payload(category),
                 )
-                yield from []
-                return
-
-            processed_any_stat = False
-            for category in categories:
-                if not isinstance(category, dict):
-                    logger.warning(f"Malformed category item: {category}. Skipping.")
-                    continue
+                continue
 
-                # category_name = category.get("name", "unknown_category") # Optional: if needed for PK or context
-                stats_list = category.get("stats")
-                if not stats_list or not isinstance(stats_list, list):
-                    logger.debug(
-                        f"No 'stats' list in category '{category.get('name')}' for player stats. "
-                        f"Event '{event_id_fk}', team '{team_id_fk}', athlete '{athlete_id_fk}'. Category: {category}"
+            for stat_item in stats_list:
+                if not isinstance(stat_item, dict) or "name" not in stat_item:
+                    logger.warning(
+                        "Player stat item for event '%s', team '%s', athlete '%s' "
+                        "is malformed or missing 'name'. Item: %s",
+                        event_id_fk,
+                        team_id_fk,
+                        athlete_id_fk,
+                        payload(stat_item),
                     )
                     continue
 
-                for stat_item in stats_list:
-                    if not isinstance(stat_item, dict) or "name" not in stat_item:
-                        logger.warning(
-                            f"Player stat item for event '{event_id_fk}', team '{team_id_fk}', athlete '{athlete_id_fk}' "
-                            f"is malformed or missing 'name'. Item: {stat_item}"
-                        )
-                        continue
+                stat_name = stat_item.get("name")
+                stat_value_str = stat_item.get("displayValue", stat_item.get("value"))
 
-                    stat_name = stat_item.get("name")
-                    stat_value_str = stat_item.get("displayValue", stat_item.get("value"))
+                tidy_stat_record = {
+                    "event_id_fk": event_id_fk,
+                    "team_id_fk": team_id_fk,
+                    "athlete_id_fk": athlete_id_fk,
+                    "stat_name": str(stat_name),
+                    "stat_value": str(stat_value_str) if stat_value_str is not None else None,
+                    # "category_name": str(category_name), # Uncomment if category is needed
+                }
+                stat_rows.append(tidy_stat_record)
 
-                    tidy_stat_record = {
-                        "event_id_fk": str(event_id_fk),
-                        "team_id_fk": str(team_id_fk),
-                        "athlete_id_fk": str(athlete_id_fk),
-                        "stat_name": str(stat_name),
-                        "stat_value": str(stat_value_str) if stat_value_str is not None else None,
-                        # "category_name": str(category_name), # Uncomment if category is needed
+        if not stat_rows:
+            logger.debug(
+                "Processed zero player stat items for event '%s', team '%s', "
+                "athlete '%s' from %s. Data might have been empty or malformed.",
+                event_id_fk,
+                team_id_fk,
+                athlete_id_fk,
+                detail_url,
+            )
+        return stat_rows.items()
+
+    @dlt.transformer(  # Intermediate: player stat rows for the tidy and wide tables
+        name="event_player_stats_rows",  # Not a final table, but a source for the resources below
+        data_from=event_player_stats_refs_lister_transformer,
+    )
+    @fetcher.defer
+    async def event_player_stats_fetcher_transformer(
+        player_stat_ref_item: dict[str, Any],
+    ) -> TDataItem | None:
+        """
+        Fetches an athlete's statistics in an event using the provided $ref and unnests
+        them where the fetch ran. Yields the tidy event_player_stats rows and the
+        event_player_stats_wide row (with wide_stats).
+        """
+        detail_url = player_stat_ref_item.get("player_stats_ref_url")
+        event_id_fk = player_stat_ref_item.get("event_id_fk")
+        team_id_fk = player_stat_ref_item.get("team_id_fk")
+        athlete_id_fk = player_stat_ref_item.get("athlete_id_fk")
+
+        if not all([detail_url, event_id_fk, team_id_fk, athlete_id_fk]):
+            logger.warning(
+                "Player stat ref item missing one or more required fields "
+                "('player_stats_ref_url', 'event_id_fk', 'team_id_fk', 'athlete_id_fk'). "
+                "Item: %s",
+                payload(player_stat_ref_item),
+            )
+            return None
+
+        logger.debug(
+            "Fetching player stats for event '%s', team '%s', athlete '%s' from: %s",
+            event_id_fk,
+            team_id_fk,
+            athlete_id_fk,
+            detail_url,
+        )
+        try:
+            player_stats_data = await fetcher.get_json(detail_url)
+            event_id_fk, team_id_fk = str(event_id_fk), str(team_id_fk)
+            athlete_id_fk = str(athlete_id_fk)
+
+            wide_row = None
+            if wide_stats:
+                categories = stat_categories(player_stats_data)
+                if categories:
+                    wide_row = {
+                        "event_id_fk": event_id_fk,
+                        "team_id_fk": team_id_fk,
+                        "athlete_id_fk": athlete_id_fk,
+                        **box_score_values(categories, PLAYER_BOX_SCORE_COLUMNS),
                     }
-                    yield tidy_stat_record
-                    processed_any_stat = True
+                else:
+                    logger.debug(
+                        "No stat categories in player stats for event '%s', athlete '%s'. URL: %s",
+                        event_id_fk,
+                        athlete_id_fk,
+                        detail_url,
+                    )
 
-            if not processed_any_stat:
-                logger.debug(
-                    f"Processed zero player stat items for event '{event_id_fk}', team '{team_id_fk}', "
-                    f"athlete '{athlete_id_fk}' from {detail_url}. Data might have been empty or malformed."
-                )
+            return {
+                "stat_rows": _player_stat_rows(
+                    event_id_fk, team_id_fk, athlete_id_fk, detail_url, player_stats_data
+                ),
+                "wide_row": wide_row,
+            }
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing player stats from {detail_url} "
-                f"(event_id_fk: {event_id_fk}, team_id_fk: {team_id_fk}, athlete_id_fk: {athlete_id_fk}): {e}",
+                "Unexpected error fetching/processing player stats from %s "
+                "(event_id_fk: %s, team_id_fk: %s, athlete_id_fk: %s): %s",
+                detail_url,
+                event_id_fk,
+                team_id_fk,
+                athlete_id_fk,
+                e,
                 exc_info=True,
             )
-            # yield from [] # Implicitly returns None
+            return None
+
+    @dlt.transformer(
+        name="event_player_stats",
+        data_from=event_player_stats_fetcher_transformer,
+        write_disposition="merge",
+        primary_key=["event_id_fk", "team_id_fk", "athlete_id_fk", "stat_name"],
+    )
+    def event_player_stats_processor_transformer(
+        player_stats_rows: dict[str, Any],
+    ) -> Iterable[TDataItem]:
+        """
+        Passes on the tidy player stat records of event_player_stats_rows (one per stat, as
+        one Arrow record batch with arrow_stats).
+        """
+        yield from player_stats_rows["stat_rows"]
+
+    @dlt.transformer(
+        name="event_player_stats_wide",
+        data_from=event_player_stats_fetcher_transformer,
+        write_disposition="merge",
+        primary_key=["event_id_fk", "team_id_fk", "athlete_id_fk"],
+        columns=double_columns(PLAYER_BOX_SCORE_COLUMNS),
+    )
+    def event_player_stats_wide_transformer(
+        player_stats_rows: dict[str, Any],
+    ) -> TDataItem | None:
+        """
+        One row per athlete and event, with a double column per box score statistic
+        (see `espn_stats.PLAYER_BOX_SCORE_STATS`) instead of a text row per stat.
+        """
+        return player_stats_rows["wide_row"]
 
     @dlt.transformer(
         name="event_leaders",
@@ -1083,10 +1870,10 @@ def espn_source(
         write_disposition="merge",
         primary_key=["event_id_fk", "team_id_fk", "category_name", "athlete_id_fk"],
     )
-    @dlt.defer
-    def event_leaders_detail_fetcher_transformer(
+    @fetcher.defer
+    async def event_leaders_detail_fetcher_transformer(
         competitor_record: dict[str, Any],
-    ) -> Iterable[TDataItem] | None:
+    ) -> AsyncIterator[TDataItem]:
         """
         Fetches and unnests team leader data for various statistical categories for an event.
         Yields one record per player per leading category.
@@ -1097,40 +1884,49 @@ def espn_source(
 
         if not all([event_id_fk, team_id_fk]):
             logger.warning(
-                f"Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
-                f"Cannot fetch event leaders. Record: {competitor_record}"
+                "Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
+                "Cannot fetch event leaders. Record: %s",
+                payload(competitor_record),
             )
-            yield from []
             return
 
         if not leaders_ref_url:
             logger.info(
-                f"Competitor record for event '{event_id_fk}', team '{team_id_fk}' missing 'leaders.$ref'. "
-                f"No event leaders to fetch."
+                "Competitor record for event '%s', team '%s' missing 'leaders.$ref'. "
+                "No event leaders to fetch.",
+                event_id_fk,
+                team_id_fk,
             )
-            yield from []
             return
 
         logger.debug(
-            f"Fetching event leaders for event '{event_id_fk}', team '{team_id_fk}' from: {leaders_ref_url}"
+            "Fetching event leaders for event '%s', team '%s' from: %s",
+            event_id_fk,
+            team_id_fk,
+            leaders_ref_url,
         )
         try:
-            response = detail_client.get(leaders_ref_url)
-            response.raise_for_status()
-            leaders_data = response.json()  # Expected to be a list of leader categories
+            leaders_data = await fetcher.get_json(
+                leaders_ref_url
+            )  # Expected to be a list of leader categories
 
             if not isinstance(leaders_data, list):
                 logger.warning(
-                    f"Unexpected leaders_data format from {leaders_ref_url} for event '{event_id_fk}', "
-                    f"team '{team_id_fk}'. Expected list of categories. Data: {leaders_data}"
+                    "Unexpected leaders_data format from %s for event '%s', "
+                    "team '%s'. Expected list of categories. Data: %s",
+                    leaders_ref_url,
+                    event_id_fk,
+                    team_id_fk,
+                    payload(leaders_data),
                 )
-                yield from []
                 return
 
             processed_any_leader = False
             for category_data in leaders_data:
                 if not isinstance(category_data, dict):
-                    logger.warning(f"Malformed leader category data: {category_data}. Skipping.")
+                    logger.warning(
+                        "Malformed leader category data: %s. Skipping.", payload(category_data)
+                    )
                     continue
 
                 category_name = category_data.get(
@@ -1140,14 +1936,20 @@ def espn_source(
                 leader_entries = category_data.get("leaders")
                 if not leader_entries or not isinstance(leader_entries, list):
                     logger.debug(
-                        f"No 'leaders' list in category '{category_name}' for event '{event_id_fk}', "
-                        f"team '{team_id_fk}'. Category data: {category_data}"
+                        "No 'leaders' list in category '%s' for event '%s', "
+                        "team '%s'. Category data: %s",
+                        category_name,
+                        event_id_fk,
+                        team_id_fk,
+                        payload(category_data),
                     )
                     continue
 
                 for leader_entry in leader_entries:
                     if not isinstance(leader_entry, dict):
-                        logger.warning(f"Malformed leader entry: {leader_entry}. Skipping.")
+                        logger.warning(
+                            "Malformed leader entry: %s. Skipping.", payload(leader_entry)
+                        )
                         continue
 
                     athlete_obj = leader_entry.get("athlete", {})
@@ -1155,8 +1957,12 @@ def espn_source(
 
                     if not athlete_id_fk:
                         logger.warning(
-                            f"Leader entry for event '{event_id_fk}', team '{team_id_fk}', category '{category_name}' "
-                            f"missing 'athlete.id'. Entry: {leader_entry}"
+                            "Leader entry for event '%s', team '%s', category '%s' "
+                            "missing 'athlete.id'. Entry: %s",
+                            event_id_fk,
+                            team_id_fk,
+                            category_name,
+                            payload(leader_entry),
                         )
                         continue
 
@@ -1181,14 +1987,21 @@ def espn_source(
 
             if not processed_any_leader:
                 logger.debug(
-                    f"Processed zero leader entries for event '{event_id_fk}', team '{team_id_fk}' from {leaders_ref_url}. "
-                    f"Data might have been empty or all items malformed."
+                    "Processed zero leader entries for event '%s', team '%s' from %s. "
+                    "Data might have been empty or all items malformed.",
+                    event_id_fk,
+                    team_id_fk,
+                    leaders_ref_url,
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event leaders from {leaders_ref_url} "
-                f"(event_id_fk: {event_id_fk}, team_id_fk: {team_id_fk}): {e}",
+                "Unexpected error fetching/processing event leaders from %s "
+                "(event_id_fk: %s, team_id_fk: %s): %s",
+                leaders_ref_url,
+                event_id_fk,
+                team_id_fk,
+                e,
                 exc_info=True,
             )
         # If nothing yielded, dlt handles it.
@@ -1199,10 +2012,10 @@ def espn_source(
         write_disposition="merge",
         primary_key=["event_id_fk", "team_id_fk", "athlete_id_fk"],
     )
-    @dlt.defer
-    def event_roster_detail_fetcher_transformer(
+    @fetcher.defer
+    async def event_roster_detail_fetcher_transformer(
         competitor_record: dict[str, Any],
-    ) -> Iterable[TDataItem] | None:
+    ) -> AsyncIterator[TDataItem]:
         """
         Fetches the roster of players for a team in a specific game using the competitor_record.roster.$ref.
         Yields one record per player on the game roster.
@@ -1213,27 +2026,29 @@ def espn_source(
 
         if not all([event_id_fk, team_id_fk]):
             logger.warning(
-                f"Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
-                f"Cannot fetch event roster. Record: {competitor_record}"
+                "Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
+                "Cannot fetch event roster. Record: %s",
+                payload(competitor_record),
             )
-            yield from []
             return
 
         if not roster_ref_url:
             logger.info(
-                f"Competitor record for event '{event_id_fk}', team '{team_id_fk}' missing 'roster.$ref'. "
-                f"No event roster to fetch."
+                "Competitor record for event '%s', team '%s' missing 'roster.$ref'. "
+                "No event roster to fetch.",
+                event_id_fk,
+                team_id_fk,
             )
-            yield from []
             return
 
         logger.debug(
-            f"Fetching event roster for event '{event_id_fk}', team '{team_id_fk}' from: {roster_ref_url}"
+            "Fetching event roster for event '%s', team '%s' from: %s",
+            event_id_fk,
+            team_id_fk,
+            roster_ref_url,
         )
         try:
-            response = detail_client.get(roster_ref_url)
-            response.raise_for_status()
-            roster_data_response = response.json()
+            roster_data_response = await fetcher.get_json(roster_ref_url)
 
             # Rosters are often a list of entries, sometimes nested under 'entries' or 'items'
             roster_entries = []
@@ -1251,21 +2066,30 @@ def espn_source(
                 # Add other potential keys if discovered
                 else:
                     logger.warning(
-                        f"Roster data from {roster_ref_url} for event '{event_id_fk}', team '{team_id_fk}' "
-                        f"is a dict but does not contain a recognized list key ('entries', 'items'). Data: {roster_data_response}"
+                        "Roster data from %s for event '%s', team '%s' "
+                        "is a dict but does not contain a recognized list key ('entries', 'items'). Data: %s",
+                        roster_ref_url,
+                        event_id_fk,
+                        team_id_fk,
+                        payload(roster_data_response),
                     )
             else:
                 logger.warning(
-                    f"Unexpected roster_data_response format from {roster_ref_url} for event '{event_id_fk}', "
-                    f"team '{team_id_fk}'. Expected list or dict. Data: {roster_data_response}"
+                    "Unexpected roster_data_response format from %s for event '%s', "
+                    "team '%s'. Expected list or dict. Data: %s",
+                    roster_ref_url,
+                    event_id_fk,
+                    team_id_fk,
+                    payload(roster_data_response),
                 )
-                yield from []
                 return
 
             processed_any_player = False
             for player_entry in roster_entries:
                 if not isinstance(player_entry, dict):
-                    logger.warning(f"Malformed player entry in roster: {player_entry}. Skipping.")
+                    logger.warning(
+                        "Malformed player entry in roster: %s. Skipping.", payload(player_entry)
+                    )
                     continue
 
                 athlete_obj = player_entry.get("athlete", {})
@@ -1280,13 +2104,16 @@ def espn_source(
                             athlete_id_fk = athlete_obj["$ref"].split("/")[-1].split("?")[0]
                         except Exception:
                             logger.warning(
-                                f"Could not parse athlete ID from $ref: {athlete_obj['$ref']}"
+                                "Could not parse athlete ID from $ref: %s", athlete_obj["$ref"]
                             )
 
                 if not athlete_id_fk:
                     logger.warning(
-                        f"Player entry for event '{event_id_fk}', team '{team_id_fk}' missing 'athlete.id' or valid 'athlete.$ref'. "
-                        f"Entry: {player_entry}"
+                        "Player entry for event '%s', team '%s' missing 'athlete.id' or valid 'athlete.$ref'. "
+                        "Entry: %s",
+                        event_id_fk,
+                        team_id_fk,
+                        payload(player_entry),
                     )
                     continue
 
@@ -1307,31 +2134,117 @@ def espn_source(
 
             if not processed_any_player and not roster_entries:
                 logger.debug(
-                    f"No player entries found in the roster response from {roster_ref_url} "
-                    f"for event '{event_id_fk}', team '{team_id_fk}'. API returned empty list or no parsable entries."
+                    "No player entries found in the roster response from %s "
+                    "for event '%s', team '%s'. API returned empty list or no parsable entries.",
+                    roster_ref_url,
+                    event_id_fk,
+                    team_id_fk,
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event roster from {roster_ref_url} "
-                f"(event_id_fk: {event_id_fk}, team_id_fk: {team_id_fk}): {e}",
+                "Unexpected error fetching/processing event roster from %s "
+                "(event_id_fk: %s, team_id_fk: %s): %s",
+                roster_ref_url,
+                event_id_fk,
+                team_id_fk,
+                e,
                 exc_info=True,
             )
         # If nothing yielded, dlt handles it.
 
-    @dlt.transformer(
-        name="event_pregame_records",
+    def _pregame_record_rows(
+        event_id_fk: str,
+        team_id_fk: str,
+        records_ref_url: str,
+        records_summary_list: list[Any],
+    ) -> list[TDataItem]:
+        """
+        Unnests pre-game team records into one record per statistic per record type
+        (e.g., overall wins, overall losses), as one Arrow record batch with arrow_stats.
+        """
+        stat_rows = TidyRows(arrow=arrow_stats)
+        for record_summary_item in records_summary_list:
+            if not isinstance(record_summary_item, dict):
+                logger.warning(
+                    "Malformed record summary item: %s. Skipping.", payload(record_summary_item)
+                )
+                continue
+
+            record_type = record_summary_item.get(
+                "type", record_summary_item.get("name", "unknown_type")
+            )
+            record_summary_display = record_summary_item.get(
+                "summary", record_summary_item.get("displayValue")
+            )
+
+            stats_list = record_summary_item.get("stats")
+            if not stats_list or not isinstance(stats_list, list):
+                logger.debug(
+                    "No 'stats' list in record summary for type '%s', event '%s', "
+                    "team '%s'. Summary item: %s",
+                    record_type,
+                    event_id_fk,
+                    team_id_fk,
+                    payload(record_summary_item),
+                )
+                continue
+
+            for stat_detail in stats_list:
+                if not isinstance(stat_detail, dict) or "name" not in stat_detail:
+                    logger.warning(
+                        "Malformed stat detail in pre-game records: %s. "
+                        "Type '%s', event '%s', team '%s'. Skipping.",
+                        payload(stat_detail),
+                        record_type,
+                        event_id_fk,
+                        team_id_fk,
+                    )
+                    continue
+
+                stat_name = stat_detail.get("name")
+                # Value can be integer (e.g. wins) or float (e.g. win %)
+                stat_value = stat_detail.get("value", stat_detail.get("displayValue"))
+
+                record_stat_entry = {
+                    "event_id_fk": event_id_fk,
+                    "team_id_fk": team_id_fk,
+                    "record_type": str(record_type),
+                    "stat_name": str(stat_name),
+                    "stat_value": str(stat_value)
+                    if stat_value is not None
+                    else None,  # Store as string for consistency
+                    "record_summary_display": str(record_summary_display)
+                    if record_summary_display is not None
+                    else None,
+                    # Optional: include original summary values if needed
+                    # "original_summary": record_summary_item.get("summary"),
+                    # "original_type_description": record_summary_item.get("description"),
+                }
+                stat_rows.append(record_stat_entry)
+
+        if not stat_rows and not records_summary_list:
+            logger.debug(
+                "No pre-game record stats found or processed for event '%s', team '%s' from %s. "
+                "API might have returned empty list or all items were malformed.",
+                event_id_fk,
+                team_id_fk,
+                records_ref_url,
+            )
+        return stat_rows.items()
+
+    @dlt.transformer(  # Intermediate: pre-game record rows for the tidy and wide tables
+        name="event_pregame_records_rows",  # Not a final table, but a source for the resources below
         data_from=event_competitors_transformer,
-        write_disposition="merge",
-        primary_key=["event_id_fk", "team_id_fk", "record_type", "stat_name"],
     )
-    @dlt.defer
-    def event_pregame_records_transformer(
+    @fetcher.defer
+    async def event_pregame_records_fetcher_transformer(
         competitor_record: dict[str, Any],
-    ) -> Iterable[TDataItem] | None:
+    ) -> TDataItem | None:
         """
-        Fetches and unnests pre-game team records (overall, home, away, etc.) for an event.
-        Yields one record per statistic per record type (e.g., overall wins, overall losses).
+        Fetches pre-game team records (overall, home, away, etc.) for an event and unnests
+        them where the fetch ran. Yields the tidy event_pregame_records rows and the
+        event_pregame_records_wide row (with wide_stats).
         """
         event_id_fk = competitor_record.get("event_id_fk")
         team_id_fk = competitor_record.get("id")  # competitor's 'id' is team_id for the event
@@ -1339,131 +2252,132 @@ def espn_source(
 
         if not all([event_id_fk, team_id_fk]):
             logger.warning(
-                f"Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
-                f"Cannot fetch pre-game records. Record: {competitor_record}"
+                "Competitor record missing 'event_id_fk' or 'id' (team_id_fk). "
+                "Cannot fetch pre-game records. Record: %s",
+                payload(competitor_record),
             )
-            yield from []
-            return
+            return None
 
         if not records_ref_url:
             logger.info(
-                f"Competitor record for event '{event_id_fk}', team '{team_id_fk}' missing 'records.$ref'. "
-                f"No pre-game records to fetch."
+                "Competitor record for event '%s', team '%s' missing 'records.$ref'. "
+                "No pre-game records to fetch.",
+                event_id_fk,
+                team_id_fk,
             )
-            yield from []
-            return
+            return None
 
         logger.debug(
-            f"Fetching pre-game records for event '{event_id_fk}', team '{team_id_fk}' from: {records_ref_url}"
+            "Fetching pre-game records for event '%s', team '%s' from: %s",
+            event_id_fk,
+            team_id_fk,
+            records_ref_url,
         )
         try:
-            response = detail_client.get(records_ref_url)
-            response.raise_for_status()
-            records_summary_list = (
-                response.json()
-            )  # Expected to be a list of record summary objects
+            # Expected to be a list of record summary objects
+            records_summary_list = await fetcher.get_json(records_ref_url)
 
             if not isinstance(records_summary_list, list):
-                # Sometimes the API might return a dict with 'items' or 'entries'
-                if isinstance(records_summary_list, dict):
-                    if "items" in records_summary_list and isinstance(
-                        records_summary_list.get("items"), list
-                    ):
-                        records_summary_list = records_summary_list["items"]
-                    elif "entries" in records_summary_list and isinstance(
-                        records_summary_list.get("entries"), list
-                    ):
-                        records_summary_list = records_summary_list["entries"]
-                    else:
-                        logger.warning(
-                            f"Unexpected pre-game records data format from {records_ref_url} for event '{event_id_fk}', "
-                            f"team '{team_id_fk}'. Expected list or dict with 'items'/'entries'. Data: {records_summary_list}"
-                        )
-                        yield from []
-                        return
-                else:
-                    logger.warning(
-                        f"Unexpected pre-game records data format from {records_ref_url} for event '{event_id_fk}', "
-                        f"team '{team_id_fk}'. Expected list. Data: {records_summary_list}"
-                    )
-                    yield from []
-                    return
-
-            processed_any_record_stat = False
-            for record_summary_item in records_summary_list:
-                if not isinstance(record_summary_item, dict):
-                    logger.warning(
-                        f"Malformed record summary item: {record_summary_item}. Skipping."
-                    )
-                    continue
-
-                record_type = record_summary_item.get(
-                    "type", record_summary_item.get("name", "unknown_type")
-                )
-                record_summary_display = record_summary_item.get(
-                    "summary", record_summary_item.get("displayValue")
-                )
-
-                stats_list = record_summary_item.get("stats")
-                if not stats_list or not isinstance(stats_list, list):
-                    logger.debug(
-                        f"No 'stats' list in record summary for type '{record_type}', event '{event_id_fk}', "
-                        f"team '{team_id_fk}'. Summary item: {record_summary_item}"
-                    )
-                    continue
-
-                for stat_detail in stats_list:
-                    if not isinstance(stat_detail, dict) or "name" not in stat_detail:
+                # Sometimes the API might return a dict with 'items' or 'entries'
+                if isinstance(records_summary_list, dict):
+                    if "items" in records_summary_list and isinstance(
+                        records_summary_list.get("items"), list
+                    ):
+                        records_summary_list = records_summary_list["items"]
+                    elif "entries" in records_summary_list and isinstance(
+                        records_summary_list.get("entries"), list
+                    ):
+                        records_summary_list = records_summary_list["entries"]
+                    else:
                         logger.warning(
-                            f"Malformed stat detail in pre-game records: {stat_detail}. "
-                            f"Type '{record_type}', event '{event_id_fk}', team '{team_id_fk}'. Skipping."
+                            "Unexpected pre-game records data format from %s for event '%s', "
+                            "team '%s'. Expected list or dict with 'items'/'entries'. Data: %s",
+                            records_ref_url,
+                            event_id_fk,
+                            team_id_fk,
+                            payload(records_summary_list),
                         )
-                        continue
-
-                    stat_name = stat_detail.get("name")
-                    # Value can be integer (e.g. wins) or float (e.g. win %)
-                    stat_value = stat_detail.get("value", stat_detail.get("displayValue"))
-
-                    record_stat_entry = {
-                        "event_id_fk": str(event_id_fk),
-                        "team_id_fk": str(team_id_fk),
-                        "record_type": str(record_type),
-                        "stat_name": str(stat_name),
-                        "stat_value": str(stat_value)
-                        if stat_value is not None
-                        else None,  # Store as string for consistency
-                        "record_summary_display": str(record_summary_display)
-                        if record_summary_display is not None
-                        else None,
-                        # Optional: include original summary values if needed
-                        # "original_summary": record_summary_item.get("summary"),
-                        # "original_type_description": record_summary_item.get("description"),
-                    }
-                    yield record_stat_entry
-                    processed_any_record_stat = True
-
-            if not processed_any_record_stat and not records_summary_list:
-                logger.debug(
-                    f"No pre-game record stats found or processed for event '{event_id_fk}', team '{team_id_fk}' from {records_ref_url}. "
-                    f"API might have returned empty list or all items were malformed."
-                )
+                        return None
+                else:
+                    logger.warning(
+                        "Unexpected pre-game records data format from %s for event '%s', "
+                        "team '%s'. Expected list. Data: %s",
+                        records_ref_url,
+                        event_id_fk,
+                        team_id_fk,
+                        payload(records_summary_list),
+                    )
+                    return None
+
+            event_id_fk, team_id_fk = str(event_id_fk), str(team_id_fk)
+            wide_row = None
+            if wide_stats and records_summary_list:
+                wide_row = {
+                    "event_id_fk": event_id_fk,
+                    "team_id_fk": team_id_fk,
+                    **pregame_record_values(records_summary_list),
+                }
+
+            return {
+                "stat_rows": _pregame_record_rows(
+                    event_id_fk, team_id_fk, records_ref_url, records_summary_list
+                ),
+                "wide_row": wide_row,
+            }
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing pre-game records from {records_ref_url} "
-                f"(event_id_fk: {event_id_fk}, team_id_fk: {team_id_fk}): {e}",
+                "Unexpected error fetching/processing pre-game records from %s "
+                "(event_id_fk: %s, team_id_fk: %s): %s",
+                records_ref_url,
+                event_id_fk,
+                team_id_fk,
+                e,
                 exc_info=True,
             )
-        # If nothing yielded, dlt handles it.
+            return None
+
+    @dlt.transformer(
+        name="event_pregame_records",
+        data_from=event_pregame_records_fetcher_transformer,
+        write_disposition="merge",
+        primary_key=["event_id_fk", "team_id_fk", "record_type", "stat_name"],
+    )
+    def event_pregame_records_processor_transformer(
+        pregame_records_rows: dict[str, Any],
+    ) -> Iterable[TDataItem]:
+        """
+        Passes on the tidy pre-game record stats of event_pregame_records_rows (one per
+        statistic per record type, as one Arrow record batch with arrow_stats).
+        """
+        yield from pregame_records_rows["stat_rows"]
+
+    @dlt.transformer(
+        name="event_pregame_records_wide",
+        data_from=event_pregame_records_fetcher_transformer,
+        write_disposition="merge",
+        primary_key=["event_id_fk", "team_id_fk"],
+        columns=double_columns(PREGAME_RECORD_COLUMNS),
+    )
+    def event_pregame_records_wide_transformer(
+        pregame_records_rows: dict[str, Any],
+    ) -> TDataItem | None:
+        """
+        One row per team and event, with a double column per record type and statistic
+        (see `espn_stats.PREGAME_RECORD_STATS`, e.g. home_wins) instead of a text row per stat.
+        """
+        return pregame_records_rows["wide_row"]
 
     @dlt.transformer(
         name="event_status",
-        data_from=event_detail_fetcher_transformer,  # Takes directly from event_detail
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key="event_id_fk",
     )
-    @dlt.defer
-    def event_status_detail_fetcher_transformer(event_detail: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def event_status_detail_fetcher_transformer(
+        event_detail: dict[str, Any],
+    ) -> TDataItem | None:
         """
         Fetches the current status for a game using event_detail.competitions[0].status.$ref.
         """
@@ -1475,21 +2389,30 @@ def espn_source(
 
         if not event_id_fk:
             logger.warning(
-                f"Event detail missing 'id'. Cannot fetch status. Detail: {event_detail}"
+                "Event detail missing 'id'. Cannot fetch status. Detail: %s", payload(event_detail)
             )
             return None
 
         if not status_ref_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].status.$ref'. No status to fetch."
+                "Event detail for '%s' missing 'competitions[0].status.$ref'. No status to fetch.",
+                event_id_fk,
             )
             return None
 
-        logger.debug(f"Fetching event status for event '{event_id_fk}' from: {status_ref_url}")
+        logger.debug("Fetching event status for event '%s' from: %s", event_id_fk, status_ref_url)
         try:
-            response = detail_client.get(status_ref_url)
-            response.raise_for_status()
-            status_data = response.json()
+            status_data = await fetcher.get_json(status_ref_url)
+
+            # Sub-resources of a completed game are immutable from here on
+            if status_data.get("type", {}).get("completed"):
+                tip_off = parse_api_timestamp(event_detail.get("date"))
+                settled_at = tip_off + EVENT_SETTLE_SECONDS if tip_off else None
+                event_statuses.mark_final(str(event_id_fk), settled_at=settled_at)
+                if response_cache:
+                    response_cache.mark_final(
+                        event_detail.get("$ref") or status_ref_url, final_since=settled_at
+                    )
 
             status_data_augmented = status_data.copy()
             status_data_augmented["event_id_fk"] = str(event_id_fk)
@@ -1497,19 +2420,22 @@ def espn_source(
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching event status from {status_ref_url} (event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching event status from %s (event_id_fk: %s): %s",
+                status_ref_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
             return None
 
     @dlt.transformer(
         name="event_situation",
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key="event_id_fk",
     )
-    @dlt.defer
-    def event_situation_detail_fetcher_transformer(
+    @fetcher.defer
+    async def event_situation_detail_fetcher_transformer(
         event_detail: dict[str, Any],
     ) -> TDataItem | None:
         """
@@ -1523,23 +2449,23 @@ def espn_source(
 
         if not event_id_fk:
             logger.warning(
-                f"Event detail missing 'id'. Cannot fetch situation. Detail: {event_detail}"
+                "Event detail missing 'id'. Cannot fetch situation. Detail: %s",
+                payload(event_detail),
             )
             return None
 
         if not situation_ref_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].situation.$ref'. No situation to fetch."
+                "Event detail for '%s' missing 'competitions[0].situation.$ref'. No situation to fetch.",
+                event_id_fk,
             )
             return None
 
         logger.debug(
-            f"Fetching event situation for event '{event_id_fk}' from: {situation_ref_url}"
+            "Fetching event situation for event '%s' from: %s", event_id_fk, situation_ref_url
         )
         try:
-            response = detail_client.get(situation_ref_url)
-            response.raise_for_status()
-            situation_data = response.json()
+            situation_data = await fetcher.get_json(situation_ref_url)
 
             situation_data_augmented = situation_data.copy()
             situation_data_augmented["event_id_fk"] = str(event_id_fk)
@@ -1547,19 +2473,22 @@ def espn_source(
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching event situation from {situation_ref_url} (event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching event situation from %s (event_id_fk: %s): %s",
+                situation_ref_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
             return None
 
     @dlt.transformer(
         name="event_predictor",
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key="event_id_fk",
     )
-    @dlt.defer
-    def event_predictor_detail_fetcher_transformer(
+    @fetcher.defer
+    async def event_predictor_detail_fetcher_transformer(
         event_detail: dict[str, Any],
     ) -> TDataItem | None:
         """
@@ -1573,23 +2502,23 @@ def espn_source(
 
         if not event_id_fk:
             logger.warning(
-                f"Event detail missing 'id'. Cannot fetch predictor. Detail: {event_detail}"
+                "Event detail missing 'id'. Cannot fetch predictor. Detail: %s",
+                payload(event_detail),
             )
             return None
 
         if not predictor_ref_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].predictor.$ref'. No predictor data to fetch."
+                "Event detail for '%s' missing 'competitions[0].predictor.$ref'. No predictor data to fetch.",
+                event_id_fk,
             )
             return None
 
         logger.debug(
-            f"Fetching event predictor data for event '{event_id_fk}' from: {predictor_ref_url}"
+            "Fetching event predictor data for event '%s' from: %s", event_id_fk, predictor_ref_url
         )
         try:
-            response = detail_client.get(predictor_ref_url)
-            response.raise_for_status()
-            predictor_data = response.json()
+            predictor_data = await fetcher.get_json(predictor_ref_url)
 
             predictor_data_augmented = predictor_data.copy()
             predictor_data_augmented["event_id_fk"] = str(event_id_fk)
@@ -1597,19 +2526,22 @@ def espn_source(
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching event predictor_data from {predictor_ref_url} (event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching event predictor_data from %s (event_id_fk: %s): %s",
+                predictor_ref_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
             return None
 
     @dlt.transformer(
         name="event_odds",
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key=["event_id_fk", "provider_id_fk"],
     )
-    @dlt.defer
-    def event_odds_transformer(event_detail: dict[str, Any]) -> Iterable[TDataItem] | None:
+    @fetcher.defer
+    async def event_odds_transformer(event_detail: dict[str, Any]) -> AsyncIterator[TDataItem]:
         """
         Fetches betting odds for a game from event_detail.competitions[0].odds.$ref.
         Yields one record per odds provider.
@@ -1621,22 +2553,21 @@ def espn_source(
             odds_ref_url = competitions[0].get("odds", {}).get("$ref")
 
         if not event_id_fk:
-            logger.warning(f"Event detail missing 'id'. Cannot fetch odds. Detail: {event_detail}")
-            yield from []
+            logger.warning(
+                "Event detail missing 'id'. Cannot fetch odds. Detail: %s", payload(event_detail)
+            )
             return
 
         if not odds_ref_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].odds.$ref'. No odds to fetch."
+                "Event detail for '%s' missing 'competitions[0].odds.$ref'. No odds to fetch.",
+                event_id_fk,
             )
-            yield from []
             return
 
-        logger.debug(f"Fetching event odds for event '{event_id_fk}' from: {odds_ref_url}")
+        logger.debug("Fetching event odds for event '%s' from: %s", event_id_fk, odds_ref_url)
         try:
-            response = detail_client.get(odds_ref_url)
-            response.raise_for_status()
-            odds_data_list = response.json()
+            odds_data_list = await fetcher.get_json(odds_ref_url)
 
             if not isinstance(odds_data_list, list):
                 # Check for common wrapper keys if not a direct list
@@ -1649,22 +2580,26 @@ def espn_source(
                         odds_data_list = odds_data_list["providers"]
                     else:
                         logger.warning(
-                            f"Unexpected odds data format from {odds_ref_url} for event '{event_id_fk}'. "
-                            f"Expected list or dict with 'items'/'providers'. Data: {odds_data_list}"
+                            "Unexpected odds data format from %s for event '%s'. "
+                            "Expected list or dict with 'items'/'providers'. Data: %s",
+                            odds_ref_url,
+                            event_id_fk,
+                            payload(odds_data_list),
                         )
-                        yield from []
                         return
                 else:
                     logger.warning(
-                        f"Unexpected odds data format from {odds_ref_url} for event '{event_id_fk}'. Expected list. Data: {odds_data_list}"
+                        "Unexpected odds data format from %s for event '%s'. Expected list. Data: %s",
+                        odds_ref_url,
+                        event_id_fk,
+                        payload(odds_data_list),
                     )
-                    yield from []
                     return
 
             processed_any = False
             for odds_item in odds_data_list:
                 if not isinstance(odds_item, dict):
-                    logger.warning(f"Malformed odds item: {odds_item}. Skipping.")
+                    logger.warning("Malformed odds item: %s. Skipping.", payload(odds_item))
                     continue
 
                 provider_obj = odds_item.get("provider", {})
@@ -1672,7 +2607,9 @@ def espn_source(
 
                 if not provider_id_fk:
                     logger.warning(
-                        f"Odds item for event '{event_id_fk}' missing 'provider.id'. Item: {odds_item}"
+                        "Odds item for event '%s' missing 'provider.id'. Item: %s",
+                        event_id_fk,
+                        payload(odds_item),
                     )
                     continue
 
@@ -1686,17 +2623,22 @@ def espn_source(
                 processed_any = True
 
             if not processed_any and not odds_data_list:
-                logger.debug(f"No odds items found for event '{event_id_fk}' from {odds_ref_url}.")
+                logger.debug(
+                    "No odds items found for event '%s' from %s.", event_id_fk, odds_ref_url
+                )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event odds from {odds_ref_url} (event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching/processing event odds from %s (event_id_fk: %s): %s",
+                odds_ref_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
 
     @dlt.transformer(
         name="event_broadcasts",
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key=[
             "event_id_fk",
@@ -1704,8 +2646,10 @@ def espn_source(
             "type",
         ],  # Using 'type' as part of PK for market/lang type
     )
-    @dlt.defer
-    def event_broadcasts_transformer(event_detail: dict[str, Any]) -> Iterable[TDataItem] | None:
+    @fetcher.defer
+    async def event_broadcasts_transformer(
+        event_detail: dict[str, Any],
+    ) -> AsyncIterator[TDataItem]:
         """
         Fetches broadcast information for a game from event_detail.competitions[0].broadcasts.$ref.
         Yields one record per broadcast entry.
@@ -1718,25 +2662,23 @@ def espn_source(
 
         if not event_id_fk:
             logger.warning(
-                f"Event detail missing 'id'. Cannot fetch broadcasts. Detail: {event_detail}"
+                "Event detail missing 'id'. Cannot fetch broadcasts. Detail: %s",
+                payload(event_detail),
             )
-            yield from []
             return
 
         if not broadcasts_ref_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].broadcasts.$ref'. No broadcasts to fetch."
+                "Event detail for '%s' missing 'competitions[0].broadcasts.$ref'. No broadcasts to fetch.",
+                event_id_fk,
             )
-            yield from []
             return
 
         logger.debug(
-            f"Fetching event broadcasts for event '{event_id_fk}' from: {broadcasts_ref_url}"
+            "Fetching event broadcasts for event '%s' from: %s", event_id_fk, broadcasts_ref_url
         )
         try:
-            response = detail_client.get(broadcasts_ref_url)
-            response.raise_for_status()
-            broadcast_data_list = response.json()
+            broadcast_data_list = await fetcher.get_json(broadcasts_ref_url)
 
             if not isinstance(broadcast_data_list, list):
                 # Check for common wrapper keys if not a direct list
@@ -1748,16 +2690,20 @@ def espn_source(
                     broadcast_data_list = broadcast_data_list["items"]
                 else:
                     logger.warning(
-                        f"Unexpected broadcast data format from {broadcasts_ref_url} for event '{event_id_fk}'. "
-                        f"Expected list. Data: {broadcast_data_list}"
+                        "Unexpected broadcast data format from %s for event '%s'. "
+                        "Expected list. Data: %s",
+                        broadcasts_ref_url,
+                        event_id_fk,
+                        payload(broadcast_data_list),
                     )
-                    yield from []
                     return
 
             processed_any = False
             for broadcast_item in broadcast_data_list:
                 if not isinstance(broadcast_item, dict):
-                    logger.warning(f"Malformed broadcast item: {broadcast_item}. Skipping.")
+                    logger.warning(
+                        "Malformed broadcast item: %s. Skipping.", payload(broadcast_item)
+                    )
                     continue
 
                 media_obj = broadcast_item.get("media", {})
@@ -1770,7 +2716,9 @@ def espn_source(
 
                 if not media_id_fk:
                     logger.warning(
-                        f"Broadcast item for event '{event_id_fk}' missing 'media.id'. Item: {broadcast_item}"
+                        "Broadcast item for event '%s' missing 'media.id'. Item: %s",
+                        event_id_fk,
+                        payload(broadcast_item),
                     )
                     continue
 
@@ -1784,26 +2732,33 @@ def espn_source(
 
             if not processed_any and not broadcast_data_list:
                 logger.debug(
-                    f"No broadcast items found for event '{event_id_fk}' from {broadcasts_ref_url}."
+                    "No broadcast items found for event '%s' from %s.",
+                    event_id_fk,
+                    broadcasts_ref_url,
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event broadcasts from {broadcasts_ref_url} (event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching/processing event broadcasts from %s (event_id_fk: %s): %s",
+                broadcasts_ref_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
 
     @dlt.transformer(
         name="event_probabilities",
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key=[
             "event_id_fk",
             "play_id",
         ],  # Using play_id as suggested, ensure it stringifies playId from API
     )
-    @dlt.defer
-    def event_probabilities_transformer(event_detail: dict[str, Any]) -> Iterable[TDataItem] | None:
+    @fetcher.defer
+    async def event_probabilities_transformer(
+        event_detail: dict[str, Any],
+    ) -> AsyncIterator[TDataItem]:
         """
         Fetches time-series win probability data from event_detail.competitions[0].probabilities.$ref.
         Yields one record per probability entry.
@@ -1816,25 +2771,25 @@ def espn_source(
 
         if not event_id_fk:
             logger.warning(
-                f"Event detail missing 'id'. Cannot fetch probabilities. Detail: {event_detail}"
+                "Event detail missing 'id'. Cannot fetch probabilities. Detail: %s",
+                payload(event_detail),
             )
-            yield from []
             return
 
         if not probabilities_ref_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].probabilities.$ref'. No probabilities to fetch."
+                "Event detail for '%s' missing 'competitions[0].probabilities.$ref'. No probabilities to fetch.",
+                event_id_fk,
             )
-            yield from []
             return
 
         logger.debug(
-            f"Fetching event probabilities for event '{event_id_fk}' from: {probabilities_ref_url}"
+            "Fetching event probabilities for event '%s' from: %s",
+            event_id_fk,
+            probabilities_ref_url,
         )
         try:
-            response = detail_client.get(probabilities_ref_url)
-            response.raise_for_status()
-            probabilities_data_list = response.json()
+            probabilities_data_list = await fetcher.get_json(probabilities_ref_url)
 
             if not isinstance(probabilities_data_list, list):
                 # Check for common wrapper keys if not a direct list
@@ -1846,28 +2801,27 @@ def espn_source(
                     probabilities_data_list = probabilities_data_list["items"]
                 else:
                     logger.warning(
-                        f"Unexpected probabilities data format from {probabilities_ref_url} for event '{event_id_fk}'. "
-                        f"Expected list. Data: {probabilities_data_list}"
+                        "Unexpected probabilities data format from %s for event '%s'. "
+                        "Expected list. Data: %s",
+                        probabilities_ref_url,
+                        event_id_fk,
+                        payload(probabilities_data_list),
                     )
-                    yield from []
                     return
 
             processed_any = False
             for prob_item in probabilities_data_list:
-                if (
-                    not isinstance(prob_item, dict) or "playId" not in prob_item
-                ):  # playId is often the key element
+                play_id = _probability_play_id(prob_item) if isinstance(prob_item, dict) else None
+                if play_id is None:  # the play is the key element
                     logger.warning(
-                        f"Malformed probability item or missing 'playId': {prob_item}. Skipping."
+                        "Malformed probability item or missing 'playId'/'play.$ref': %s. Skipping.",
+                        payload(prob_item),
                     )
                     continue
 
                 prob_record = prob_item.copy()
                 prob_record["event_id_fk"] = str(event_id_fk)
-                # Ensure the playId used for PK is a string
-                prob_record["play_id"] = str(
-                    prob_item["playId"]
-                )  # Rename for dlt schema, use as PK part
+                prob_record["play_id"] = play_id  # Rename for dlt schema, use as PK part
 
                 # Remove original playId if renamed, to avoid confusion, or let dlt handle it.
                 # if "playId" in prob_record and "play_id" in prob_record:
@@ -1878,26 +2832,33 @@ def espn_source(
 
             if not processed_any and not probabilities_data_list:
                 logger.debug(
-                    f"No probability items found for event '{event_id_fk}' from {probabilities_ref_url}."
+                    "No probability items found for event '%s' from %s.",
+                    event_id_fk,
+                    probabilities_ref_url,
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event probabilities from {probabilities_ref_url} (event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching/processing event probabilities from %s (event_id_fk: %s): %s",
+                probabilities_ref_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
 
     @dlt.transformer(
         name="event_powerindex_stats",  # Tidy format
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key=["event_id_fk", "team_id_fk", "stat_name"],
     )
-    @dlt.defer
-    def event_powerindex_transformer(event_detail: dict[str, Any]) -> Iterable[TDataItem] | None:
+    @fetcher.defer
+    async def event_powerindex_transformer(
+        event_detail: dict[str, Any],
+    ) -> AsyncIterator[TDataItem]:
         """
         Fetches team power index ratings (BPI/FPI) for the game from event_detail.competitions[0].powerindex.$ref.
-        Yields tidy stats (one row per stat per team).
+        Yields tidy stats (one row per stat per team; one Arrow record batch with arrow_stats).
         """
         event_id_fk = event_detail.get("id")
         powerindex_ref_url = None
@@ -1907,38 +2868,43 @@ def espn_source(
 
         if not event_id_fk:
             logger.warning(
-                f"Event detail missing 'id'. Cannot fetch power index. Detail: {event_detail}"
+                "Event detail missing 'id'. Cannot fetch power index. Detail: %s",
+                payload(event_detail),
             )
-            yield from []
             return
 
         if not powerindex_ref_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].powerindex.$ref'. No power index to fetch."
+                "Event detail for '%s' missing 'competitions[0].powerindex.$ref'. No power index to fetch.",
+                event_id_fk,
             )
-            yield from []
             return
 
         logger.debug(
-            f"Fetching event power index for event '{event_id_fk}' from: {powerindex_ref_url}"
+            "Fetching event power index for event '%s' from: %s", event_id_fk, powerindex_ref_url
         )
         try:
-            response = detail_client.get(powerindex_ref_url)
-            response.raise_for_status()
-            powerindex_data_list = response.json()  # Usually a list of 2 items (one per team)
+            powerindex_data_list = await fetcher.get_json(
+                powerindex_ref_url
+            )  # Usually a list of 2 items (one per team)
 
             if not isinstance(powerindex_data_list, list):
                 logger.warning(
-                    f"Unexpected power index data format from {powerindex_ref_url} for event '{event_id_fk}'. "
-                    f"Expected list. Data: {powerindex_data_list}"
+                    "Unexpected power index data format from %s for event '%s'. "
+                    "Expected list. Data: %s",
+                    powerindex_ref_url,
+                    event_id_fk,
+                    payload(powerindex_data_list),
                 )
-                yield from []
                 return
 
+            stat_rows = TidyRows(arrow=arrow_stats)
             processed_any_stat = False
             for team_pi_data in powerindex_data_list:
                 if not isinstance(team_pi_data, dict):
-                    logger.warning(f"Malformed team power index data: {team_pi_data}. Skipping.")
+                    logger.warning(
+                        "Malformed team power index data: %s. Skipping.", payload(team_pi_data)
+                    )
                     continue
 
                 team_obj = team_pi_data.get("team", {})
@@ -1946,20 +2912,27 @@ def espn_source(
 
                 if not team_id_fk:
                     logger.warning(
-                        f"Team power index data for event '{event_id_fk}' missing 'team.id'. Data: {team_pi_data}"
+                        "Team power index data for event '%s' missing 'team.id'. Data: %s",
+                        event_id_fk,
+                        payload(team_pi_data),
                     )
                     continue
 
                 stats_list = team_pi_data.get("stats")
                 if not stats_list or not isinstance(stats_list, list):
                     logger.debug(
-                        f"No 'stats' list in power index data for team '{team_id_fk}', event '{event_id_fk}'. Item: {team_pi_data}"
+                        "No 'stats' list in power index data for team '%s', event '%s'. Item: %s",
+                        team_id_fk,
+                        event_id_fk,
+                        payload(team_pi_data),
                     )
                     continue
 
                 for stat_item in stats_list:
                     if not isinstance(stat_item, dict) or "name" not in stat_item:
-                        logger.warning(f"Malformed power index stat item: {stat_item}. Skipping.")
+                        logger.warning(
+                            "Malformed power index stat item: %s. Skipping.", payload(stat_item)
+                        )
                         continue
 
                     stat_name = stat_item.get("name")
@@ -1971,30 +2944,36 @@ def espn_source(
                         "stat_name": str(stat_name),
                         "stat_value": str(stat_value) if stat_value is not None else None,
                     }
-                    yield pi_stat_record
+                    stat_rows.append(pi_stat_record)
                     processed_any_stat = True
+            for batch in stat_rows.items():
+                yield batch
 
             if not processed_any_stat and not powerindex_data_list:
                 logger.debug(
-                    f"No power index stats found for event '{event_id_fk}' "
-                    f"from {powerindex_ref_url}."
+                    "No power index stats found for event '%s' from %s.",
+                    event_id_fk,
+                    powerindex_ref_url,
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event power index "
-                f"from {powerindex_ref_url} (event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching/processing event power index "
+                "from %s (event_id_fk: %s): %s",
+                powerindex_ref_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
 
     @dlt.transformer(
         name="event_officials",
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key=["event_id_fk", "official_id"],
     )
-    @dlt.defer
-    def event_officials_transformer(event_detail: dict[str, Any]) -> Iterable[TDataItem] | None:
+    @fetcher.defer
+    async def event_officials_transformer(event_detail: dict[str, Any]) -> AsyncIterator[TDataItem]:
         """
         Fetches officials assigned to the game from event_detail.competitions[0].officials.$ref.
         Yields one record per official.
@@ -2007,26 +2986,24 @@ def espn_source(
 
         if not event_id_fk:
             logger.warning(
-                f"Event detail missing 'id'. Cannot fetch officials. Detail: {event_detail}"
+                "Event detail missing 'id'. Cannot fetch officials. Detail: %s",
+                payload(event_detail),
             )
-            yield from []
             return
 
         if not officials_ref_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].officials.$ref'. "
-                f"No officials to fetch."
+                "Event detail for '%s' missing 'competitions[0].officials.$ref'. "
+                "No officials to fetch.",
+                event_id_fk,
             )
-            yield from []
             return
 
         logger.debug(
-            f"Fetching event officials for event '{event_id_fk}' from: {officials_ref_url}"
+            "Fetching event officials for event '%s' from: %s", event_id_fk, officials_ref_url
         )
         try:
-            response = detail_client.get(officials_ref_url)
-            response.raise_for_status()
-            officials_data_list = response.json()
+            officials_data_list = await fetcher.get_json(officials_ref_url)
 
             if not isinstance(officials_data_list, list):
                 if (
@@ -2037,17 +3014,19 @@ def espn_source(
                     officials_data_list = officials_data_list["items"]
                 else:
                     logger.warning(
-                        f"Unexpected officials data format from {officials_ref_url} "
-                        f"for event '{event_id_fk}'. "
-                        f"Expected list. Data: {officials_data_list}"
+                        "Unexpected officials data format from %s "
+                        "for event '%s'. "
+                        "Expected list. Data: %s",
+                        officials_ref_url,
+                        event_id_fk,
+                        payload(officials_data_list),
                     )
-                    yield from []
                     return
 
             processed_any = False
             for official_item in officials_data_list:
                 if not isinstance(official_item, dict):
-                    logger.warning(f"Malformed official item: {official_item}. Skipping.")
+                    logger.warning("Malformed official item: %s. Skipping.", payload(official_item))
                     continue
 
                 # Official ID might be directly in 'id' or nested under 'official.id'
@@ -2059,8 +3038,9 @@ def espn_source(
 
                 if not official_id:
                     logger.warning(
-                        f"Official item for event '{event_id_fk}' missing 'id' or 'official.id'. "
-                        f"Item: {official_item}"
+                        "Official item for event '%s' missing 'id' or 'official.id'. Item: %s",
+                        event_id_fk,
+                        payload(official_item),
                     )
                     continue
 
@@ -2080,65 +3060,76 @@ def espn_source(
 
             if not processed_any and not officials_data_list:
                 logger.debug(
-                    f"No official items found for event '{event_id_fk}' from {officials_ref_url}."
+                    "No official items found for event '%s' from %s.",
+                    event_id_fk,
+                    officials_ref_url,
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event officials from {officials_ref_url} "
-                f"(event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching/processing event officials from %s "
+                "(event_id_fk: %s): %s",
+                officials_ref_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
 
     @dlt.transformer(
         name="event_plays",
-        data_from=event_detail_fetcher_transformer,
+        data_from=event_handles_transformer,
         write_disposition="merge",
         primary_key=["event_id_fk", "id"],
     )
-    @dlt.defer
-    def event_plays_lister_transformer(event_detail: dict[str, Any]) -> Iterable[TDataItem] | None:
+    @fetcher.defer
+    async def event_plays_lister_transformer(
+        event_detail: dict[str, Any],
+    ) -> AsyncIterator[TDataItem]:
         """
         Fetches paginated play-by-play data for an event from
-        event_detail.competitions[0].plays.$ref.
-        Uses list_client to handle pagination.
+        event_detail.competitions[0].details.$ref (older documents call it "plays").
+        Uses fetcher.paginate to fetch the pages concurrently.
         Yields one record per play.
         """
         event_id_fk = event_detail.get("id")
         plays_collection_url = None
         competitions = event_detail.get("competitions")
         if competitions and isinstance(competitions, list) and competitions[0]:
-            plays_collection_url = competitions[0].get("plays", {}).get("$ref")
+            plays_ref = competitions[0].get("details") or competitions[0].get("plays") or {}
+            plays_collection_url = plays_ref.get("$ref")
 
         if not event_id_fk:
-            logger.warning(f"Event detail missing 'id'. Cannot fetch plays. Detail: {event_detail}")
-            yield from []
+            logger.warning(
+                "Event detail missing 'id'. Cannot fetch plays. Detail: %s", payload(event_detail)
+            )
             return
 
         if not plays_collection_url:
             logger.info(
-                f"Event detail for '{event_id_fk}' missing 'competitions[0].plays.$ref'. "
-                f"No plays to fetch."
+                "Event detail for '%s' missing 'competitions[0].details.$ref'. No plays to fetch.",
+                event_id_fk,
             )
-            yield from []
             return
 
         logger.debug(
-            f"Fetching event plays for event '{event_id_fk}' from paginated URL: "
-            f"{plays_collection_url}"
+            "Fetching event plays for event '%s' from paginated URL: %s",
+            event_id_fk,
+            plays_collection_url,
         )
         try:
             processed_any_play = False
-            # list_client.paginate will handle iterating through all pages
-            for play_page in list_client.paginate(
+            # fetcher.paginate fans out over all pages and yields them in order
+            async for play_page in fetcher.paginate(
                 plays_collection_url, params={"limit": API_LIMIT}
             ):
-                # play_page is already the list of items due to data_selector="items" in list_client
+                # play_page is already the list of items (the page's "items")
                 for play_item in play_page:
                     if not isinstance(play_item, dict) or "id" not in play_item:
                         logger.warning(
-                            f"Malformed play item or missing 'id' for event '{event_id_fk}'. "
-                            f"Item: {play_item}. Skipping."
+                            "Malformed play item or missing 'id' for event '%s'. "
+                            "Item: %s. Skipping.",
+                            event_id_fk,
+                            payload(play_item),
                         )
                         continue
 
@@ -2158,19 +3149,201 @@ def espn_source(
                 not processed_any_play
             ):  # This check might be redundant if paginate yields nothing on empty list
                 logger.debug(
-                    f"No play-by-play items found or processed for event '{event_id_fk}' "
-                    f"from {plays_collection_url}. "
-                    f"API might have returned empty list or all items were malformed."
+                    "No play-by-play items found or processed for event '%s' "
+                    "from %s. "
+                    "API might have returned empty list or all items were malformed.",
+                    event_id_fk,
+                    plays_collection_url,
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching/processing event plays from {plays_collection_url} "
-                f"(event_id_fk: {event_id_fk}): {e}",
+                "Unexpected error fetching/processing event plays from %s (event_id_fk: %s): %s",
+                plays_collection_url,
+                event_id_fk,
+                e,
                 exc_info=True,
             )
         # If nothing yielded, dlt handles it.
 
+    # --- Live Polling (used instead of everything else with live_mode) ---
+
+    @dlt.transformer(
+        name="event_status",
+        data_from=dated_event_refs_lister_resource,
+        write_disposition="merge",
+        primary_key="event_id_fk",
+    )
+    @fetcher.defer
+    async def live_event_status_transformer(event_ref_item: dict[str, Any]) -> TDataItem | None:
+        """
+        Polls the status of a listed event, without fetching the event document. Events a
+        previous poll saw completed are not polled again; events the first poll sees
+        completed only get their status row.
+        """
+        m = _EVENT_REF_RE.search(event_ref_item.get("$ref") or "")
+        if not m:
+            logger.warning("Event ref item without an event id. Item: %s", payload(event_ref_item))
+            return None
+        event_id_fk = m.group(1)
+        if live_cursors.is_final(event_id_fk):
+            return None
+
+        # College basketball events have a single competition sharing the event's id
+        status_url = f"{league_base_url}/events/{event_id_fk}/competitions/{event_id_fk}/status"
+        try:
+            status_data = await fetcher.get_json(status_url)
+            # A completing poll still reads the final plays; later ones skip the event
+            live_cursors.observe(event_id_fk, bool(status_data.get("type", {}).get("completed")))
+
+            status_data_augmented = status_data.copy()
+            status_data_augmented["event_id_fk"] = event_id_fk
+            return status_data_augmented
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error polling event status from %s (event_id_fk: %s): %s",
+                status_url,
+                event_id_fk,
+                e,
+                exc_info=True,
+            )
+            return None
+
+    def _live_competition_url(status_row: dict[str, Any], collection: str) -> str | None:
+        """URL of a competition sub-resource if the polled game has started, else None."""
+        if status_row.get("type", {}).get("state") == "pre":
+            return None
+        event_id_fk = status_row["event_id_fk"]
+        return f"{league_base_url}/events/{event_id_fk}/competitions/{event_id_fk}/{collection}"
+
+    @dlt.transformer(
+        name="event_situation",
+        data_from=live_event_status_transformer,
+        write_disposition="merge",
+        primary_key="event_id_fk",
+    )
+    @fetcher.defer
+    async def live_event_situation_transformer(status_row: dict[str, Any]) -> TDataItem | None:
+        """Fetches the situation (last play, timeouts, fouls) of games in progress."""
+        if status_row.get("type", {}).get("state") != "in":
+            return None
+        situation_url = _live_competition_url(status_row, "situation")
+        try:
+            situation_data = await fetcher.get_json(situation_url)
+            situation_data_augmented = situation_data.copy()
+            situation_data_augmented["event_id_fk"] = status_row["event_id_fk"]
+            return situation_data_augmented
+        except Exception as e:
+            logger.error(
+                "Unexpected error fetching event situation from %s (event_id_fk: %s): %s",
+                situation_url,
+                status_row["event_id_fk"],
+                e,
+                exc_info=True,
+            )
+            return None
+
+    async def _live_tail(
+        event_id_fk: str, collection: str, collection_url: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yields the items of a play-ordered collection past the event's cursor and moves
+        the cursor after each page, so a failing page does not re-emit the earlier ones.
+        Only the page holding the last seen item and the ones after it are fetched.
+        Events that were already completed when first polled are left to the daily run.
+        """
+        if not live_cursors.tails(event_id_fk):
+            return
+        seen, last_sequence = live_cursors.cursor(event_id_fk, collection)
+        start_page = cursor_start_page(seen, LIVE_PAGE_SIZE)
+        position = (start_page - 1) * LIVE_PAGE_SIZE
+        async for page in fetcher.paginate(
+            collection_url, params={"limit": LIVE_PAGE_SIZE}, start_page=start_page
+        ):
+            position += len(page)
+            for item in page:
+                sequence = int(item.get("sequenceNumber") or item.get("id") or -1)
+                if sequence > last_sequence:
+                    last_sequence = sequence
+                    yield item
+            live_cursors.advance(event_id_fk, collection, max(seen, position), last_sequence)
+
+    @dlt.transformer(
+        name="event_plays",
+        data_from=live_event_status_transformer,
+        write_disposition="append",
+        primary_key=["event_id_fk", "id"],
+    )
+    @fetcher.defer
+    async def live_event_plays_transformer(
+        status_row: dict[str, Any],
+    ) -> AsyncIterator[TDataItem]:
+        """Appends the plays of a started game that are newer than its cursor."""
+        plays_url = _live_competition_url(status_row, "plays")
+        if not plays_url:
+            return
+        event_id_fk = status_row["event_id_fk"]
+        try:
+            async for play_item in _live_tail(event_id_fk, "plays", plays_url):
+                if "id" not in play_item:
+                    logger.warning(
+                        "Play item missing 'id' for event '%s'. Item: %s.",
+                        event_id_fk,
+                        payload(play_item),
+                    )
+                    continue
+                play_record = play_item.copy()
+                play_record["event_id_fk"] = event_id_fk
+                play_record["id"] = str(play_item["id"])
+                yield play_record
+        except Exception as e:
+            logger.error(
+                "Unexpected error polling event plays from %s (event_id_fk: %s): %s",
+                plays_url,
+                event_id_fk,
+                e,
+                exc_info=True,
+            )
+
+    @dlt.transformer(
+        name="event_probabilities",
+        data_from=live_event_status_transformer,
+        write_disposition="append",
+        primary_key=["event_id_fk", "play_id"],
+    )
+    @fetcher.defer
+    async def live_event_probabilities_transformer(
+        status_row: dict[str, Any],
+    ) -> AsyncIterator[TDataItem]:
+        """Appends the win probabilities of a started game that are newer than its cursor."""
+        probabilities_url = _live_competition_url(status_row, "probabilities")
+        if not probabilities_url:
+            return
+        event_id_fk = status_row["event_id_fk"]
+        try:
+            async for prob_item in _live_tail(event_id_fk, "probabilities", probabilities_url):
+                play_id = _probability_play_id(prob_item)
+                if play_id is None:
+                    logger.warning(
+                        "Probability item without a play for event '%s'. Item: %s.",
+                        event_id_fk,
+                        payload(prob_item),
+                    )
+                    continue
+                prob_record = prob_item.copy()
+                prob_record["event_id_fk"] = event_id_fk
+                prob_record["play_id"] = play_id
+                yield prob_record
+        except Exception as e:
+            logger.error(
+                "Unexpected error polling event probabilities from %s (event_id_fk: %s): %s",
+                probabilities_url,
+                event_id_fk,
+                e,
+                exc_info=True,
+            )
+
     # --- Master / Dimension Tables ---
 
     @dlt.transformer(name="team_refs_lister", data_from=season_detail_fetcher_transformer)
@@ -2184,21 +3357,24 @@ def espn_source(
 
         if not season_id:
             logger.warning(
-                f"Season detail missing 'id'. Skipping team refs listing. Detail: {season_detail}"
+                "Season detail missing 'id'. Skipping team refs listing. Detail: %s",
+                payload(season_detail),
             )
             return  # yield from []
 
         if not teams_collection_url:
             logger.info(
-                f"Season detail for season '{season_id}' missing 'teams.$ref'. No teams to list for this season."
+                "Season detail for season '%s' missing 'teams.$ref'. No teams to list for this season.",
+                season_id,
             )
             return  # yield from []
 
         logger.debug(
-            f"Listing team refs for season '{season_id}' from collection: {teams_collection_url}"
+            "Listing team refs for season '%s' from collection: %s", season_id, teams_collection_url
         )
         try:
-            for team_ref_page in list_client.paginate(
+            # Pages 2..N are fetched concurrently and yielded in page order
+            for team_ref_page in fetcher.iter_pages(
                 teams_collection_url, params={"limit": API_LIMIT}
             ):
                 for team_ref_item in team_ref_page:
@@ -2208,13 +3384,19 @@ def espn_source(
                         yield team_ref_item_augmented
                     else:
                         logger.warning(
-                            f"Team ref item missing '$ref' key in page "
-                            f"from {teams_collection_url} for season '{season_id}'. Item: {team_ref_item}"
+                            "Team ref item missing '$ref' key in page "
+                            "from %s for season '%s'. Item: %s",
+                            teams_collection_url,
+                            season_id,
+                            payload(team_ref_item),
                         )
 
         except Exception as e:
             logger.error(
-                f"Error listing team refs for season '{season_id}' from {teams_collection_url}: {e}",
+                "Error listing team refs for season '%s' from %s: %s",
+                season_id,
+                teams_collection_url,
+                e,
                 exc_info=True,
             )
 
@@ -2224,8 +3406,8 @@ def espn_source(
         write_disposition="merge",
         primary_key=["id", "season_id_fk"],  # Team data is specific to a season in this context
     )
-    @dlt.defer
-    def team_detail_fetcher_transformer(team_ref_item: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def team_detail_fetcher_transformer(team_ref_item: dict[str, Any]) -> TDataItem | None:
         """
         Fetches full team details for an individual team $ref object, augmenting with season_id_fk.
         """
@@ -2233,18 +3415,16 @@ def espn_source(
         season_id_fk = team_ref_item.get("season_id_fk")
 
         if not detail_url:
-            logger.warning(f"Team ref item missing '$ref'. Item: {team_ref_item}")
+            logger.warning("Team ref item missing '$ref'. Item: %s", payload(team_ref_item))
             return None
         if not season_id_fk:  # Should always be present from lister
-            logger.warning(f"Team ref item missing 'season_id_fk'. Item: {team_ref_item}")
+            logger.warning("Team ref item missing 'season_id_fk'. Item: %s", payload(team_ref_item))
             # Could try to parse from URL, but safer to expect it from lister
             return None
 
-        logger.debug(f"Fetching team detail for season '{season_id_fk}' from: {detail_url}")
+        logger.debug("Fetching team detail for season '%s' from: %s", season_id_fk, detail_url)
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            team_detail = response.json()
+            team_detail = await fetcher.get_json(detail_url)
 
             api_team_id = team_detail.get("id")
             if api_team_id is not None:
@@ -2260,15 +3440,19 @@ def espn_source(
                 return team_detail
             else:
                 logger.warning(
-                    f"Fetched team detail from {detail_url} (season '{season_id_fk}') "
-                    f"missing 'id'. Detail: {team_detail}"
+                    "Fetched team detail from %s (season '%s') missing 'id'. Detail: %s",
+                    detail_url,
+                    season_id_fk,
+                    payload(team_detail),
                 )
                 return None
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching team detail from {detail_url} "
-                f"(season_id_fk: {season_id_fk}): {e}",
+                "Unexpected error fetching team detail from %s (season_id_fk: %s): %s",
+                detail_url,
+                season_id_fk,
+                e,
                 exc_info=True,
             )
             return None
@@ -2287,24 +3471,27 @@ def espn_source(
 
         if not season_id:
             logger.warning(
-                f"Season detail missing 'id'. Skipping athlete refs listing. "
-                f"Detail: {season_detail}"
+                "Season detail missing 'id'. Skipping athlete refs listing. Detail: %s",
+                payload(season_detail),
             )
             return  # yield from []
 
         if not athletes_collection_url:
             logger.info(
-                f"Season detail for season '{season_id}' missing 'athletes.$ref'. "
-                f"No athletes to list for this season."
+                "Season detail for season '%s' missing 'athletes.$ref'. "
+                "No athletes to list for this season.",
+                season_id,
             )
             return  # yield from []
 
         logger.debug(
-            f"Listing athlete refs for season '{season_id}' from collection: "
-            f"{athletes_collection_url}"
+            "Listing athlete refs for season '%s' from collection: %s",
+            season_id,
+            athletes_collection_url,
         )
         try:
-            for athlete_ref_page in list_client.paginate(
+            # Pages 2..N are fetched concurrently and yielded in page order
+            for athlete_ref_page in fetcher.iter_pages(
                 athletes_collection_url, params={"limit": API_LIMIT}
             ):
                 for athlete_ref_item in athlete_ref_page:
@@ -2315,15 +3502,20 @@ def espn_source(
                         yield athlete_ref_item_augmented
                     else:
                         logger.warning(
-                            f"Athlete ref item missing '$ref' key in page "
-                            f"from {athletes_collection_url} for season '{season_id}'. "
-                            f"Item: {athlete_ref_item}"
+                            "Athlete ref item missing '$ref' key in page "
+                            "from %s for season '%s'. "
+                            "Item: %s",
+                            athletes_collection_url,
+                            season_id,
+                            payload(athlete_ref_item),
                         )
 
         except Exception as e:
             logger.error(
-                f"Error listing athlete refs for season '{season_id}' "
-                f"from {athletes_collection_url}: {e}",
+                "Error listing athlete refs for season '%s' from %s: %s",
+                season_id,
+                athletes_collection_url,
+                e,
                 exc_info=True,
             )
 
@@ -2333,8 +3525,10 @@ def espn_source(
         write_disposition="merge",
         primary_key="id",  # Assuming athlete 'id' is globally unique for master data
     )
-    @dlt.defer
-    def athlete_detail_fetcher_transformer(athlete_ref_item: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def athlete_detail_fetcher_transformer(
+        athlete_ref_item: dict[str, Any],
+    ) -> TDataItem | None:
         """
         Fetches full athlete details for an individual athlete $ref object.
         Augments with discovery_season_id_fk.
@@ -2345,7 +3539,7 @@ def espn_source(
         discovery_season_id_fk = athlete_ref_item.get("discovery_season_id_fk")
 
         if not detail_url:
-            logger.warning(f"Athlete ref item missing '$ref'. Item: {athlete_ref_item}")
+            logger.warning("Athlete ref item missing '$ref'. Item: %s", payload(athlete_ref_item))
             return None
 
         # discovery_season_id_fk is good for context but not strictly essential for fetching
@@ -2356,13 +3550,12 @@ def espn_source(
         # Decide if this is critical enough to return None
 
         logger.debug(
-            f"Fetching athlete detail (discovery season '{discovery_season_id_fk}') "
-            f"from: {detail_url}"
+            "Fetching athlete detail (discovery season '%s') from: %s",
+            discovery_season_id_fk,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            athlete_detail = response.json()
+            athlete_detail = await fetcher.get_json(detail_url)
 
             api_athlete_id = athlete_detail.get("id")
             if api_athlete_id is not None:
@@ -2380,16 +3573,21 @@ def espn_source(
                 return athlete_detail
             else:
                 logger.warning(
-                    f"Fetched athlete detail from {detail_url} "
-                    f"(discovery season '{discovery_season_id_fk}') missing 'id'. "
-                    f"Detail: {athlete_detail}"
+                    "Fetched athlete detail from %s "
+                    "(discovery season '%s') missing 'id'. "
+                    "Detail: %s",
+                    detail_url,
+                    discovery_season_id_fk,
+                    payload(athlete_detail),
                 )
                 return None
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching athlete detail from {detail_url} "
-                f"(discovery_season_id_fk: {discovery_season_id_fk}): {e}",
+                "Unexpected error fetching athlete detail from %s (discovery_season_id_fk: %s): %s",
+                detail_url,
+                discovery_season_id_fk,
+                e,
                 exc_info=True,
             )
             return None
@@ -2404,11 +3602,11 @@ def espn_source(
         team_id = team_detail.get("id")  # For logging context
 
         if venue_ref_url:
-            logger.debug(f"Team '{team_id}' has venue ref: {venue_ref_url}")
+            logger.debug("Team '%s' has venue ref: %s", team_id, venue_ref_url)
             yield {"venue_ref_url": venue_ref_url, "_source_discovery": f"team_{team_id}"}
         # No yield if not found
 
-    @dlt.transformer(name="event_venue_ref_extractor", data_from=event_detail_fetcher_transformer)
+    @dlt.transformer(name="event_venue_ref_extractor", data_from=event_handles_transformer)
     def event_venue_ref_extractor_transformer(
         event_detail: dict[str, Any],
     ) -> Iterable[dict[str, Any]] | None:
@@ -2420,7 +3618,7 @@ def espn_source(
             venue_ref_url = competitions[0].get("venue", {}).get("$ref")
 
         if venue_ref_url:
-            logger.debug(f"Event '{event_id}' has venue ref: {venue_ref_url}")
+            logger.debug("Event '%s' has venue ref: %s", event_id, venue_ref_url)
             yield {"venue_ref_url": venue_ref_url, "_source_discovery": f"event_{event_id}"}
         # No yield if not found
 
@@ -2436,7 +3634,7 @@ def espn_source(
         athlete_id = athlete_detail.get("id")  # For logging context
 
         if position_ref_url:
-            logger.debug(f"Athlete '{athlete_id}' has position ref: {position_ref_url}")
+            logger.debug("Athlete '%s' has position ref: %s", athlete_id, position_ref_url)
             yield {
                 "position_ref_url": position_ref_url,
                 "_source_discovery": f"athlete_{athlete_id}",
@@ -2447,29 +3645,47 @@ def espn_source(
 
     @dlt.transformer(
         name="venues",
-        data_from=team_venue_ref_extractor_transformer | event_venue_ref_extractor_transformer,
+        # Date-window and single-week runs never list teams, so venues only come from events;
+        # season-level runs without events only from teams
+        data_from=(
+            event_venue_ref_extractor_transformer
+            if event_dates_filter or week_filter
+            else team_venue_ref_extractor_transformer
+            if not include_events
+            else team_venue_ref_extractor_transformer | event_venue_ref_extractor_transformer
+        ),
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def venue_detail_fetcher_transformer(venue_ref_container: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def venue_detail_fetcher_transformer(
+        venue_ref_container: dict[str, Any],
+    ) -> TDataItem | None:
         """Fetches venue details from a $ref URL."""
         detail_url = venue_ref_container.get("venue_ref_url")
         source_discovery_info = venue_ref_container.get("_source_discovery", "unknown")
 
         if not detail_url:
             logger.warning(
-                f"Venue ref container missing 'venue_ref_url'. Item: {venue_ref_container}"
+                "Venue ref container missing 'venue_ref_url'. Item: %s",
+                payload(venue_ref_container),
             )
             return None
 
+        if master_refs.is_fresh(detail_url):
+            return None  # Fetched by a recent run; its merged row is still current
+
         logger.debug(
-            f"Fetching venue detail (discovered via '{source_discovery_info}') from: {detail_url}"
+            "Fetching venue detail (discovered via '%s') from: %s",
+            source_discovery_info,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            venue_detail = response.json()
+            venue_detail, first_request = await fetcher.get_json_shared(detail_url)
+            if not first_request:
+                return None  # Row for this $ref was already emitted in this run
+            if not master_refs.record(detail_url, venue_detail):
+                return None  # Unchanged since the last run that fetched it
 
             api_venue_id = venue_detail.get("id")
             if api_venue_id is not None:
@@ -2477,13 +3693,19 @@ def espn_source(
                 return venue_detail
             else:
                 logger.warning(
-                    f"Fetched venue detail from {detail_url} (source: {source_discovery_info}) missing 'id'. Detail: {venue_detail}"
+                    "Fetched venue detail from %s (source: %s) missing 'id'. Detail: %s",
+                    detail_url,
+                    source_discovery_info,
+                    payload(venue_detail),
                 )
                 return None
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching venue detail from {detail_url} (source: {source_discovery_info}): {e}",
+                "Unexpected error fetching venue detail from %s (source: %s): %s",
+                detail_url,
+                source_discovery_info,
+                e,
                 exc_info=True,
             )
             return None
@@ -2494,8 +3716,8 @@ def espn_source(
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def position_detail_fetcher_transformer(
+    @fetcher.defer
+    async def position_detail_fetcher_transformer(
         position_ref_container: dict[str, Any],
     ) -> TDataItem | None:
         """Fetches position details from a $ref URL."""
@@ -2504,17 +3726,25 @@ def espn_source(
 
         if not detail_url:
             logger.warning(
-                f"Position ref container missing 'position_ref_url'. Item: {position_ref_container}"
+                "Position ref container missing 'position_ref_url'. Item: %s",
+                payload(position_ref_container),
             )
             return None
 
+        if master_refs.is_fresh(detail_url):
+            return None  # Fetched by a recent run; its merged row is still current
+
         logger.debug(
-            f"Fetching position detail (discovered via '{source_discovery_info}') from: {detail_url}"
+            "Fetching position detail (discovered via '%s') from: %s",
+            source_discovery_info,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            position_detail = response.json()
+            position_detail, first_request = await fetcher.get_json_shared(detail_url)
+            if not first_request:
+                return None  # Row for this $ref was already emitted in this run
+            if not master_refs.record(detail_url, position_detail):
+                return None  # Unchanged since the last run that fetched it
 
             api_position_id = position_detail.get("id")
             if api_position_id is not None:
@@ -2522,13 +3752,19 @@ def espn_source(
                 return position_detail
             else:
                 logger.warning(
-                    f"Fetched position detail from {detail_url} (source: {source_discovery_info}) missing 'id'. Detail: {position_detail}"
+                    "Fetched position detail from %s (source: %s) missing 'id'. Detail: %s",
+                    detail_url,
+                    source_discovery_info,
+                    payload(position_detail),
                 )
                 return None
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching position detail from {detail_url} (source: {source_discovery_info}): {e}",
+                "Unexpected error fetching position detail from %s (source: %s): %s",
+                detail_url,
+                source_discovery_info,
+                e,
                 exc_info=True,
             )
             return None
@@ -2536,52 +3772,64 @@ def espn_source(
     # --- Opportunistic Master Data: Provider Refs Extractor (from Event Odds) ---
     @dlt.transformer(name="odds_provider_ref_extractor", data_from=event_odds_transformer)
     def odds_provider_ref_extractor_transformer(
-        odds_record: dict[str, Any],
+        odds_records: list[dict[str, Any]],
     ) -> Iterable[dict[str, Any]] | None:
-        """Extracts provider $ref from an odds_record if present."""
-        provider_obj = odds_record.get("provider", {})
-        provider_ref_url = provider_obj.get("$ref") if isinstance(provider_obj, dict) else None
-        event_id_fk = odds_record.get("event_id_fk")  # For logging
-        provider_id_fk = odds_record.get("provider_id_fk")  # For logging
-
-        if provider_ref_url:
-            logger.debug(
-                f"Event odds record for event '{event_id_fk}', provider '{provider_id_fk}' has provider detail ref: {provider_ref_url}"
-            )
-            yield {
-                "provider_ref_url": provider_ref_url,
-                "_source_discovery": f"event_odds_ev{event_id_fk}_p{provider_id_fk}",
-            }
-        elif provider_id_fk:
-            logger.debug(
-                f"Event odds record for event '{event_id_fk}', provider '{provider_id_fk}' missing 'provider.$ref'. Cannot extract provider detail."
-            )
-        # No yield if not found
+        """Extracts provider $refs from a batch of odds_records (one event's odds)."""
+        for odds_record in odds_records:
+            provider_obj = odds_record.get("provider", {})
+            provider_ref_url = provider_obj.get("$ref") if isinstance(provider_obj, dict) else None
+            event_id_fk = odds_record.get("event_id_fk")  # For logging
+            provider_id_fk = odds_record.get("provider_id_fk")  # For logging
+
+            if provider_ref_url:
+                logger.debug(
+                    "Event odds record for event '%s', provider '%s' has provider detail ref: %s",
+                    event_id_fk,
+                    provider_id_fk,
+                    provider_ref_url,
+                )
+                yield {
+                    "provider_ref_url": provider_ref_url,
+                    "_source_discovery": f"event_odds_ev{event_id_fk}_p{provider_id_fk}",
+                }
+            elif provider_id_fk:
+                logger.debug(
+                    "Event odds record for event '%s', provider '%s' missing 'provider.$ref'. Cannot extract provider detail.",
+                    event_id_fk,
+                    provider_id_fk,
+                )
+            # No yield if not found
 
     # --- Opportunistic Master Data: Media Refs Extractor (from Event Broadcasts) ---
     @dlt.transformer(name="broadcast_media_ref_extractor", data_from=event_broadcasts_transformer)
     def broadcast_media_ref_extractor_transformer(
-        broadcast_record: dict[str, Any],
+        broadcast_records: list[dict[str, Any]],
     ) -> Iterable[dict[str, Any]] | None:
-        """Extracts media $ref from a broadcast_record if present."""
-        media_obj = broadcast_record.get("media", {})
-        media_ref_url = media_obj.get("$ref") if isinstance(media_obj, dict) else None
-        event_id_fk = broadcast_record.get("event_id_fk")  # For logging
-        media_id_fk = broadcast_record.get("media_id_fk")  # For logging
-
-        if media_ref_url:
-            logger.debug(
-                f"Event broadcast record for event '{event_id_fk}', media '{media_id_fk}' has media detail ref: {media_ref_url}"
-            )
-            yield {
-                "media_ref_url": media_ref_url,
-                "_source_discovery": f"event_broadcast_ev{event_id_fk}_m{media_id_fk}",
-            }
-        elif media_id_fk:
-            logger.debug(
-                f"Event broadcast record for event '{event_id_fk}', media '{media_id_fk}' missing 'media.$ref'. Cannot extract media detail."
-            )
-        # No yield if not found
+        """Extracts media $refs from a batch of broadcast_records (one event's broadcasts)."""
+        for broadcast_record in broadcast_records:
+            media_obj = broadcast_record.get("media", {})
+            media_ref_url = media_obj.get("$ref") if isinstance(media_obj, dict) else None
+            event_id_fk = broadcast_record.get("event_id_fk")  # For logging
+            media_id_fk = broadcast_record.get("media_id_fk")  # For logging
+
+            if media_ref_url:
+                logger.debug(
+                    "Event broadcast record for event '%s', media '%s' has media detail ref: %s",
+                    event_id_fk,
+                    media_id_fk,
+                    media_ref_url,
+                )
+                yield {
+                    "media_ref_url": media_ref_url,
+                    "_source_discovery": f"event_broadcast_ev{event_id_fk}_m{media_id_fk}",
+                }
+            elif media_id_fk:
+                logger.debug(
+                    "Event broadcast record for event '%s', media '%s' missing 'media.$ref'. Cannot extract media detail.",
+                    event_id_fk,
+                    media_id_fk,
+                )
+            # No yield if not found
 
     # --- Master Data Detail Fetchers (Continued) ---
 
@@ -2591,8 +3839,8 @@ def espn_source(
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def provider_detail_fetcher_transformer(
+    @fetcher.defer
+    async def provider_detail_fetcher_transformer(
         provider_ref_container: dict[str, Any],
     ) -> TDataItem | None:
         """Fetches odds provider details from a $ref URL."""
@@ -2603,17 +3851,25 @@ def espn_source(
 
         if not detail_url:
             logger.warning(
-                f"Provider ref container missing 'provider_ref_url'. Item: {provider_ref_container}"
+                "Provider ref container missing 'provider_ref_url'. Item: %s",
+                payload(provider_ref_container),
             )
             return None
 
+        if master_refs.is_fresh(detail_url):
+            return None  # Fetched by a recent run; its merged row is still current
+
         logger.debug(
-            f"Fetching provider detail (discovered via '{source_discovery_info}') from: {detail_url}"
+            "Fetching provider detail (discovered via '%s') from: %s",
+            source_discovery_info,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            provider_detail = response.json()
+            provider_detail, first_request = await fetcher.get_json_shared(detail_url)
+            if not first_request:
+                return None  # Row for this $ref was already emitted in this run
+            if not master_refs.record(detail_url, provider_detail):
+                return None  # Unchanged since the last run that fetched it
 
             api_provider_id = provider_detail.get("id")
             if api_provider_id is not None:
@@ -2621,13 +3877,19 @@ def espn_source(
                 return provider_detail
             else:
                 logger.warning(
-                    f"Fetched provider detail from {detail_url} (source: {source_discovery_info}) missing 'id'. Detail: {provider_detail}"
+                    "Fetched provider detail from %s (source: %s) missing 'id'. Detail: %s",
+                    detail_url,
+                    source_discovery_info,
+                    payload(provider_detail),
                 )
                 return None
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching provider detail from {detail_url} (source: {source_discovery_info}): {e}",
+                "Unexpected error fetching provider detail from %s (source: %s): %s",
+                detail_url,
+                source_discovery_info,
+                e,
                 exc_info=True,
             )
             return None
@@ -2638,8 +3900,10 @@ def espn_source(
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def media_detail_fetcher_transformer(media_ref_container: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def media_detail_fetcher_transformer(
+        media_ref_container: dict[str, Any],
+    ) -> TDataItem | None:
         """Fetches media outlet details from a $ref URL."""
         detail_url = media_ref_container.get("media_ref_url")
         source_discovery_info = media_ref_container.get(
@@ -2648,17 +3912,25 @@ def espn_source(
 
         if not detail_url:
             logger.warning(
-                f"Media ref container missing 'media_ref_url'. Item: {media_ref_container}"
+                "Media ref container missing 'media_ref_url'. Item: %s",
+                payload(media_ref_container),
             )
             return None
 
+        if master_refs.is_fresh(detail_url):
+            return None  # Fetched by a recent run; its merged row is still current
+
         logger.debug(
-            f"Fetching media detail (discovered via '{source_discovery_info}') from: {detail_url}"
+            "Fetching media detail (discovered via '%s') from: %s",
+            source_discovery_info,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            media_detail = response.json()
+            media_detail, first_request = await fetcher.get_json_shared(detail_url)
+            if not first_request:
+                return None  # Row for this $ref was already emitted in this run
+            if not master_refs.record(detail_url, media_detail):
+                return None  # Unchanged since the last run that fetched it
 
             api_media_id = media_detail.get("id")
             if api_media_id is not None:
@@ -2666,13 +3938,19 @@ def espn_source(
                 return media_detail
             else:
                 logger.warning(
-                    f"Fetched media detail from {detail_url} (source: {source_discovery_info}) missing 'id'. Detail: {media_detail}"
+                    "Fetched media detail from %s (source: %s) missing 'id'. Detail: %s",
+                    detail_url,
+                    source_discovery_info,
+                    payload(media_detail),
                 )
                 return None
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching media detail from {detail_url} (source: {source_discovery_info}): {e}",
+                "Unexpected error fetching media detail from %s (source: %s): %s",
+                detail_url,
+                source_discovery_info,
+                e,
                 exc_info=True,
             )
             return None
@@ -2700,20 +3978,26 @@ def espn_source(
 
         if not all([team_id_fk, season_id_fk]):
             logger.warning(
-                f"Team detail missing 'id' (team_id_fk) or 'season_id_fk'. Cannot list coach assignments. Detail: {team_detail}"
+                "Team detail missing 'id' (team_id_fk) or 'season_id_fk'. Cannot list coach assignments. Detail: %s",
+                payload(team_detail),
             )
             yield from []
             return
 
         if not coaches_collection_url:
             logger.info(
-                f"Team detail for team '{team_id_fk}', season '{season_id_fk}' missing 'coaches.$ref'. No coach assignments to list."
+                "Team detail for team '%s', season '%s' missing 'coaches.$ref'. No coach assignments to list.",
+                team_id_fk,
+                season_id_fk,
             )
             yield from []
             return
 
         logger.debug(
-            f"Listing coach assignments for team '{team_id_fk}', season '{season_id_fk}' from: {coaches_collection_url}"
+            "Listing coach assignments for team '%s', season '%s' from: %s",
+            team_id_fk,
+            season_id_fk,
+            coaches_collection_url,
         )
         try:
             for coach_assignment_page in list_client.paginate(
@@ -2725,7 +4009,10 @@ def espn_source(
                         not isinstance(item, dict) or "id" not in item
                     ):  # 'id' here is the coach's id
                         logger.warning(
-                            f"Malformed coach assignment item for team '{team_id_fk}', season '{season_id_fk}'. Item: {item}"
+                            "Malformed coach assignment item for team '%s', season '%s'. Item: %s",
+                            team_id_fk,
+                            season_id_fk,
+                            payload(item),
                         )
                         continue
 
@@ -2740,7 +4027,11 @@ def espn_source(
 
         except Exception as e:
             logger.error(
-                f"Unexpected error listing coach assignments for team '{team_id_fk}', season '{season_id_fk}' from {coaches_collection_url}: {e}",
+                "Unexpected error listing coach assignments for team '%s', season '%s' from %s: %s",
+                team_id_fk,
+                season_id_fk,
+                coaches_collection_url,
+                e,
                 exc_info=True,
             )
         # Implicitly yields nothing if loop doesn't run or error
@@ -2764,8 +4055,12 @@ def espn_source(
 
         if master_coach_ref_url and coach_id_for_master:
             logger.debug(
-                f"Extracted master coach ref '{master_coach_ref_url}' for coach '{coach_id_for_master}' "
-                f"(from assignment team '{team_id_fk}', season '{season_id_fk}')"
+                "Extracted master coach ref '%s' for coach '%s' "
+                "(from assignment team '%s', season '%s')",
+                master_coach_ref_url,
+                coach_id_for_master,
+                team_id_fk,
+                season_id_fk,
             )
             yield {
                 "coach_ref_url": master_coach_ref_url,
@@ -2774,8 +4069,12 @@ def espn_source(
             }
         else:
             logger.debug(
-                f"Coach assignment record for coach '{coach_id_for_master}' (team '{team_id_fk}', season '{season_id_fk}') "
-                f"missing 'coach.$ref' or its own 'id'. Record: {coach_assignment_record}"
+                "Coach assignment record for coach '%s' (team '%s', season '%s') "
+                "missing 'coach.$ref' or its own 'id'. Record: %s",
+                coach_id_for_master,
+                team_id_fk,
+                season_id_fk,
+                payload(coach_assignment_record),
             )
         # No yield if refs/IDs are missing
 
@@ -2785,8 +4084,8 @@ def espn_source(
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def coaches_resource(coach_master_ref_item: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def coaches_resource(coach_master_ref_item: dict[str, Any]) -> TDataItem | None:
         """
         Fetches master coach details using the $ref URL.
         The 'id' for the coaches table comes from 'coach_id_for_master' in the input item.
@@ -2800,17 +4099,26 @@ def espn_source(
 
         if not detail_url or not expected_coach_id:
             logger.warning(
-                f"Coach master ref item missing 'coach_ref_url' or 'coach_id_for_master'. Item: {coach_master_ref_item}"
+                "Coach master ref item missing 'coach_ref_url' or 'coach_id_for_master'. Item: %s",
+                payload(coach_master_ref_item),
             )
             return None
 
+        if master_refs.is_fresh(detail_url):
+            return None  # Fetched by a recent run; its merged row is still current
+
         logger.debug(
-            f"Fetching master coach detail for ID '{expected_coach_id}' (discovered via '{source_discovery_info}') from: {detail_url}"
+            "Fetching master coach detail for ID '%s' (discovered via '%s') from: %s",
+            expected_coach_id,
+            source_discovery_info,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            coach_master_detail = response.json()
+            coach_master_detail, first_request = await fetcher.get_json_shared(detail_url)
+            if not first_request:
+                return None  # Row for this $ref was already emitted in this run
+            if not master_refs.record(detail_url, coach_master_detail):
+                return None  # Unchanged since the last run that fetched it
 
             api_coach_id = coach_master_detail.get("id")
             if api_coach_id is not None:
@@ -2819,13 +4127,20 @@ def espn_source(
                 coach_master_detail["id"] = str(expected_coach_id)
                 if str(api_coach_id) != str(expected_coach_id):
                     logger.warning(
-                        f"Mismatch between expected coach ID ('{expected_coach_id}') and API coach ID ('{api_coach_id}') "
-                        f"from {detail_url}. Using expected ID for master record."
+                        "Mismatch between expected coach ID ('%s') and API coach ID ('%s') "
+                        "from %s. Using expected ID for master record.",
+                        expected_coach_id,
+                        api_coach_id,
+                        detail_url,
                     )
                 return coach_master_detail
             else:
                 logger.warning(
-                    f"Fetched master coach detail from {detail_url} (expected ID '{expected_coach_id}', source: {source_discovery_info}) missing 'id' in response. Detail: {coach_master_detail}"
+                    "Fetched master coach detail from %s (expected ID '%s', source: %s) missing 'id' in response. Detail: %s",
+                    detail_url,
+                    expected_coach_id,
+                    source_discovery_info,
+                    payload(coach_master_detail),
                 )
                 # Still try to save it using the expected_coach_id if the rest of the data is valuable
                 coach_master_detail["id"] = str(expected_coach_id)
@@ -2833,7 +4148,11 @@ def espn_source(
 
         except Exception as e:
             logger.error(
-                f"Error during API operation for {detail_url} (master coach ID '{expected_coach_id}', source: {source_discovery_info}): {e}",
+                "Error during API operation for %s (master coach ID '%s', source: %s): %s",
+                detail_url,
+                expected_coach_id,
+                source_discovery_info,
+                e,
                 exc_info=True,
             )
             return None
@@ -2899,18 +4218,20 @@ def espn_source(
             # Using the main league_base_url that was passed into espn_source()
             constructed_franchises_url = f"{league_base_url.rstrip('/')}/franchises"
             logger.info(
-                f"League doc for '{league_doc.get('id')}' did not directly reference a franchises collection. "
-                f"Attempting to list franchises from constructed URL: {constructed_franchises_url}"
+                "League doc for '%s' did not directly reference a franchises collection. "
+                "Attempting to list franchises from constructed URL: %s",
+                league_doc.get("id"),
+                constructed_franchises_url,
             )
             franchises_collection_url = constructed_franchises_url  # Use the constructed one
 
         if not franchises_collection_url:
             logger.error(
-                f"Could not determine franchise collection URL. League doc: {league_doc.get('id')}"
+                "Could not determine franchise collection URL. League doc: %s", league_doc.get("id")
             )
             return
 
-        logger.debug(f"Listing all franchise refs from collection: {franchises_collection_url}")
+        logger.debug("Listing all franchise refs from collection: %s", franchises_collection_url)
         try:
             for franchise_ref_page in list_client.paginate(
                 franchises_collection_url, params={"limit": API_LIMIT}
@@ -2921,12 +4242,16 @@ def espn_source(
                         yield franchise_ref_item
                     else:
                         logger.warning(
-                            f"Franchise ref item missing '$ref' key in page "
-                            f"from {franchises_collection_url}. Item: {franchise_ref_item}"
+                            "Franchise ref item missing '$ref' key in page from %s. Item: %s",
+                            franchises_collection_url,
+                            payload(franchise_ref_item),
                         )
         except Exception as e:
             logger.error(
-                f"Error listing franchise refs from {franchises_collection_url}: {e}", exc_info=True
+                "Error listing franchise refs from %s: %s",
+                franchises_collection_url,
+                e,
+                exc_info=True,
             )
 
     @dlt.transformer(
@@ -2935,22 +4260,27 @@ def espn_source(
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def franchises_resource(franchise_ref_item: dict[str, Any]) -> TDataItem | None:
+    @fetcher.defer
+    async def franchises_resource(franchise_ref_item: dict[str, Any]) -> TDataItem | None:
         """
         Fetches full franchise details for an individual franchise $ref object.
         """
         detail_url = franchise_ref_item.get("$ref")
 
         if not detail_url:
-            logger.warning(f"Franchise ref item missing '$ref'. Item: {franchise_ref_item}")
+            logger.warning(
+                "Franchise ref item missing '$ref'. Item: %s", payload(franchise_ref_item)
+            )
             return None
 
-        logger.debug(f"Fetching franchise detail from: {detail_url}")
+        if master_refs.is_fresh(detail_url):
+            return None  # Fetched by a recent run; its merged row is still current
+
+        logger.debug("Fetching franchise detail from: %s", detail_url)
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            franchise_detail = response.json()
+            franchise_detail = await fetcher.get_json(detail_url)
+            if not master_refs.record(detail_url, franchise_detail):
+                return None  # Unchanged since the last run that fetched it
 
             api_franchise_id = franchise_detail.get("id")
             if api_franchise_id is not None:
@@ -2958,12 +4288,17 @@ def espn_source(
                 return franchise_detail
             else:
                 logger.warning(
-                    f"Fetched franchise detail from {detail_url} missing 'id'. Detail: {franchise_detail}"
+                    "Fetched franchise detail from %s missing 'id'. Detail: %s",
+                    detail_url,
+                    payload(franchise_detail),
                 )
                 return None
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching franchise detail from {detail_url}: {e}", exc_info=True
+                "Unexpected error fetching franchise detail from %s: %s",
+                detail_url,
+                e,
+                exc_info=True,
             )
             return None
 
@@ -2989,8 +4324,10 @@ def espn_source(
             # If the $ref itself in league_doc is absolute, this construction is not needed.
             # Given inventory says "/awards", it suggests it might be relative to the league or sports root.
             logger.info(
-                f"League doc '{league_doc.get('id')}' did not contain 'awards.$ref'. "
-                f"Attempting general awards list from league_base_url: {league_base_url.rstrip('/')}/awards"
+                "League doc '%s' did not contain 'awards.$ref'. "
+                "Attempting general awards list from league_base_url: %s/awards",
+                league_doc.get("id"),
+                league_base_url.rstrip("/"),
             )
             master_awards_collection_url = f"{league_base_url.rstrip('/')}/awards"
             # This might still 404 if awards are only listed seasonally or not at all for this league.
@@ -3002,7 +4339,7 @@ def espn_source(
             return
 
         logger.debug(
-            f"Listing all master award refs from collection: {master_awards_collection_url}"
+            "Listing all master award refs from collection: %s", master_awards_collection_url
         )
         try:
             for award_ref_page in list_client.paginate(
@@ -3013,12 +4350,15 @@ def espn_source(
                         yield award_ref_item
                     else:
                         logger.warning(
-                            f"Master award ref item missing '$ref' key in page "
-                            f"from {master_awards_collection_url}. Item: {award_ref_item}"
+                            "Master award ref item missing '$ref' key in page from %s. Item: %s",
+                            master_awards_collection_url,
+                            payload(award_ref_item),
                         )
         except Exception as e:
             logger.error(
-                f"Error listing master award refs from {master_awards_collection_url}: {e}",
+                "Error listing master award refs from %s: %s",
+                master_awards_collection_url,
+                e,
                 exc_info=True,
             )
 
@@ -3028,8 +4368,8 @@ def espn_source(
         write_disposition="merge",
         primary_key="id",
     )
-    @dlt.defer
-    def award_master_detail_fetcher_transformer(
+    @fetcher.defer
+    async def award_master_detail_fetcher_transformer(
         award_master_ref_item: dict[str, Any],
     ) -> TDataItem | None:
         """
@@ -3038,14 +4378,19 @@ def espn_source(
         detail_url = award_master_ref_item.get("$ref")
 
         if not detail_url:
-            logger.warning(f"Master award ref item missing '$ref'. Item: {award_master_ref_item}")
+            logger.warning(
+                "Master award ref item missing '$ref'. Item: %s", payload(award_master_ref_item)
+            )
             return None
 
-        logger.debug(f"Fetching master award detail from: {detail_url}")
+        if master_refs.is_fresh(detail_url):
+            return None  # Fetched by a recent run; its merged row is still current
+
+        logger.debug("Fetching master award detail from: %s", detail_url)
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            award_master_detail = response.json()
+            award_master_detail = await fetcher.get_json(detail_url)
+            if not master_refs.record(detail_url, award_master_detail):
+                return None  # Unchanged since the last run that fetched it
 
             api_award_id = award_master_detail.get("id")
             if api_award_id is not None:
@@ -3053,12 +4398,16 @@ def espn_source(
                 return award_master_detail
             else:
                 logger.warning(
-                    f"Fetched master award detail from {detail_url} missing 'id'. Detail: {award_master_detail}"
+                    "Fetched master award detail from %s missing 'id'. Detail: %s",
+                    detail_url,
+                    payload(award_master_detail),
                 )
                 return None
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching master award detail from {detail_url}: {e}",
+                "Unexpected error fetching master award detail from %s: %s",
+                detail_url,
+                e,
                 exc_info=True,
             )
             return None
@@ -3079,18 +4428,22 @@ def espn_source(
 
         if not season_id_fk:
             logger.warning(
-                f"Season detail missing 'id'. Skipping seasonal awards. Detail: {season_detail}"
+                "Season detail missing 'id'. Skipping seasonal awards. Detail: %s",
+                payload(season_detail),
             )
             return
 
         if not seasonal_awards_collection_url:
             logger.info(
-                f"Season detail for season '{season_id_fk}' missing 'awards.$ref'. No seasonal awards to list."
+                "Season detail for season '%s' missing 'awards.$ref'. No seasonal awards to list.",
+                season_id_fk,
             )
             return
 
         logger.debug(
-            f"Listing seasonal award instance refs for season '{season_id_fk}' from: {seasonal_awards_collection_url}"
+            "Listing seasonal award instance refs for season '%s' from: %s",
+            season_id_fk,
+            seasonal_awards_collection_url,
         )
         try:
             for award_instance_ref_page in list_client.paginate(
@@ -3103,11 +4456,15 @@ def espn_source(
                         yield ref_item_augmented
                     else:
                         logger.warning(
-                            f"Seasonal award instance ref item missing '$ref' key for season '{season_id_fk}'. Item: {item}"
+                            "Seasonal award instance ref item missing '$ref' key for season '%s'. Item: %s",
+                            season_id_fk,
+                            payload(item),
                         )
         except Exception as e:
             logger.error(
-                f"Error listing seasonal award instance refs for season '{season_id_fk}': {e}",
+                "Error listing seasonal award instance refs for season '%s': %s",
+                season_id_fk,
+                e,
                 exc_info=True,
             )
 
@@ -3117,8 +4474,8 @@ def espn_source(
         write_disposition="merge",
         primary_key=["id", "season_id_fk"],
     )
-    @dlt.defer
-    def season_award_instance_detail_fetcher_transformer(
+    @fetcher.defer
+    async def season_award_instance_detail_fetcher_transformer(
         seasonal_award_ref_item: dict[str, Any],
     ) -> TDataItem | None:
         """
@@ -3130,22 +4487,26 @@ def espn_source(
 
         if not detail_url or not season_id_fk:
             logger.warning(
-                f"Seasonal award ref item missing '$ref' or 'season_id_fk'. Item: {seasonal_award_ref_item}"
+                "Seasonal award ref item missing '$ref' or 'season_id_fk'. Item: %s",
+                payload(seasonal_award_ref_item),
             )
             return None
 
         logger.debug(
-            f"Fetching seasonal award instance detail for season '{season_id_fk}' from: {detail_url}"
+            "Fetching seasonal award instance detail for season '%s' from: %s",
+            season_id_fk,
+            detail_url,
         )
         try:
-            response = detail_client.get(detail_url)
-            response.raise_for_status()
-            seasonal_award_detail = response.json()
+            seasonal_award_detail = await fetcher.get_json(detail_url)
 
             instance_id = seasonal_award_detail.get("id")
             if instance_id is None:
                 logger.warning(
-                    f"Fetched seasonal award instance from {detail_url} (season '{season_id_fk}') missing 'id'. Detail: {seasonal_award_detail}"
+                    "Fetched seasonal award instance from %s (season '%s') missing 'id'. Detail: %s",
+                    detail_url,
+                    season_id_fk,
+                    payload(seasonal_award_detail),
                 )
                 return None  # Instance ID is crucial for PK
 
@@ -3165,7 +4526,8 @@ def espn_source(
                     )
                 except Exception:
                     logger.warning(
-                        f"Could not parse award_master_id_fk from type.$ref: {award_type_obj['$ref']}"
+                        "Could not parse award_master_id_fk from type.$ref: %s",
+                        award_type_obj["$ref"],
                     )
 
             # Extract recipient ID (can be athlete or team)
@@ -3183,7 +4545,10 @@ def espn_source(
 
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching seasonal award instance from {detail_url} (season '{season_id_fk}'): {e}",
+                "Unexpected error fetching seasonal award instance from %s (season '%s'): %s",
+                detail_url,
+                season_id_fk,
+                e,
                 exc_info=True,
             )
             return None
@@ -3191,20 +4556,18 @@ def espn_source(
     # Define other resources and transformers here following the
     # "Lister + Detail Fetcher with @dlt.defer" pattern.
 
-    return (
-        league_info_resource,
-        season_detail_fetcher_transformer,
-        event_refs_lister_transformer,
+    # Everything that hangs off an event detail
+    event_resources = (
         event_detail_fetcher_transformer,
         event_competitors_transformer,
         event_scores_detail_fetcher_transformer,
         event_linescores_transformer,
         event_team_stats_processor_transformer,
         event_player_stats_refs_lister_transformer,
-        event_player_stats_detail_fetcher_transformer,
+        event_player_stats_processor_transformer,
         event_leaders_detail_fetcher_transformer,
         event_roster_detail_fetcher_transformer,
-        event_pregame_records_transformer,
+        event_pregame_records_processor_transformer,
         event_status_detail_fetcher_transformer,
         event_situation_detail_fetcher_transformer,
         event_odds_transformer,
@@ -3214,6 +4577,94 @@ def espn_source(
         event_powerindex_transformer,
         event_officials_transformer,
         event_plays_lister_transformer,
+    )
+    if wide_stats:
+        event_resources = (
+            *event_resources,
+            event_team_stats_wide_transformer,
+            event_player_stats_wide_transformer,
+            event_pregame_records_wide_transformer,
+        )
+
+    row_hashes = None
+    if skip_unchanged_rows:
+        if event_dates_filter:
+            row_hashes = RowHashFilter(event_filter=event_dates_condition(event_dates_filter))
+        elif season_year_filter:
+            event_condition = "season_id_fk = %s"
+            event_params: tuple[str, ...] = (season_year_filter,)
+            if week_filter:
+                event_condition += " AND type_id_fk = %s AND week_id_fk = %s"
+                event_params += (season_type_filter, week_filter)
+            row_hashes = RowHashFilter(
+                season_id=season_year_filter, event_filter=(event_condition, event_params)
+            )
+        else:
+            row_hashes = RowHashFilter()
+
+    def _skipping_unchanged(resources: tuple[DltResource, ...]) -> tuple[DltResource, ...]:
+        # Adds the row-hash filter to the merge tables among the returned resources
+        if row_hashes is not None:
+            for resource in resources:
+                if resource.name not in ROW_HASH_EXEMPT_TABLES:
+                    row_hashes.apply(resource)
+        return resources
+
+    if live_mode:
+        # Appends to the same tables the other modes merge into; their next run of the
+        # day's events replaces the live rows with the settled ones
+        return (
+            live_event_status_transformer,
+            live_event_situation_transformer,
+            live_event_plays_transformer,
+            live_event_probabilities_transformer,
+        )
+
+    # Master data referenced by the events themselves
+    event_master_resources = (
+        event_venue_ref_extractor_transformer,
+        venue_detail_fetcher_transformer,
+        odds_provider_ref_extractor_transformer,
+        provider_detail_fetcher_transformer,
+        broadcast_media_ref_extractor_transformer,
+        media_detail_fetcher_transformer,
+    )
+
+    if event_dates_filter:
+        if season_year_filter:
+            logger.info(
+                "event_dates_filter '%s' given; ignoring season_year_filter '%s'.",
+                event_dates_filter,
+                season_year_filter,
+            )
+        return _skipping_unchanged((*event_resources, *event_master_resources))
+
+    if week_filter:
+        # One week of one season type; season-level data is left to season-wide runs
+        return _skipping_unchanged(
+            (
+                season_type_detail_fetcher_transformer,
+                week_detail_fetcher_transformer,
+                event_refs_lister_transformer,
+                *event_resources,
+                *event_master_resources,
+            )
+        )
+
+    league_master_resources = (
+        league_info_resource,
+        franchise_refs_lister_transformer,
+        franchises_resource,
+        award_master_refs_lister_transformer,
+        award_master_detail_fetcher_transformer,
+    )
+    if scope == SCOPE_LEAGUE:
+        return _skipping_unchanged(league_master_resources)
+
+    season_resources = (
+        season_detail_fetcher_transformer,
+        season_type_detail_fetcher_transformer,
+        week_detail_fetcher_transformer,
         # Master / Dimension Tables
         team_refs_lister_transformer,
         team_detail_fetcher_transformer,
@@ -3221,30 +4672,34 @@ def espn_source(
         athlete_detail_fetcher_transformer,
         # Opportunistic Master Data
         team_venue_ref_extractor_transformer,
-        event_venue_ref_extractor_transformer,
         venue_detail_fetcher_transformer,
         athlete_position_ref_extractor_transformer,
         position_detail_fetcher_transformer,
-        # Provider ref extractor & detail fetcher (from event_odds)
-        odds_provider_ref_extractor_transformer,
-        provider_detail_fetcher_transformer,
-        # Media ref extractor & detail fetcher (from event_broadcasts)
-        broadcast_media_ref_extractor_transformer,
-        media_detail_fetcher_transformer,
         # Coaches (Assignments & Master)
         coach_team_assignments_resource,
         coach_master_ref_extractor_transformer,
         coaches_resource,
-        # Franchises
-        franchise_refs_lister_transformer,
-        franchises_resource,
-        # Awards (Master & Seasonal)
-        award_master_refs_lister_transformer,
-        award_master_detail_fetcher_transformer,
+        # Awards (Seasonal)
         season_award_instance_refs_lister_transformer,
         season_award_instance_detail_fetcher_transformer,
         # ... add other listers/fetchers for Event sub-resources, etc.
     )
+    if include_events:
+        season_resources = (
+            *season_resources,
+            event_refs_lister_transformer,
+            *event_resources,
+            # Venue, provider (from event_odds) and media (from event_broadcasts) refs
+            event_venue_ref_extractor_transformer,
+            odds_provider_ref_extractor_transformer,
+            provider_detail_fetcher_transformer,
+            broadcast_media_ref_extractor_transformer,
+            media_detail_fetcher_transformer,
+        )
+    if scope == SCOPE_SEASON:
+        # league_info still feeds the season walk; without being returned it is not loaded
+        return _skipping_unchanged(season_resources)
+    return _skipping_unchanged((*league_master_resources, *season_resources))
 
 
 # --- Main execution for local testing ---
@@ -3252,6 +4707,9 @@ if __name__ == "__main__":
     from dotenv import load_dotenv
 
     load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+    )
 
     logger.info("Running dlt POC pipeline (root fetch v2) locally...")
 
@@ -3260,6 +4718,7 @@ if __name__ == "__main__":
         destination="duckdb",
         dataset_name="espn_local",
     )
+    configure_pipeline(pipeline)
 
     source_instance = espn_source(
         # Test with a specific season filter:
@@ -0,0 +1,212 @@
+"""
+Wide, typed rows for the ESPN box score and pre-game record statistics.
+
+The tidy stat tables hold one text row per statistic. The wide tables hold one row per
+team (or athlete) and game, with a double column per statistic taken from the stat's
+numeric `value`. Their column sets are fixed here, from the statistics in
+docs/discovery/sample_responses, so the table schemas do not drift with the responses:
+a statistic missing from a response is NULL, and one not listed here stays in the tidy
+tables only.
+"""
+
+import re
+from typing import Any
+
+# Box score statistics of competitors/{id}/statistics (all categories), by API name
+TEAM_BOX_SCORE_STATS = (
+    # defensive
+    "blocks",
+    "defensiveRebounds",
+    "steals",
+    "turnoverPoints",
+    "avgDefensiveRebounds",
+    "avgBlocks",
+    "avgSteals",
+    # general
+    "largestLead",
+    "disqualifications",
+    "flagrantFouls",
+    "fouls",
+    "ejections",
+    "technicalFouls",
+    "rebounds",
+    "fantasyRating",
+    "avgRebounds",
+    "avgFouls",
+    "assistTurnoverRatio",
+    "stealFoulRatio",
+    "blockFoulRatio",
+    "totalRebounds",
+    "totalTechnicalFouls",
+    "teamAssistTurnoverRatio",
+    "stealTurnoverRatio",
+    "gamesPlayed",
+    "gamesStarted",
+    "doubleDouble",
+    "tripleDouble",
+    # offensive
+    "assists",
+    "fieldGoals",
+    "fieldGoalsAttempted",
+    "fieldGoalsMade",
+    "fieldGoalPct",
+    "freeThrows",
+    "freeThrowPct",
+    "freeThrowsAttempted",
+    "freeThrowsMade",
+    "offensiveRebounds",
+    "points",
+    "turnovers",
+    "threePointFieldGoalsAttempted",
+    "threePointFieldGoalsMade",
+    "teamTurnovers",
+    "totalTurnovers",
+    "pointsInPaint",
+    "secondChancePoints",
+    "fastBreakPoints",
+    "avgFieldGoalsMade",
+    "avgFieldGoalsAttempted",
+    "avgThreePointFieldGoalsMade",
+    "avgThreePointFieldGoalsAttempted",
+    "avgFreeThrowsMade",
+    "avgFreeThrowsAttempted",
+    "avgPoints",
+    "avgOffensiveRebounds",
+    "avgAssists",
+    "avgTurnovers",
+    "offensiveReboundPct",
+    "estimatedPossessions",
+    "avgEstimatedPossessions",
+    "pointsPerEstimatedPossessions",
+    "avgTeamTurnovers",
+    "avgTotalTurnovers",
+    "threePointFieldGoalPct",
+    "twoPointFieldGoalsMade",
+    "twoPointFieldGoalsAttempted",
+    "avgTwoPointFieldGoalsMade",
+    "avgTwoPointFieldGoalsAttempted",
+    "twoPointFieldGoalPct",
+    "shootingEfficiency",
+    "scoringEfficiency",
+)
+
+# Box score statistics of roster/{id}/statistics/{id}: the team's, less the team-only
+# ones, plus minutes, plus/minus and a few per-game averages
+PLAYER_BOX_SCORE_STATS = (
+    *(
+        name
+        for name in TEAM_BOX_SCORE_STATS
+        if name not in ("pointsInPaint", "teamAssistTurnoverRatio")
+    ),
+    "minutes",
+    "avgMinutes",
+    "plusMinus",
+    "avgFlagrantFouls",
+    "avgTechnicalFouls",
+    "avgEjections",
+    "avgDisqualifications",
+    "avgTeamRebounds",
+)
+
+# Statistics of competitors/{id}/records, per record type
+PREGAME_RECORD_STATS = {
+    "total": (
+        "OTLosses",
+        "OTWins",
+        "avgPointsAgainst",
+        "avgPointsFor",
+        "differential",
+        "divisionWinPercent",
+        "gamesBehind",
+        "gamesPlayed",
+        "leagueWinPercent",
+        "losses",
+        "playoffSeed",
+        "pointDifferential",
+        "points",
+        "pointsAgainst",
+        "pointsFor",
+        "streak",
+        "ties",
+        "winPercent",
+        "wins",
+    ),
+    "home": ("wins", "losses", "ties", "winPercent", "OTLosses"),
+    "road": ("wins", "losses", "ties", "winPercent", "OTLosses"),
+    "vsconf": ("wins", "losses", "ties", "leagueWinPercent", "OTLosses"),
+}
+
+_ACRONYM_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_CAMEL_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+
+def stat_column(name: str) -> str:
+    """Column name of a statistic: its API name in snake case ("OTLosses" -> "ot_losses")."""
+    return _CAMEL_RE.sub(r"\1_\2", _ACRONYM_RE.sub(r"\1_\2", name)).lower()
+
+
+TEAM_BOX_SCORE_COLUMNS = {name: stat_column(name) for name in TEAM_BOX_SCORE_STATS}
+PLAYER_BOX_SCORE_COLUMNS = {name: stat_column(name) for name in PLAYER_BOX_SCORE_STATS}
+PREGAME_RECORD_COLUMNS = {
+    (record_type, name): f"{record_type}_{stat_column(name)}"
+    for record_type, names in PREGAME_RECORD_STATS.items()
+    for name in names
+}
+
+
+def double_columns(columns: dict[Any, str]) -> dict[str, dict[str, Any]]:
+    """dlt column hints declaring every column of a wide table as a nullable double."""
+    return {column: {"data_type": "double", "nullable": True} for column in columns.values()}
+
+
+def stat_categories(stats_data: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    The stat categories of a statistics response. `splits` is an object holding
+    `categories`; list-shaped splits (the first split's `categories`, or its `stats` as a
+    single category) are read too.
+    """
+    splits = stats_data.get("splits")
+    if isinstance(splits, list):
+        splits = splits[0] if splits and isinstance(splits[0], dict) else None
+    if not isinstance(splits, dict):
+        return []
+    categories = splits.get("categories")
+    if isinstance(categories, list):
+        return [category for category in categories if isinstance(category, dict)]
+    if isinstance(splits.get("stats"), list):
+        return [splits]
+    return []
+
+
+def _numeric(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value)
+
+
+def box_score_values(
+    categories: list[dict[str, Any]], columns: dict[str, str]
+) -> dict[str, float | None]:
+    """One wide row's statistic columns, from the `value`s of the categories' stats."""
+    values: dict[str, float | None] = dict.fromkeys(columns.values())
+    for category in categories:
+        for stat in category.get("stats") or ():
+            if isinstance(stat, dict) and stat.get("name") in columns:
+                values[columns[stat["name"]]] = _numeric(stat.get("value"))
+    return values
+
+
+def pregame_record_values(records: list[dict[str, Any]]) -> dict[str, float | None]:
+    """One wide row's record columns, from the `value`s of each record type's stats."""
+    values: dict[str, float | None] = dict.fromkeys(PREGAME_RECORD_COLUMNS.values())
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        record_type = record.get("type", record.get("name"))
+        for stat in record.get("stats") or ():
+            if not isinstance(stat, dict):
+                continue
+            column = PREGAME_RECORD_COLUMNS.get((record_type, stat.get("name")))
+            if column:
+                values[column] = _numeric(stat.get("value"))
+    return values
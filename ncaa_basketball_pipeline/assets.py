@@ -1,44 +1,545 @@
 """Dagster asset definitions for the ESPN dlt pipeline."""
 
+from typing import Any
+
 import dlt
-from dagster import AssetExecutionContext, StaticPartitionsDefinition
-from dagster_dlt import DagsterDltResource, dlt_assets
+from dagster import (
+    AssetExecutionContext,
+    AssetKey,
+    AssetMaterialization,
+    AssetSpec,
+    Config,
+    DailyPartitionsDefinition,
+    MaterializeResult,
+    MetadataValue,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster_dlt import DagsterDltResource, DagsterDltTranslator, dlt_assets
+from dagster_dlt.translator import DltResourceTranslatorData
 
-from dlt_sources.espn_source import espn_source
+from dlt_sources.espn_fetch import FETCH_ENGINE_THREADS
+from dlt_sources.espn_metrics import EspnHttpMetrics
+from dlt_sources.espn_ratelimit import DEFAULT_RATE_LIMIT_RPS
+from dlt_sources.espn_registry import MasterRefStore, season_weeks
+from dlt_sources.espn_source import (
+    SCOPE_LEAGUE,
+    SCOPE_SEASON,
+    configure_pipeline,
+    espn_source,
+)
 
 SEASON_YEARS = [
     str(year) for year in range(2025, 2003 - 1, -1)
 ]  # e.g., 2024 (for 23-24) to 2003 (for 02-03)
 season_partitions = StaticPartitionsDefinition(SEASON_YEARS)
 
+# Upper bound of the weeks each season type (1 pre, 2 regular, 3 postseason) can have.
+# Partitions for weeks a season does not have load nothing.
+MAX_WEEKS_PER_SEASON_TYPE = {"1": 2, "2": 22, "3": 6}
+SEASON_TYPE_WEEKS = [
+    f"{season_type}-{week:02d}"
+    for season_type, max_weeks in MAX_WEEKS_PER_SEASON_TYPE.items()
+    for week in range(1, max_weeks + 1)
+]  # e.g., "2-05" for week 5 of the regular season
+season_week_partitions = MultiPartitionsDefinition(
+    {"season": season_partitions, "week": StaticPartitionsDefinition(SEASON_TYPE_WEEKS)}
+)
+
+# One partition per game day, from the first season in SEASON_YEARS (2002-03) onwards
+daily_partitions = DailyPartitionsDefinition(start_date="2002-11-01", timezone="US/Eastern")
+
+# Key prefixes of the weekly, daily and live assets; their tables are the season assets' tables
+WEEKLY_ASSET_KEY_PREFIX = "weekly"
+DAILY_ASSET_KEY_PREFIX = "daily"
+LIVE_ASSET_KEY_PREFIX = "live"
+
+ESPN_PIPELINE_NAME = "ncaa_basketball_prod_pipeline"
+ESPN_DATASET_NAME = "espn_ncaab_data"
+
 espn_dlt_pipeline_instance = dlt.pipeline(
-    pipeline_name="ncaa_basketball_prod_pipeline",
+    pipeline_name=ESPN_PIPELINE_NAME,
     destination="duckdb",
-    dataset_name="espn_ncaab_data",
+    dataset_name=ESPN_DATASET_NAME,
+)
+
+
+def espn_partition_pipeline(*partition: str) -> dlt.Pipeline:
+    """
+    Pipeline for the runs of one partition, e.g. ("season", "2024").
+
+    dlt writes a pipeline's state back as a whole after each run, and the source keeps its
+    registries (event statuses, checkpoints, live cursors, ...) there. Partitions running
+    in parallel on one pipeline would drop each other's entries, so each gets a pipeline,
+    and with it a state, of its own. They all load into the DuckDB database and dataset of
+    `espn_dlt_pipeline_instance`.
+    """
+    return dlt.pipeline(
+        pipeline_name="__".join([ESPN_PIPELINE_NAME, *partition]),
+        destination=dlt.destinations.duckdb(f"{ESPN_PIPELINE_NAME}.duckdb"),
+        dataset_name=ESPN_DATASET_NAME,
+    )
+
+
+class EspnRunConfig(Config):
+    """
+    Per-run settings for the ESPN dlt pipeline, editable in the Dagster launchpad.
+
+    fetch_engine selects how the deferred detail fetchers run ("threads" or "async");
+    max_concurrency caps in-flight detail requests for the "async" engine.
+    max_parallel_items bounds the deferred items between listers and fetchers, and
+    memory_limit_mb is the memory budget extraction backs off at (sized for 4 GB
+    workers, leaving room for normalize and load).
+    rate_limit_rps is the requests-per-second ceiling of the adaptive rate limiter
+    (None disables it). rate_limit_shared_path holds that budget on disk so that
+    partition runs executing in parallel share it instead of each getting their own.
+    response_cache_path is the on-disk ESPN response cache shared by all runs; set it to
+    None to always hit the API. response_archive_path is the archive every fetched response
+    is appended to (None disables it); with replay, runs read from that archive instead of
+    the API, to rebuild tables after a parsing change without re-crawling.
+    events_full_refresh re-extracts events that an earlier run already saw final instead
+    of skipping them. arrow_stats yields the tidy stat tables as Arrow record batches
+    rather than a dict per stat. skip_unchanged_rows drops rows whose content hash the
+    destination already holds, so re-runs only merge new or changed rows.
+    master_refs_path is the SQLite store of fetched master refs (venues, coaches, ...)
+    shared by all partitions, so one partition skips what another already loaded; None
+    keeps them in each partition's dlt state.
+    resume_partitions (on by default) makes season partitions run chunk by chunk
+    (season-level data, then each week), each committed on its own, so any later run of a
+    crashed partition resumes after the last chunk committed without failed requests.
+    wide_stats also loads the typed wide stat tables (event_team_stats_wide, ...). The
+    definitions always declare them as assets; runs with it off leave them unmaterialized.
+    """
+
+    fetch_engine: str = FETCH_ENGINE_THREADS
+    max_concurrency: int = 500
+    max_parallel_items: int | None = None
+    memory_limit_mb: float | None = 3072
+    rate_limit_rps: float | None = DEFAULT_RATE_LIMIT_RPS
+    rate_limit_shared_path: str | None = ".espn_cache/rate_limit.sqlite"
+    response_cache_path: str | None = ".espn_cache/responses.sqlite"
+    response_archive_path: str | None = ".espn_cache/archive"
+    master_refs_path: str | None = ".espn_cache/master_refs.sqlite"
+    replay: bool = False
+    events_full_refresh: bool = False
+    arrow_stats: bool = True
+    skip_unchanged_rows: bool = True
+    resume_partitions: bool = True
+    wide_stats: bool = True
+
+
+def _master_ref_store(config: EspnRunConfig) -> MasterRefStore | None:
+    """The run config's shared master ref store; commit it after each successful dlt run."""
+    return MasterRefStore(config.master_refs_path) if config.master_refs_path else None
+
+
+def _configure(pipeline: dlt.Pipeline, config: EspnRunConfig) -> dlt.Pipeline:
+    """Applies the run config's dlt settings to `pipeline` only and returns it."""
+    configure_pipeline(
+        pipeline,
+        fetch_engine=config.fetch_engine,
+        max_concurrency=config.max_concurrency,
+        max_parallel_items=config.max_parallel_items,
+        memory_limit_mb=config.memory_limit_mb,
+        arrow_stats=config.arrow_stats,
+    )
+    return pipeline
+
+
+def _http_metrics_metadata(http_metrics: EspnHttpMetrics) -> dict[str, Any]:
+    """
+    Materialization metadata for the requests of one run: totals as plottable numbers,
+    plus the per-endpoint breakdown as a table (slowest first) and as JSON.
+    """
+    totals = http_metrics.totals()
+    endpoints = http_metrics.summary()
+    rows = [
+        "| endpoint | requests | retries | cache hits | MB | p50 ms | p95 ms | p99 ms | total s |",
+        "|---|---|---|---|---|---|---|---|---|",
+    ]
+    for pattern, e in endpoints.items():
+        latency = e["latency_ms"]
+        rows.append(
+            f"| `{pattern}` | {e['requests']} | {e['retries']} | {e['cache_hits']} "
+            f"| {e['bytes'] / 2**20:.1f} | {latency.get('p50', '')} | {latency.get('p95', '')} "
+            f"| {latency.get('p99', '')} | {e['total_seconds']:.1f} |"
+        )
+    return {
+        "http_requests": MetadataValue.int(totals["requests"]),
+        "http_retries": MetadataValue.int(totals["retries"]),
+        "http_cache_hits": MetadataValue.int(totals["cache_hits"]),
+        "http_bytes": MetadataValue.int(totals["bytes"]),
+        "http_p95_ms": MetadataValue.float(float(totals["latency_ms"].get("p95", 0.0))),
+        "http_request_seconds": MetadataValue.float(totals["total_seconds"]),
+        "http_status_codes": MetadataValue.json(totals["status_codes"]),
+        "http_endpoints": MetadataValue.md("\n".join(rows)),
+        "http_endpoints_json": MetadataValue.json(endpoints),
+    }
+
+
+class PrefixedKeyTranslator(DagsterDltTranslator):
+    """Prefixes asset keys so the weekly, daily and live assets do not clash with others."""
+
+    def __init__(self, prefix: str) -> None:
+        super().__init__()
+        self.prefix = prefix
+
+    def get_asset_spec(self, data: DltResourceTranslatorData) -> AssetSpec:
+        spec = super().get_asset_spec(data)
+        return spec.replace_attributes(key=spec.key.with_prefix(self.prefix))
+
+
+class SeasonAssetsTranslator(DagsterDltTranslator):
+    """Makes the seasons asset depend on league_info, whose document starts the walk."""
+
+    def __init__(self, league_info_key: AssetKey) -> None:
+        super().__init__()
+        self.league_info_key = league_info_key
+
+    def get_asset_spec(self, data: DltResourceTranslatorData) -> AssetSpec:
+        spec = super().get_asset_spec(data)
+        if data.resource.name == "seasons":
+            return spec.merge_attributes(deps=[self.league_info_key])
+        return spec
+
+
+def _with_metadata(
+    event: AssetMaterialization | MaterializeResult, metadata: dict[str, Any]
+) -> AssetMaterialization | MaterializeResult:
+    if isinstance(event, AssetMaterialization):
+        return event.with_metadata({**event.metadata, **metadata})
+    return event._replace(metadata={**(event.metadata or {}), **metadata})
+
+
+@dlt_assets(
+    dlt_source=espn_source(scope=SCOPE_LEAGUE),
+    dlt_pipeline=espn_dlt_pipeline_instance,
+    name="espn_api_league_master_assets",
+    group_name="espn_api",
+)
+def espn_league_master_assets(
+    context: AssetExecutionContext,
+    dlt: DagsterDltResource,
+    config: EspnRunConfig,
+):
+    """
+    Dagster assets definition for the league-level master data: league_info, franchises
+    and master awards. None of it depends on the season, so it is unpartitioned and
+    refreshed on its own schedule instead of by every season partition.
+    """
+    context.log.info(
+        f"Starting dlt pipeline run for ESPN league master data, "
+        f"fetch engine: {config.fetch_engine}"
+    )
+
+    http_metrics = EspnHttpMetrics()
+    master_refs = _master_ref_store(config)
+    pipeline = _configure(espn_dlt_pipeline_instance, config)
+    source_instance = espn_source(
+        scope=SCOPE_LEAGUE,
+        fetch_engine=config.fetch_engine,
+        max_concurrency=config.max_concurrency,
+        memory_limit_mb=config.memory_limit_mb,
+        rate_limit_rps=config.rate_limit_rps,
+        rate_limit_shared_path=config.rate_limit_shared_path,
+        response_cache_path=config.response_cache_path,
+        response_archive_path=config.response_archive_path,
+        replay=config.replay,
+        skip_unchanged_rows=config.skip_unchanged_rows,
+        master_ref_store=master_refs,
+        http_metrics=http_metrics,
+    )
+
+    metadata = None
+    for event in dlt.run(context=context, dlt_source=source_instance, dlt_pipeline=pipeline):
+        if metadata is None:
+            metadata = _http_metrics_metadata(http_metrics)
+        yield _with_metadata(event, metadata)
+    if master_refs is not None:
+        master_refs.commit()
+
+    context.log.info("dlt pipeline run for ESPN league master data finished.")
+
+
+LEAGUE_INFO_ASSET_KEY = next(
+    key for key in espn_league_master_assets.keys if key.path[-1].endswith("league_info")
 )
 
 
 @dlt_assets(
-    dlt_source=espn_source(),
+    # With the wide stat tables, so they are assets whether or not a run loads them
+    dlt_source=espn_source(scope=SCOPE_SEASON, wide_stats=True),
     dlt_pipeline=espn_dlt_pipeline_instance,
     name="espn_api_assets",
     group_name="espn_api",
     partitions_def=season_partitions,
+    dagster_dlt_translator=SeasonAssetsTranslator(LEAGUE_INFO_ASSET_KEY),
 )
 def espn_data_load_assets(
     context: AssetExecutionContext,
     dlt: DagsterDltResource,
+    config: EspnRunConfig,
 ):
     """
     Dagster assets definition that uses the DagsterDltResource to run the dlt pipeline,
     partitioned by season. The 'dlt' parameter name matches the key used for
-    DagsterDltResource in the Definitions object.
+    DagsterDltResource in the Definitions object. League-level master data is left to
+    `espn_league_master_assets`, so concurrent partitions do not rewrite it.
+
+    With resume_partitions (the default), the season is extracted as a chain of dlt runs:
+    its season-level data, then one run per week. The next run of a crashed partition skips
+    the chunks already committed and resumes from the first one that was not (or whose
+    requests failed for good); once every chunk is committed, the checkpoints are cleared
+    and the next run starts over.
+
+    Each materialization also carries the run's per-endpoint HTTP metrics (request
+    counts, latency percentiles, bytes, status codes, retries), so request volume and
+    latency can be compared across seasons and over time.
     """
     season_to_process = context.partition_key
-    context.log.info(f"Starting dlt pipeline run for ESPN data, season: {season_to_process}")
+    context.log.info(
+        f"Starting dlt pipeline run for ESPN data, season: {season_to_process}, "
+        f"fetch engine: {config.fetch_engine}"
+    )
+
+    http_metrics = EspnHttpMetrics()
+    master_refs = _master_ref_store(config)
+    pipeline = _configure(espn_partition_pipeline("season", season_to_process), config)
+    source_args = {
+        "fetch_engine": config.fetch_engine,
+        "max_concurrency": config.max_concurrency,
+        "memory_limit_mb": config.memory_limit_mb,
+        "rate_limit_rps": config.rate_limit_rps,
+        "rate_limit_shared_path": config.rate_limit_shared_path,
+        "response_cache_path": config.response_cache_path,
+        "response_archive_path": config.response_archive_path,
+        "replay": config.replay,
+        "events_full_refresh": config.events_full_refresh,
+        "arrow_stats": config.arrow_stats,
+        "skip_unchanged_rows": config.skip_unchanged_rows,
+        "wide_stats": config.wide_stats,
+        "http_metrics": http_metrics,
+        "master_ref_store": master_refs,
+    }
+
+    def season_chunks():
+        if not config.resume_partitions:
+            yield espn_source(
+                season_year_filter=season_to_process, scope=SCOPE_SEASON, **source_args
+            )
+            return
+        yield espn_source(
+            season_year_filter=season_to_process,
+            scope=SCOPE_SEASON,
+            include_events=False,
+            checkpoint_key=season_to_process,
+            **source_args,
+        )
+        # The season-level run (or the earlier one it resumed from) listed the weeks
+        source_state = pipeline.state.get("sources", {}).get("espn_source", {})
+        weeks = season_weeks(source_state, season_to_process)
+        context.log.info(f"Season {season_to_process}: extracting {len(weeks)} weeks one by one.")
+        for season_type, week in weeks:
+            yield espn_source(
+                season_year_filter=season_to_process,
+                season_type_filter=season_type,
+                week_filter=week,
+                checkpoint_key=season_to_process,
+                **source_args,
+            )
 
-    source_instance = espn_source(season_year_filter=season_to_process)
+    # Every chunk is its own dlt run and load package. Each asset is reported once, with
+    # the last run that loaded it, after all runs so that the metrics are complete.
+    events = {}
+    for chunk_source in season_chunks():
+        for event in dlt.run(context=context, dlt_source=chunk_source, dlt_pipeline=pipeline):
+            events[event.asset_key] = event
+        if master_refs is not None:
+            master_refs.commit()
 
-    yield from dlt.run(context=context, dlt_source=source_instance)
+    metadata = _http_metrics_metadata(http_metrics)
+    for event in events.values():
+        yield _with_metadata(event, metadata)
 
     context.log.info(f"dlt pipeline run for ESPN data, season: {season_to_process}, finished.")
+
+
+@dlt_assets(
+    # Any valid week: at definition time the source is only used to list its resources
+    dlt_source=espn_source(
+        season_year_filter="2025",
+        season_type_filter="2",
+        week_filter="1",
+        wide_stats=True,
+    ),
+    dlt_pipeline=espn_dlt_pipeline_instance,
+    name="espn_api_week_event_assets",
+    group_name="espn_api",
+    partitions_def=season_week_partitions,
+    dagster_dlt_translator=PrefixedKeyTranslator(WEEKLY_ASSET_KEY_PREFIX),
+)
+def espn_week_event_assets(
+    context: AssetExecutionContext,
+    dlt: DagsterDltResource,
+    config: EspnRunConfig,
+):
+    """
+    Dagster assets definition for the events of one week, partitioned by season and
+    season type/week.
+
+    A season backfill becomes a few dozen small runs per season that can run in parallel
+    and be retried one by one, instead of a single run that any slow or failing week
+    holds up. They merge into the same tables as the season assets; teams, athletes and
+    other season-level data still come from the season assets.
+    """
+    keys = context.partition_key.keys_by_dimension
+    season, (season_type, week) = keys["season"], keys["week"].split("-")
+    week = str(int(week))
+    context.log.info(
+        f"Starting dlt pipeline run for ESPN events, season: {season}, type: {season_type}, "
+        f"week: {week}, fetch engine: {config.fetch_engine}"
+    )
+
+    http_metrics = EspnHttpMetrics()
+    master_refs = _master_ref_store(config)
+    pipeline = _configure(espn_partition_pipeline("week", season, keys["week"]), config)
+    source_instance = espn_source(
+        season_year_filter=season,
+        season_type_filter=season_type,
+        week_filter=week,
+        fetch_engine=config.fetch_engine,
+        max_concurrency=config.max_concurrency,
+        memory_limit_mb=config.memory_limit_mb,
+        rate_limit_rps=config.rate_limit_rps,
+        rate_limit_shared_path=config.rate_limit_shared_path,
+        response_cache_path=config.response_cache_path,
+        response_archive_path=config.response_archive_path,
+        replay=config.replay,
+        events_full_refresh=config.events_full_refresh,
+        arrow_stats=config.arrow_stats,
+        wide_stats=config.wide_stats,
+        skip_unchanged_rows=config.skip_unchanged_rows,
+        master_ref_store=master_refs,
+        http_metrics=http_metrics,
+    )
+
+    metadata = None
+    for event in dlt.run(context=context, dlt_source=source_instance, dlt_pipeline=pipeline):
+        if metadata is None:
+            metadata = _http_metrics_metadata(http_metrics)
+        yield _with_metadata(event, metadata)
+    if master_refs is not None:
+        master_refs.commit()
+
+    context.log.info(
+        f"dlt pipeline run for ESPN events, season: {season}, type: {season_type}, "
+        f"week: {week}, finished."
+    )
+
+
+@dlt_assets(
+    # Any valid date: at definition time the source is only used to list its resources
+    dlt_source=espn_source(event_dates_filter="20021101", wide_stats=True),
+    dlt_pipeline=espn_dlt_pipeline_instance,
+    name="espn_api_daily_event_assets",
+    group_name="espn_api",
+    partitions_def=daily_partitions,
+    dagster_dlt_translator=PrefixedKeyTranslator(DAILY_ASSET_KEY_PREFIX),
+)
+def espn_daily_event_assets(
+    context: AssetExecutionContext,
+    dlt: DagsterDltResource,
+    config: EspnRunConfig,
+):
+    """
+    Dagster assets definition for the events of one game day, partitioned by date.
+
+    Instead of walking league -> season -> types -> weeks, the day's events are listed
+    straight from the league's /events collection filtered by date, and only they (plus
+    the venues, providers and media they reference) are extracted. They merge into the
+    same tables as the season assets, so a daily refresh only re-extracts that day's
+    games. Teams, athletes and other season-level data still come from the season assets.
+    """
+    # Partition keys are "YYYY-MM-DD"; the /events?dates= filter takes "YYYYMMDD"
+    day_to_process = context.partition_key.replace("-", "")
+    context.log.info(
+        f"Starting dlt pipeline run for ESPN events on {day_to_process}, "
+        f"fetch engine: {config.fetch_engine}"
+    )
+
+    http_metrics = EspnHttpMetrics()
+    master_refs = _master_ref_store(config)
+    pipeline = _configure(espn_partition_pipeline("day", day_to_process), config)
+    source_instance = espn_source(
+        event_dates_filter=day_to_process,
+        fetch_engine=config.fetch_engine,
+        max_concurrency=config.max_concurrency,
+        memory_limit_mb=config.memory_limit_mb,
+        rate_limit_rps=config.rate_limit_rps,
+        rate_limit_shared_path=config.rate_limit_shared_path,
+        response_cache_path=config.response_cache_path,
+        response_archive_path=config.response_archive_path,
+        replay=config.replay,
+        events_full_refresh=config.events_full_refresh,
+        arrow_stats=config.arrow_stats,
+        wide_stats=config.wide_stats,
+        skip_unchanged_rows=config.skip_unchanged_rows,
+        master_ref_store=master_refs,
+        http_metrics=http_metrics,
+    )
+
+    metadata = None
+    for event in dlt.run(context=context, dlt_source=source_instance, dlt_pipeline=pipeline):
+        if metadata is None:
+            metadata = _http_metrics_metadata(http_metrics)
+        yield _with_metadata(event, metadata)
+    if master_refs is not None:
+        master_refs.commit()
+
+    context.log.info(f"dlt pipeline run for ESPN events on {day_to_process} finished.")
+
+
+@dlt_assets(
+    dlt_source=espn_source(live_mode=True),
+    dlt_pipeline=espn_dlt_pipeline_instance,
+    name="espn_api_live_event_assets",
+    group_name="espn_api",
+    dagster_dlt_translator=PrefixedKeyTranslator(LIVE_ASSET_KEY_PREFIX),
+)
+def espn_live_event_assets(
+    context: AssetExecutionContext,
+    dlt: DagsterDltResource,
+    config: EspnRunConfig,
+):
+    """
+    Dagster assets definition for one live poll of yesterday's and today's games.
+
+    Updates event_status and event_situation, and appends the plays and win
+    probabilities of games in progress that are newer than each game's cursor. Meant to
+    be launched by `espn_live_events_sensor` during game nights; the daily assets later
+    replace the appended rows with the settled ones.
+    """
+    http_metrics = EspnHttpMetrics()
+    # Not partitioned, but polls must not share state with the partition runs
+    pipeline = _configure(espn_partition_pipeline("live"), config)
+    source_instance = espn_source(
+        live_mode=True,
+        fetch_engine=config.fetch_engine,
+        max_concurrency=config.max_concurrency,
+        memory_limit_mb=config.memory_limit_mb,
+        rate_limit_rps=config.rate_limit_rps,
+        rate_limit_shared_path=config.rate_limit_shared_path,
+        # Live endpoints change every possession; never serve them from the cache
+        response_cache_path=None,
+        # Nor archive them: the daily runs archive the settled games
+        response_archive_path=None,
+        http_metrics=http_metrics,
+    )
+
+    metadata = None
+    for event in dlt.run(context=context, dlt_source=source_instance, dlt_pipeline=pipeline):
+        if metadata is None:
+            metadata = _http_metrics_metadata(http_metrics)
+        yield _with_metadata(event, metadata)
+
+    context.log.info("dlt pipeline live poll of ESPN events finished.")
@@ -3,16 +3,96 @@ This module defines the main Definitions object for the NCAA Basketball Dagster
 It brings together assets, resources, jobs, schedules, and sensors.
 """
 
-from dagster import Definitions
+from dagster import (
+    DagsterRunStatus,
+    Definitions,
+    RunRequest,
+    RunsFilter,
+    ScheduleDefinition,
+    SensorEvaluationContext,
+    SkipReason,
+    build_schedule_from_partitioned_job,
+    define_asset_job,
+    sensor,
+)
 from dagster_dlt import DagsterDltResource
 
-from .assets import espn_data_load_assets
+from .assets import (
+    daily_partitions,
+    espn_daily_event_assets,
+    espn_data_load_assets,
+    espn_league_master_assets,
+    espn_live_event_assets,
+    espn_week_event_assets,
+)
+
+# How often the live sensor launches a poll of the games in progress
+LIVE_POLL_INTERVAL_SECONDS = 30
+
+_IN_FLIGHT_RUN_STATUSES = [
+    DagsterRunStatus.QUEUED,
+    DagsterRunStatus.NOT_STARTED,
+    DagsterRunStatus.STARTING,
+    DagsterRunStatus.STARTED,
+]
 
 RESOURCES = {
     "dlt": DagsterDltResource(),
 }
 
+espn_league_master_job = define_asset_job(
+    name="espn_league_master_job",
+    selection=[espn_league_master_assets],
+)
+
+# League-level master data barely changes; refresh it weekly, Monday morning
+espn_league_master_schedule = ScheduleDefinition(
+    job=espn_league_master_job, cron_schedule="0 5 * * 1", execution_timezone="US/Eastern"
+)
+
+espn_daily_events_job = define_asset_job(
+    name="espn_daily_events_job",
+    selection=[espn_daily_event_assets],
+    partitions_def=daily_partitions,
+)
+
+# Runs each morning for the game day that just ended, so late West Coast games are final
+espn_daily_events_schedule = build_schedule_from_partitioned_job(
+    espn_daily_events_job, hour_of_day=6
+)
+
+espn_live_events_job = define_asset_job(
+    name="espn_live_events_job",
+    selection=[espn_live_event_assets],
+)
+
+
+@sensor(job=espn_live_events_job, minimum_interval_seconds=LIVE_POLL_INTERVAL_SECONDS)
+def espn_live_events_sensor(context: SensorEvaluationContext):
+    """
+    Launches a live poll every LIVE_POLL_INTERVAL_SECONDS while no earlier poll is still
+    running. Turn it on for game nights; each poll only fetches what changed since the
+    last one.
+    """
+    in_flight = context.instance.get_runs(
+        filters=RunsFilter(job_name=espn_live_events_job.name, statuses=_IN_FLIGHT_RUN_STATUSES),
+        limit=1,
+    )
+    if in_flight:
+        return SkipReason(f"Live poll {in_flight[0].run_id} is still running.")
+    return RunRequest()
+
+
 defs = Definitions(
-    assets=[espn_data_load_assets],
+    assets=[
+        espn_league_master_assets,
+        espn_data_load_assets,
+        espn_week_event_assets,
+        espn_daily_event_assets,
+        espn_live_event_assets,
+    ],
+    jobs=[espn_league_master_job, espn_daily_events_job, espn_live_events_job],
+    schedules=[espn_league_master_schedule, espn_daily_events_schedule],
+    sensors=[espn_live_events_sensor],
     resources=RESOURCES,
 )
@@ -0,0 +1,23 @@
+import pytest
+
+
+class Clock:
+    """Stand-in for a `time` function that returns `now` until a test moves it."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(request, monkeypatch) -> Clock:
+    """
+    A `Clock` patched over `time.time`, or over the `time` function named by the test
+    module's CLOCK (e.g. "monotonic") or an indirect parameter.
+    """
+    function = getattr(request, "param", None) or getattr(request.module, "CLOCK", "time")
+    clock = Clock(1_700_000_000.0)
+    monkeypatch.setattr(f"time.{function}", clock)
+    return clock
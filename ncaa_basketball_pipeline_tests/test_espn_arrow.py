@@ -0,0 +1,41 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from dlt_sources.espn_arrow import TidyRows  # noqa: E402
+
+ROWS = [
+    {"event_id_fk": "401", "name": "points", "value": "71", "display_value": None},
+    {"event_id_fk": "401", "name": "rebounds", "value": "38", "display_value": "38"},
+]
+
+
+def _rows(arrow: bool, rows: list[dict] = ROWS) -> TidyRows:
+    tidy = TidyRows(arrow=arrow)
+    for row in rows:
+        tidy.append(row)
+    return tidy
+
+
+def test_empty_yields_nothing():
+    assert TidyRows().items() == []
+    assert len(TidyRows()) == 0
+
+
+def test_arrow_yields_one_string_record_batch():
+    (batch,) = _rows(arrow=True).items()
+    assert isinstance(batch, pa.RecordBatch)
+    assert batch.schema.names == list(ROWS[0])
+    assert all(field.type == pa.string() for field in batch.schema)
+    assert batch.to_pylist() == ROWS
+
+
+def test_dicts_match_the_appended_rows():
+    assert _rows(arrow=False).items() == ROWS
+    assert len(_rows(arrow=False)) == 2
+
+
+def test_columns_are_those_of_the_first_row():
+    tidy = _rows(arrow=False, rows=[{"a": "1", "b": "2"}, {"b": "3", "c": "4"}])
+    assert tidy.columns == ("a", "b")
+    assert tidy.items() == [{"a": "1", "b": "2"}, {"a": None, "b": "3"}]
@@ -0,0 +1,79 @@
+import pytest
+
+from dlt_sources.espn_cache import HOUR, ResponseCache, cache_key
+
+EVENT = "http://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/events/401"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "cache" / "responses.sqlite")
+
+
+def test_cache_key_drops_scheme_and_trailing_slash():
+    assert cache_key("http://a.espn.com/v2/teams/") == "a.espn.com/v2/teams"
+    assert cache_key("https://a.espn.com/v2/teams") == "a.espn.com/v2/teams"
+
+
+def test_cache_key_sorts_query_parameters():
+    assert cache_key("http://a.espn.com/x?limit=10&lang=en") == cache_key(
+        "https://a.espn.com/x/?lang=en&limit=10"
+    )
+    assert cache_key("http://a.espn.com/x?lang=en&limit=10") == "a.espn.com/x?lang=en&limit=10"
+
+
+def test_ttl_rules_first_match_wins(cache):
+    assert cache.ttl_for(cache_key(f"{EVENT}/competitions/401/plays")) == 30
+    assert cache.ttl_for(cache_key(EVENT)) == HOUR
+    assert cache.ttl_for(cache_key("http://a.espn.com/v2/venues/1")) == 7 * 24 * HOUR
+
+
+def test_extra_ttl_rules_are_checked_first(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite", ttl_rules={r"/events/\d+": None})
+    assert cache.ttl_for(cache_key(f"{EVENT}/competitions/401/plays")) is None
+
+
+def test_entry_expires_after_its_ttl(cache, clock):
+    url = f"{EVENT}/competitions/401/status"
+    cache.put(url, b"{}")
+    clock.now += 29
+    assert cache.get(url) == b"{}"
+    clock.now += 2
+    assert cache.get(url) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_of_final_scope_never_expire(cache, clock):
+    url = f"{EVENT}/competitions/401/plays?page=2"
+    cache.mark_final(EVENT)
+    cache.put(url, b"[]")
+    clock.now += 365 * 24 * HOUR
+    assert cache.get(url) == b"[]"
+
+
+def test_entries_fetched_before_scope_became_final_still_expire(cache, clock):
+    url = f"{EVENT}/competitions/401/plays"
+    cache.put(url, b"[]")
+    clock.now += 10
+    cache.mark_final(EVENT)
+    clock.now += HOUR
+    assert cache.get(url) is None
+
+
+def test_final_scopes_persist(tmp_path, clock):
+    path = tmp_path / "responses.sqlite"
+    url = f"{EVENT}/competitions/401/odds"
+    ResponseCache(path).mark_final(url)
+    ResponseCache(path).put(url, b"{}")
+    clock.now += 365 * 24 * HOUR
+    assert ResponseCache(path).get(url) == b"{}"
+
+
+def test_mark_final_keeps_earliest_final_since(cache, clock):
+    cache.mark_final(EVENT, final_since=clock.now - 100)
+    cache.mark_final(EVENT)
+    url = f"{EVENT}/competitions/401/plays"
+    clock.now -= 50
+    cache.put(url, b"[]")
+    clock.now += 2 * HOUR
+    assert cache.get(url) == b"[]"
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("dlt")
+pytest.importorskip("pyarrow")
+
+from dlt_sources.espn_fetch import EspnFetcher
+
+URL = "http://sports.core.api.espn.com/v2/venues/1"
+
+
+class _Response:
+    def __init__(self, data: object) -> None:
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> object:
+        return self._data
+
+
+class _BlockingClient:
+    """Detail client whose GETs block until released, counting the calls per URL."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: dict[str, int] = {}
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> _Response:
+        with self._lock:
+            self.calls[url] = self.calls.get(url, 0) + 1
+        self.started.set()
+        self.release.wait(5)
+        if self.fail:
+            self.fail = False
+            raise ConnectionError(url)
+        return _Response({"url": url})
+
+
+def _get_shared(fetcher: EspnFetcher, url: str) -> tuple[object, bool]:
+    return asyncio.run(fetcher.get_json_shared(url))
+
+
+def test_concurrent_requests_share_one_fetch():
+    client = _BlockingClient()
+    fetcher = EspnFetcher(client, transport=None)
+    with ThreadPoolExecutor(4) as pool:
+        first = pool.submit(_get_shared, fetcher, URL)
+        client.started.wait(5)
+        # The scheme and trailing slash are normalized away, so these coalesce too
+        others = [pool.submit(_get_shared, fetcher, u) for u in (URL, URL + "/", URL)]
+        deadline = time.monotonic() + 5
+        while fetcher.shared_hits < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        client.release.set()
+        assert fetcher.shared_hits == 3
+        results = [first.result(), *(f.result() for f in others)]
+
+    assert client.calls == {URL: 1}
+    assert [is_first for _, is_first in results] == [True, False, False, False]
+    assert all(data is results[0][0] for data, _ in results)
+
+
+def test_repeat_requests_are_answered_from_memory():
+    client = _BlockingClient()
+    client.release.set()
+    fetcher = EspnFetcher(client, transport=None)
+    assert _get_shared(fetcher, URL) == ({"url": URL}, True)
+    assert _get_shared(fetcher, URL.replace("http://", "https://")) == ({"url": URL}, False)
+    assert client.calls == {URL: 1}
+    assert fetcher.shared_hits == 1
+
+
+def test_failed_fetch_is_retried_by_next_caller():
+    client = _BlockingClient(fail=True)
+    client.release.set()
+    fetcher = EspnFetcher(client, transport=None)
+    with pytest.raises(ConnectionError):
+        _get_shared(fetcher, URL)
+    assert _get_shared(fetcher, URL) == ({"url": URL}, True)
+    assert client.calls == {URL: 2}
@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+
+from dlt_sources.espn_logging import SampledLogFilter, install_sampled_logging, payload
+
+CLOCK = "monotonic"
+
+
+def _record(
+    msg: str = "Bad item %s", args: tuple = ("x",), level: int = logging.WARNING, line: int = 1
+) -> logging.LogRecord:
+    return logging.LogRecord("espn", level, "espn_source.py", line, msg, args, None)
+
+
+def test_passes_burst_then_one_in_sample_every(clock):
+    sampled = SampledLogFilter(burst=3, sample_every=5)
+    passed = [sampled.filter(_record()) for _ in range(13)]
+    assert passed == [True] * 3 + [False] * 4 + [True] + [False] * 4 + [True]
+
+
+def test_categories_are_sampled_separately(clock):
+    sampled = SampledLogFilter(burst=1, sample_every=100)
+    assert sampled.filter(_record(line=1))
+    assert not sampled.filter(_record(line=1))
+    assert sampled.filter(_record(line=2))
+    record = _record(line=1)
+    record.log_category = "events"
+    assert sampled.filter(record)
+
+
+def test_new_window_passes_burst_again_and_counts_drops(clock):
+    sampled = SampledLogFilter(burst=1, window_seconds=60, sample_every=100)
+    sampled.filter(_record())
+    for _ in range(3):
+        sampled.filter(_record())
+    clock.now += 60
+    record = _record()
+    assert sampled.filter(record)
+    assert record.getMessage() == "Bad item x [3 similar messages suppressed]"
+
+
+def test_suppressed_count_keeps_percent_in_messages_without_args(clock):
+    sampled = SampledLogFilter(burst=1, window_seconds=60)
+    sampled.filter(_record("100% bad", ()))
+    sampled.filter(_record("100% bad", ()))
+    clock.now += 60
+    record = _record("100% bad", ())
+    sampled.filter(record)
+    assert record.getMessage() == "100% bad [1 similar messages suppressed]"
+
+
+@pytest.mark.parametrize("level", [logging.ERROR, logging.CRITICAL])
+def test_errors_always_pass(clock, level):
+    sampled = SampledLogFilter(burst=0, sample_every=1000)
+    assert all(sampled.filter(_record(level=level)) for _ in range(50))
+
+
+def test_install_adds_one_filter_per_logger():
+    logger = logging.getLogger("espn_logging_test")
+    first = install_sampled_logging(logger)
+    assert install_sampled_logging(logger) is first
+    assert logger.filters.count(first) == 1
+    logger.removeFilter(first)
+
+
+def test_payload_is_truncated_when_rendered():
+    rendered = str(payload({"items": ["x" * 100] * 20}, max_chars=50))
+    assert rendered.endswith("... (dict)")
+    assert len(rendered) == 50 + len("... (dict)")
@@ -0,0 +1,78 @@
+import pytest
+
+from dlt_sources.espn_ratelimit import AdaptiveRateLimiter, SharedRateLimiter
+
+
+def test_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(max_rps=0)
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(max_rps=10, min_rps=20)
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(decrease_factor=1.0)
+
+
+def test_burst_goes_out_without_waiting_then_callers_queue(clock):
+    limiter = AdaptiveRateLimiter(max_rps=10, burst=3)
+    assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter._reserve() == pytest.approx(0.1)
+    assert limiter._reserve() == pytest.approx(0.2)
+    clock.now += 1.0
+    assert limiter._reserve() == 0.0
+    assert limiter.requests == 6
+
+
+def test_throttle_cuts_rate_once_per_cooldown(clock):
+    limiter = AdaptiveRateLimiter(max_rps=100, decrease_factor=0.5, cooldown_seconds=1.0)
+    limiter.on_throttle("HTTP 429")
+    limiter.on_throttle("HTTP 429")
+    assert limiter.rate == 50
+    clock.now += 1.0
+    limiter.on_throttle("HTTP 503")
+    assert limiter.rate == 25
+    assert limiter.throttles == 3
+
+
+def test_rate_is_never_cut_below_min(clock):
+    limiter = AdaptiveRateLimiter(max_rps=4, min_rps=3, cooldown_seconds=0.0)
+    limiter.on_throttle("timeout")
+    limiter.on_throttle("timeout")
+    assert limiter.rate == 3
+
+
+def test_success_raises_rate_per_second_up_to_max(clock):
+    limiter = AdaptiveRateLimiter(max_rps=10, increase_rps=2, cooldown_seconds=1.0)
+    limiter.on_throttle("HTTP 429")
+    assert limiter.rate == 5
+    clock.now += 0.5
+    limiter.on_success()
+    assert limiter.rate == 5
+    clock.now += 1.5
+    limiter.on_success()
+    assert limiter.rate == 9
+    clock.now += 10
+    limiter.on_success()
+    assert limiter.rate == 10
+
+
+def test_no_increase_within_cooldown_of_a_cut(clock):
+    limiter = AdaptiveRateLimiter(max_rps=10, cooldown_seconds=5.0)
+    limiter.on_throttle("HTTP 429")
+    clock.now += 2
+    limiter.on_success()
+    assert limiter.rate == 5
+
+
+def test_shared_limiter_shares_rate_across_instances(tmp_path, clock):
+    path = tmp_path / "rate_limit.sqlite"
+    first = SharedRateLimiter(path, max_rps=100)
+    second = SharedRateLimiter(path, max_rps=100)
+    first.on_throttle("HTTP 429")
+    second._reserve()
+    assert second.rate == 50
+
+
+def test_shared_limiter_applies_lower_ceiling(tmp_path, clock):
+    path = tmp_path / "rate_limit.sqlite"
+    SharedRateLimiter(path, max_rps=100)
+    assert SharedRateLimiter(path, max_rps=20).rate == 20
@@ -0,0 +1,190 @@
+import pytest
+
+dlt = pytest.importorskip("dlt")
+
+from dlt_sources.espn_cache import DAY  # noqa: E402
+from dlt_sources.espn_registry import (  # noqa: E402
+    EVENTS_STATE_KEY,
+    FINAL_EVENT_RETENTION_DAYS,
+    LIVE_EVENT_RETENTION_DAYS,
+    LIVE_STATE_KEY,
+    SEASON_CHUNK,
+    EventStatusRegistry,
+    ExtractionCheckpoints,
+    LiveEventCursors,
+    MasterRefRegistry,
+    MasterRefStore,
+    cursor_start_page,
+    week_chunk,
+)
+
+VENUE = (
+    "http://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/venues/1"
+)
+
+
+@pytest.fixture
+def state(monkeypatch):
+    """Plain dict standing in for dlt source state."""
+    state = {}
+    monkeypatch.setattr(dlt.current, "source_state", lambda: state)
+    return state
+
+
+def test_event_is_skipped_once_final_and_unchanged(state, clock):
+    events = EventStatusRegistry()
+    assert not events.observe("401", "m1")
+    events.mark_final("401")
+    assert events.observe("401", "m1")
+    assert events.skipped == 1
+    assert state[EVENTS_STATE_KEY]["401"] == ["m1", clock.now]
+
+
+def test_final_is_ignored_before_the_game_settles(state, clock):
+    events = EventStatusRegistry()
+    events.observe("401", "m1")
+    events.mark_final("401", settled_at=clock.now + 1)
+    assert not events.observe("401", "m1")
+    events.mark_final("401", settled_at=clock.now)
+    assert events.observe("401", "m1")
+
+
+def test_changed_event_has_to_be_confirmed_final_again(state, clock):
+    events = EventStatusRegistry()
+    events.observe("401", "m1")
+    events.mark_final("401")
+    assert not events.observe("401", "m2")
+    assert not events.observe("401", "m2")
+
+
+def test_full_refresh_never_skips(state, clock):
+    events = EventStatusRegistry(full_refresh=True)
+    events.observe("401", "m1")
+    events.mark_final("401")
+    assert not events.observe("401", "m1")
+
+
+def test_events_final_past_the_retention_are_pruned(state, clock):
+    cutoff = clock.now - FINAL_EVENT_RETENTION_DAYS * DAY
+    state[EVENTS_STATE_KEY] = {
+        "old": ["m", cutoff - 1],
+        "recent": ["m", cutoff + 1],
+        "open": ["m", None],
+    }
+    events = EventStatusRegistry()
+    assert events.observe("recent", "m")
+    assert set(state[EVENTS_STATE_KEY]) == {"recent", "open"}
+    # A pruned event is extracted again and registered anew
+    assert not events.observe("old", "m")
+
+
+def test_live_event_completed_at_first_poll_is_not_tailed(state, clock):
+    cursors = LiveEventCursors()
+    cursors.observe("401", completed=True)
+    assert cursors.is_final("401")
+    assert not cursors.tails("401")
+
+
+def test_live_event_completing_while_polled_keeps_its_tail(state, clock):
+    cursors = LiveEventCursors()
+    cursors.observe("401", completed=False)
+    assert cursors.tails("401")
+    assert not cursors.is_final("401")
+    cursors.observe("401", completed=True)
+    assert cursors.tails("401")
+    assert cursors.is_final("401")
+
+
+def test_live_cursor_advances(state, clock):
+    cursors = LiveEventCursors()
+    assert cursors.cursor("401", "plays") == (0, -1)
+    cursors.advance("401", "plays", 150, 4321)
+    assert cursors.cursor("401", "plays") == (150, 4321)
+    assert cursors.cursor("401", "probabilities") == (0, -1)
+
+
+def test_live_events_not_polled_past_the_retention_are_pruned(state, clock):
+    cutoff = clock.now - LIVE_EVENT_RETENTION_DAYS * DAY
+    state[LIVE_STATE_KEY] = {
+        "old": {"polled_at": cutoff - 1, "final": True, "plays": [10, 9]},
+        "recent": {"polled_at": cutoff + 1, "final": True, "plays": [10, 9]},
+    }
+    cursors = LiveEventCursors()
+    assert cursors.is_final("recent")
+    assert not cursors.is_final("old")
+    assert set(state[LIVE_STATE_KEY]) == {"recent"}
+
+
+@pytest.mark.parametrize(("seen", "page"), [(0, 1), (1, 1), (100, 1), (101, 2), (200, 2), (201, 3)])
+def test_cursor_start_page_rereads_the_page_of_the_last_seen_item(seen, page):
+    assert cursor_start_page(seen, 100) == page
+
+
+def _season_with_weeks(weeks: list[str]) -> ExtractionCheckpoints:
+    checkpoints = ExtractionCheckpoints("2024")
+    checkpoints.mark_done("2024", SEASON_CHUNK)
+    for week in weeks:
+        checkpoints.record_week("2024", "2", week)
+    return checkpoints
+
+
+def test_checkpoints_without_key_are_disabled(state):
+    checkpoints = ExtractionCheckpoints(None)
+    checkpoints.mark_done("2024", SEASON_CHUNK)
+    assert not checkpoints.is_done("2024", SEASON_CHUNK)
+    assert state == {}
+
+
+def test_done_chunks_only_count_for_the_same_key(state):
+    _season_with_weeks(["1", "2"]).mark_done("2024", week_chunk("2", "1"))
+    assert ExtractionCheckpoints("2024").is_done("2024", week_chunk("2", "1"))
+    assert not ExtractionCheckpoints("2024").is_done("2024", week_chunk("2", "2"))
+    assert not ExtractionCheckpoints("other").is_done("2024", week_chunk("2", "1"))
+
+
+def test_season_is_cleared_once_its_last_week_is_done(state):
+    checkpoints = _season_with_weeks(["1", "2"])
+    checkpoints.mark_done("2024", week_chunk("2", "1"))
+    assert "2024" in state["checkpoints"]
+    checkpoints.mark_done("2024", week_chunk("2", "2"))
+    assert "2024" not in state["checkpoints"]
+    assert not ExtractionCheckpoints("2024").is_done("2024", SEASON_CHUNK)
+
+
+def test_failed_chunk_is_not_marked_done(state):
+    checkpoints = _season_with_weeks(["1", "2"])
+    checkpoints.mark_done("2024", week_chunk("2", "1"))
+    checkpoints.mark_failed("2024", week_chunk("2", "1"))
+    checkpoints.mark_done("2024", week_chunk("2", "1"))
+    assert not checkpoints.is_done("2024", week_chunk("2", "1"))
+    assert checkpoints.is_done("2024", SEASON_CHUNK)
+
+
+def test_failing_the_last_chunk_restores_the_cleared_season(state):
+    checkpoints = _season_with_weeks(["1"])
+    checkpoints.mark_done("2024", week_chunk("2", "1"))
+    assert "2024" not in state["checkpoints"]
+    checkpoints.mark_failed("2024", week_chunk("2", "1"))
+    assert state["checkpoints"]["2024"] == {"key": "2024", "done": [SEASON_CHUNK]}
+
+
+def test_master_refs_skip_fresh_and_unchanged_refs(state, clock):
+    master_refs = MasterRefRegistry(max_age_seconds=3600)
+    assert not master_refs.is_fresh(VENUE)
+    assert master_refs.record(VENUE, {"id": "1"})
+    assert master_refs.is_fresh(VENUE)
+    clock.now += 3600
+    assert not master_refs.is_fresh(VENUE)
+    assert not master_refs.record(VENUE, {"id": "1"})
+    assert master_refs.record(VENUE, {"id": "1", "capacity": 9000})
+
+
+def test_master_ref_store_shares_only_committed_refs(tmp_path, clock):
+    path = tmp_path / "master_refs.sqlite"
+    store = MasterRefStore(path)
+    MasterRefRegistry(max_age_seconds=3600, store=store).record(VENUE, {"id": "1"})
+    other = MasterRefRegistry(max_age_seconds=3600, store=MasterRefStore(path))
+    assert not other.is_fresh(VENUE)
+    assert store.commit() == 1
+    assert other.is_fresh(VENUE)
+    assert not other.record(VENUE, {"id": "1"})
@@ -0,0 +1,112 @@
+from array import array
+
+import pytest
+
+pytest.importorskip("dlt")
+pa = pytest.importorskip("pyarrow")
+
+from dlt_sources.espn_rowhash import (  # noqa: E402
+    ROW_HASH_COLUMN,
+    RowHashFilter,
+    _StoredHashes,
+    batch_row_hashes,
+    event_dates_condition,
+    row_hash,
+)
+from dlt_sources.espn_source import ROW_HASH_EXEMPT_TABLES, espn_source  # noqa: E402
+
+ROW = {"event_id_fk": "401", "stat_name": "points", "stat_value": "71"}
+
+
+def test_row_hash_ignores_key_order():
+    assert row_hash(ROW) == row_hash(dict(reversed(ROW.items())))
+
+
+def test_row_hash_ignores_none_and_dlt_columns():
+    assert row_hash(ROW) == row_hash(
+        {**ROW, "display_value": None, "_dlt_id": "x", "_dlt_load_id": "1", ROW_HASH_COLUMN: 5}
+    )
+
+
+def test_row_hash_changes_with_content():
+    assert row_hash(ROW) != row_hash({**ROW, "stat_value": "72"})
+
+
+def test_row_hash_is_signed_64_bit():
+    hashes = [row_hash({"n": n}) for n in range(200)]
+    assert all(-(2**63) <= h < 2**63 for h in hashes)
+    assert any(h < 0 for h in hashes)
+
+
+def test_batch_row_hashes_ignore_column_order_nulls_and_dlt_columns():
+    (expected,) = batch_row_hashes(pa.RecordBatch.from_pylist([ROW]))
+    reordered = dict(reversed(ROW.items()))
+    with_extras = {**reordered, "display_value": None, "_dlt_id": "x", ROW_HASH_COLUMN: 5}
+    assert batch_row_hashes(pa.RecordBatch.from_pylist([reordered, with_extras])) == [
+        expected,
+        expected,
+    ]
+
+
+def test_batch_row_hashes_change_with_content():
+    changed = {**ROW, "stat_value": "72"}
+    first, second = batch_row_hashes(pa.RecordBatch.from_pylist([ROW, changed]))
+    assert first != second
+
+
+def test_batch_row_hashes_fall_back_to_rows_for_nested_columns():
+    row = {**ROW, "splits": [1, 2]}
+    assert batch_row_hashes(pa.RecordBatch.from_pylist([row])) == [row_hash(row)]
+
+
+def test_stored_hashes_contains():
+    stored = _StoredHashes(array("q", [-7, 3, 3, 12]))
+    assert len(stored) == 4
+    assert -7 in stored
+    assert 12 in stored
+    assert 0 not in stored
+    assert 13 not in stored
+    assert 1 not in _StoredHashes(array("q"))
+
+
+def _filter_with_stored(*hashes: int) -> RowHashFilter:
+    row_hashes = RowHashFilter()
+    row_hashes._stored["event_team_stats"] = _StoredHashes(array("q", sorted(hashes)))
+    return row_hashes
+
+
+def test_filter_drops_stored_dict_rows_and_hashes_new_ones():
+    step = _filter_with_stored(row_hash(ROW))._step("event_team_stats")
+    assert list(step(dict(ROW))) == []
+    changed = {**ROW, "stat_value": "72"}
+    (kept,) = step(dict(changed))
+    assert kept == {**changed, ROW_HASH_COLUMN: row_hash(changed)}
+
+
+def test_filter_keeps_only_new_rows_of_a_record_batch():
+    changed = {**ROW, "stat_value": "72"}
+    stored, changed_hash = batch_row_hashes(pa.RecordBatch.from_pylist([ROW, changed]))
+    step = _filter_with_stored(stored)._step("event_team_stats")
+    (batch,) = step(pa.RecordBatch.from_pylist([ROW, changed]))
+    assert batch.to_pylist() == [{**changed, ROW_HASH_COLUMN: changed_hash}]
+    assert list(step(pa.RecordBatch.from_pylist([ROW]))) == []
+
+
+def test_event_dates_condition_widens_the_last_day():
+    condition, params = event_dates_condition("20240301-20240331")
+    assert condition == "substr(date, 1, 10) BETWEEN %s AND %s"
+    assert params == ("2024-03-01", "2024-04-01")
+    assert event_dates_condition("20241231")[1] == ("2024-12-31", "2025-01-01")
+
+
+def test_exempt_tables_cover_every_merge_table_feeding_transformers(monkeypatch):
+    monkeypatch.setenv("SOURCES__ESPN_SOURCE__LEAGUE_BASE_URL", "http://espn.test")
+    resources = espn_source().resources.values()
+    parents = set()
+    for resource in resources:
+        pipe = resource._pipe.parent
+        while pipe is not None:
+            parents.add(pipe.name)
+            pipe = pipe.parent
+    merge_parents = {r.name for r in resources if r.write_disposition == "merge"} & parents
+    assert merge_parents <= set(ROW_HASH_EXEMPT_TABLES)